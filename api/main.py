@@ -48,6 +48,8 @@ from pricer.engines.tree_pricer import (
     ExerciseStyle,
     OptionType,
 )
+from pricer.engines._jit_kernels import warmup as warmup_engine_kernels
+from pricer.pricers.event_kernel import warmup as warmup_payoff_kernel
 
 
 app = FastAPI(
@@ -72,6 +74,13 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+def warmup_jit_kernels() -> None:
+    """Compile (or load cached) Numba kernels before the first request."""
+    warmup_engine_kernels()
+    warmup_payoff_kernel()
+
+
 # ==============================================================================
 # Request/Response Models
 # ==============================================================================
@@ -225,11 +234,10 @@ async def price_product(request: PriceRequest):
         pricer = AutocallPricer(config)
         result = pricer.price(ts)
         
-        # Generate cashflow report
-        report = generate_cashflow_report(ts, config)
-        
-        # Compute PV decomposition
-        decomp = compute_pv_decomposition(ts, config)
+        # Cashflow report and PV decomposition share one simulation
+        grid, paths = pricer.simulate(ts)
+        report = generate_cashflow_report(ts, config, paths=paths, grid=grid)
+        decomp = compute_pv_decomposition(ts, config, paths=paths, grid=grid)
         
         # Build response
         notional = ts.meta.notional
@@ -321,11 +329,10 @@ async def analyze_risk(request: RiskRequest):
         pricer = AutocallPricer(pricing_config)
         pricing_result = pricer.price(ts)
         
-        # Generate cashflow report
-        report = generate_cashflow_report(ts, pricing_config)
-        
-        # Compute PV decomposition
-        decomp = compute_pv_decomposition(ts, pricing_config)
+        # Cashflow report and PV decomposition share one simulation
+        grid, paths = pricer.simulate(ts)
+        report = generate_cashflow_report(ts, pricing_config, paths=paths, grid=grid)
+        decomp = compute_pv_decomposition(ts, pricing_config, paths=paths, grid=grid)
         
         # Build response
         notional = ts.meta.notional
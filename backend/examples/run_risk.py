@@ -155,12 +155,14 @@ def main() -> int:
         
         # 5. PV Decomposition
         print(f"\n[5/5] Computing PV decomposition...")
-        decomp = compute_pv_decomposition(ts, config)
+        # Decomposition and cashflow table share one simulation
+        grid, paths = pricer.simulate(ts)
+        decomp = compute_pv_decomposition(ts, config, paths=paths, grid=grid)
         decomp.print_summary(ts.meta.currency)
         
         # Cashflow table
         print(f"\nGenerating cashflow table...")
-        report = generate_cashflow_report(ts, config)
+        report = generate_cashflow_report(ts, config, paths=paths, grid=grid)
         report.print_cashflow_table()
         
         print(f"\n{'='*70}")
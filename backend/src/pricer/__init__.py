@@ -19,85 +19,84 @@ Example:
 
 __version__ = "0.1.0"
 
-# Core product schemas
-from pricer.products.schema import (
-    TermSheet,
-    Meta,
-    Underlying,
-    DividendModel,
-    VolModel,
-    DiscountCurve,
-    Correlation,
-    Schedules,
-    Payoff,
-    KnockInBarrier,
-    Conventions,
-    load_term_sheet,
-    validate_term_sheet_json,
-    print_term_sheet_summary,
-    # Enums
-    DayCountConvention,
-    BusinessDayRule,
-    Calendar,
-    DividendModelType,
-    VolModelType,
-    BarrierMonitoringType,
-    SettlementType,
-)
+import importlib
+from typing import Any, Dict, List
 
-# Pricing
-from pricer.pricers.autocall_pricer import (
-    AutocallPricer,
-    PricingConfig,
-)
-from pricer.engines.base import PricingResult
+# Public name -> defining module. Submodules (and NumPy/SciPy/pydantic behind
+# them) are imported on first attribute access (PEP 562), so `import pricer`
+# stays cheap for CLI entry points that only need part of the library.
+_LAZY_IMPORTS: Dict[str, str] = {
+    # Core product schemas
+    "TermSheet": "pricer.products.schema",
+    "Meta": "pricer.products.schema",
+    "Underlying": "pricer.products.schema",
+    "DividendModel": "pricer.products.schema",
+    "VolModel": "pricer.products.schema",
+    "DiscountCurve": "pricer.products.schema",
+    "Correlation": "pricer.products.schema",
+    "Schedules": "pricer.products.schema",
+    "Payoff": "pricer.products.schema",
+    "KnockInBarrier": "pricer.products.schema",
+    "Conventions": "pricer.products.schema",
+    "load_term_sheet": "pricer.products.schema",
+    "validate_term_sheet_json": "pricer.products.schema",
+    "print_term_sheet_summary": "pricer.products.schema",
+    "DayCountConvention": "pricer.products.schema",
+    "BusinessDayRule": "pricer.products.schema",
+    "Calendar": "pricer.products.schema",
+    "DividendModelType": "pricer.products.schema",
+    "VolModelType": "pricer.products.schema",
+    "BarrierMonitoringType": "pricer.products.schema",
+    "SettlementType": "pricer.products.schema",
+    # Pricing
+    "AutocallPricer": "pricer.pricers.autocall_pricer",
+    "PricingConfig": "pricer.pricers.autocall_pricer",
+    "PricingResult": "pricer.engines.base",
+    # Risk analysis
+    "compute_greeks": "pricer.risk.greeks",
+    "BumpingConfig": "pricer.risk.greeks",
+    "GreeksResult": "pricer.risk.greeks",
+    # Reporting
+    "generate_cashflow_report": "pricer.reporting",
+    "compute_pv_decomposition": "pricer.reporting",
+    "CashflowReport": "pricer.reporting",
+    "CashflowEntry": "pricer.reporting",
+    "PVDecomposition": "pricer.reporting",
+    # Engines (for advanced usage)
+    "bs_call_price": "pricer.engines.black_scholes",
+    "bs_put_price": "pricer.engines.black_scholes",
+    "bs_greeks": "pricer.engines.black_scholes",
+    "price_vanilla": "pricer.engines.black_scholes",
+    "implied_vol": "pricer.engines.black_scholes",
+    "Greeks": "pricer.engines.black_scholes",
+    "VanillaResult": "pricer.engines.black_scholes",
+    "BinomialTree": "pricer.engines.tree_pricer",
+    "TrinomialTree": "pricer.engines.tree_pricer",
+    "price_american": "pricer.engines.tree_pricer",
+    "price_european_tree": "pricer.engines.tree_pricer",
+    "TreeResult": "pricer.engines.tree_pricer",
+    "ExerciseStyle": "pricer.engines.tree_pricer",
+    "OptionType": "pricer.engines.tree_pricer",
+    # Market data (needs the optional market dependencies on first access)
+    "fetch_market_data_snapshot": "pricer.market",
+    "MarketDataSnapshot": "pricer.market",
+}
 
-# Risk analysis
-from pricer.risk.greeks import (
-    compute_greeks,
-    BumpingConfig,
-    GreeksResult,
-)
 
-# Reporting
-from pricer.reporting import (
-    generate_cashflow_report,
-    compute_pv_decomposition,
-    CashflowReport,
-    CashflowEntry,
-    PVDecomposition,
-)
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so __getattr__ runs once per name
+    return value
 
-# Engines (for advanced usage)
-from pricer.engines.black_scholes import (
-    bs_call_price,
-    bs_put_price,
-    bs_greeks,
-    price_vanilla,
-    implied_vol,
-    Greeks,
-    VanillaResult,
-)
 
-from pricer.engines.tree_pricer import (
-    BinomialTree,
-    TrinomialTree,
-    price_american,
-    price_european_tree,
-    TreeResult,
-    ExerciseStyle,
-    OptionType,
-)
+def __dir__() -> List[str]:
+    """List module attributes, including not-yet-imported public names."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Market data (optional)
-try:
-    from pricer.market import (
-        fetch_market_data_snapshot,
-        MarketDataSnapshot,
-    )
-    _HAS_MARKET_DATA = True
-except ImportError:
-    _HAS_MARKET_DATA = False
 
 __all__ = [
     # Version
@@ -154,11 +153,7 @@ __all__ = [
     "TreeResult",
     "ExerciseStyle",
     "OptionType",
+    # Market data
+    "fetch_market_data_snapshot",
+    "MarketDataSnapshot",
 ]
-
-# Add market data to __all__ if available
-if _HAS_MARKET_DATA:
-    __all__.extend([
-        "fetch_market_data_snapshot",
-        "MarketDataSnapshot",
-    ])
@@ -6,8 +6,24 @@ Supports Following and Modified Following business day conventions.
 
 from datetime import date, timedelta
 from enum import Enum
-from typing import Set, Optional
-from functools import lru_cache
+from typing import Callable, Dict, Sequence, Set, Optional, Union
+
+import numpy as np
+
+from pricer.core.day_count import _EPOCH_ORD
+
+
+def _to_datetime64(dates: Union[Sequence[date], np.ndarray]) -> np.ndarray:
+    """
+    Convert dates to a datetime64[D] array.
+    
+    Goes through integer ordinals: NumPy's own conversion of a list of
+    date objects is several times slower than toordinal() per element.
+    """
+    if isinstance(dates, np.ndarray):
+        return dates.astype("datetime64[D]", copy=False)
+    ords = np.fromiter((d.toordinal() for d in dates), dtype=np.int64, count=len(dates))
+    return (ords - _EPOCH_ORD).astype("datetime64[D]")
 
 
 class BusinessDayConvention(str, Enum):
@@ -19,6 +35,14 @@ class BusinessDayConvention(str, Enum):
     PRECEDING = "PRECEDING"
 
 
+# Convention -> numpy.busday_offset roll mode for batched adjustment
+_BUSDAY_ROLL: Dict[BusinessDayConvention, str] = {
+    BusinessDayConvention.FOLLOWING: "following",
+    BusinessDayConvention.PRECEDING: "preceding",
+    BusinessDayConvention.MODIFIED_FOLLOWING: "modifiedfollowing",
+}
+
+
 class Calendar:
     """
     Business day calendar with holiday support.
@@ -29,7 +53,9 @@ class Calendar:
     def __init__(
         self,
         name: str = "WE",  # Weekend-only calendar
-        holidays: Optional[Set[date]] = None
+        holidays: Optional[Set[date]] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
     ) -> None:
         """
         Initialize calendar.
@@ -37,12 +63,72 @@ class Calendar:
         Args:
             name: Calendar identifier (e.g., "WE", "NYSE", "TARGET")
             holidays: Set of holiday dates (excluding weekends)
+            start: Optional first date of a precomputed business day mask
+            end: Optional last date of a precomputed business day mask
         """
         self.name = name
         self._holidays: Set[date] = holidays or set()
+        self._hol_ords = self._holiday_ordinals()
+        
+        # Precomputed business day mask over [start, end]; queries inside the
+        # range become array lookups, queries outside fall back to day loops.
+        self._start: Optional[date] = None
+        self._start_ord = 0
+        self._bday_mask: Optional[np.ndarray] = None
+        self._cum: Optional[np.ndarray] = None
+        if start is not None and end is not None:
+            self.precompute(start, end)
+    
+    def precompute(self, start: date, end: date) -> None:
+        """
+        Build the business day mask and its cumulative count over [start, end].
+        
+        Args:
+            start: First date covered by the mask
+            end: Last date covered by the mask (inclusive)
+        """
+        if end < start:
+            raise ValueError(f"Calendar range end {end} is before start {start}")
+        
+        n = (end - start).days + 1
+        offsets = np.arange(n)
+        # Weekday of each date (Monday=0), weekends are 5 and 6
+        weekdays = (offsets + start.weekday()) % 7
+        mask = weekdays < 5
+        
+        hol_idx = self._hol_ords - start.toordinal()
+        mask[hol_idx[(hol_idx >= 0) & (hol_idx < n)]] = False
+        
+        self._start = start
+        self._start_ord = start.toordinal()
+        self._bday_mask = mask
+        # _cum[i] = number of business days in [start, start + i]
+        self._cum = np.cumsum(mask, dtype=np.int64)
+    
+    def _holiday_ordinals(self) -> np.ndarray:
+        """Holidays as a sorted int64 array of proleptic ordinals."""
+        return np.fromiter(
+            sorted(h.toordinal() for h in self._holidays), dtype=np.int64
+        )
+    
+    def _index(self, d: date) -> int:
+        """Return the mask index of a date, or -1 if outside the precomputed range."""
+        if self._bday_mask is None:
+            return -1
+        idx = d.toordinal() - self._start_ord
+        if 0 <= idx < self._bday_mask.size:
+            return idx
+        return -1
+    
+    def _date_at(self, idx: int) -> date:
+        """Return the date at a mask index."""
+        return date.fromordinal(self._start_ord + int(idx))
     
     def is_business_day(self, d: date) -> bool:
         """Check if a date is a business day."""
+        idx = self._index(d)
+        if idx >= 0:
+            return bool(self._bday_mask[idx])
         # Weekend check (Saturday=5, Sunday=6)
         if d.weekday() >= 5:
             return False
@@ -51,11 +137,44 @@ class Calendar:
             return False
         return True
     
+    def is_business_day_vec(self, ords: np.ndarray) -> np.ndarray:
+        """
+        Classify many dates at once.
+        
+        Args:
+            ords: Date ordinals (date.toordinal()) of any shape
+            
+        Returns:
+            Boolean array, True where the date is a business day
+        """
+        ords = np.asarray(ords, dtype=np.int64)
+        # Ordinal 1 (0001-01-01) is a Monday, so weekday = (ord - 1) % 7
+        result = (ords - 1) % 7 < 5
+        if self._hol_ords.size:
+            pos = np.searchsorted(self._hol_ords, ords)
+            hit = self._hol_ords[np.minimum(pos, self._hol_ords.size - 1)] == ords
+            result &= ~hit
+        return result
+    
     def add_business_days(self, d: date, days: int) -> date:
         """Add business days to a date."""
         if days == 0:
             return d
         
+        idx = self._index(d)
+        if idx >= 0:
+            if days > 0:
+                target = self._cum[idx] + days
+                pos = int(np.searchsorted(self._cum, target, side="left"))
+                if pos < self._cum.size:
+                    return self._date_at(pos)
+            else:
+                # Business days strictly before d carry cum values < target + 1
+                target = self._cum[idx] - int(self._bday_mask[idx]) + days + 1
+                if target >= 1:
+                    pos = int(np.searchsorted(self._cum, target, side="left"))
+                    return self._date_at(pos)
+        
         step = 1 if days > 0 else -1
         remaining = abs(days)
         current = d
@@ -69,6 +188,13 @@ class Calendar:
     
     def next_business_day(self, d: date) -> date:
         """Get the next business day on or after the given date."""
+        idx = self._index(d)
+        if idx >= 0:
+            tail = self._bday_mask[idx:]
+            offset = int(np.argmax(tail))
+            if tail[offset]:
+                return self._date_at(idx + offset)
+        
         current = d
         while not self.is_business_day(current):
             current += timedelta(days=1)
@@ -76,20 +202,94 @@ class Calendar:
     
     def prev_business_day(self, d: date) -> date:
         """Get the previous business day on or before the given date."""
+        idx = self._index(d)
+        if idx >= 0:
+            head = self._bday_mask[idx::-1]
+            offset = int(np.argmax(head))
+            if head[offset]:
+                return self._date_at(idx - offset)
+        
         current = d
         while not self.is_business_day(current):
             current -= timedelta(days=1)
         return current
     
+    def business_days_between(self, start: date, end: date) -> int:
+        """Count business days in (start, end]."""
+        if end <= start:
+            return 0
+        
+        i = self._index(start)
+        j = self._index(end)
+        if i >= 0 and j >= 0:
+            return int(self._cum[j] - self._cum[i])
+        
+        # Outside the precomputed range: numpy counts Mon-Fri days in
+        # [start + 1, end + 1), i.e. (start, end], net of holidays
+        one_day = timedelta(days=1)
+        return int(np.busday_count(
+            start + one_day, end + one_day, holidays=self._holiday_days()
+        ))
+    
+    def adjust_dates(
+        self,
+        dates: Union[Sequence[date], np.ndarray],
+        convention: BusinessDayConvention
+    ) -> np.ndarray:
+        """
+        Adjust many dates at once.
+        
+        Args:
+            dates: Dates (or a datetime64[D] array)
+            convention: Business day convention
+            
+        Returns:
+            Adjusted dates as a datetime64[D] array
+        """
+        arr = _to_datetime64(dates)
+        if convention == BusinessDayConvention.UNADJUSTED:
+            return arr
+        try:
+            roll = _BUSDAY_ROLL[convention]
+        except KeyError:
+            raise ValueError(f"Unknown business day convention: {convention}") from None
+        return np.busday_offset(arr, 0, roll=roll, holidays=self._holiday_days())
+    
+    def _holiday_days(self) -> np.ndarray:
+        """Holidays as a sorted datetime64[D] array."""
+        return (self._hol_ords - _EPOCH_ORD).astype("datetime64[D]")
+    
     def add_holidays(self, holidays: Set[date]) -> None:
         """Add holidays to the calendar."""
         self._holidays.update(holidays)
+        self._hol_ords = self._holiday_ordinals()
+        if self._bday_mask is not None:
+            end = self._date_at(self._bday_mask.size - 1)
+            self.precompute(self._start, end)
 
 
 # Default weekend-only calendar
 DEFAULT_CALENDAR = Calendar("WE")
 
 
+def _adjust_modified_following(d: date, cal: Calendar) -> date:
+    """Following, unless that rolls into the next month; then preceding."""
+    adjusted = cal.next_business_day(d)
+    # If adjusted date is in a different month, go backwards instead
+    if adjusted.month != d.month:
+        adjusted = cal.prev_business_day(d)
+    return adjusted
+
+
+# Convention -> adjustment function(date, calendar)
+_ADJ_DISPATCH: Dict[BusinessDayConvention, Callable[[date, Calendar], date]] = {
+    BusinessDayConvention.UNADJUSTED: lambda d, cal: d,
+    BusinessDayConvention.FOLLOWING: lambda d, cal: cal.next_business_day(d),
+    BusinessDayConvention.PRECEDING: lambda d, cal: cal.prev_business_day(d),
+    BusinessDayConvention.MODIFIED_FOLLOWING: _adjust_modified_following,
+}
+
+
 def adjust_date(
     d: date,
     convention: BusinessDayConvention,
@@ -106,26 +306,33 @@ def adjust_date(
     Returns:
         Adjusted date
     """
-    cal = calendar or DEFAULT_CALENDAR
-    
-    if convention == BusinessDayConvention.UNADJUSTED:
-        return d
-    
-    elif convention == BusinessDayConvention.FOLLOWING:
-        return cal.next_business_day(d)
-    
-    elif convention == BusinessDayConvention.PRECEDING:
-        return cal.prev_business_day(d)
+    try:
+        adjust = _ADJ_DISPATCH[convention]
+    except KeyError:
+        raise ValueError(f"Unknown business day convention: {convention}") from None
+    return adjust(d, calendar or DEFAULT_CALENDAR)
+
+
+def adjust_dates(
+    dates: Union[Sequence[date], np.ndarray],
+    convention: BusinessDayConvention,
+    calendar: Optional[Calendar] = None
+) -> np.ndarray:
+    """
+    Adjust a batch of dates according to a business day convention.
     
-    elif convention == BusinessDayConvention.MODIFIED_FOLLOWING:
-        adjusted = cal.next_business_day(d)
-        # If adjusted date is in a different month, go backwards instead
-        if adjusted.month != d.month:
-            adjusted = cal.prev_business_day(d)
-        return adjusted
+    Vectorized equivalent of calling adjust_date on each date.
     
-    else:
-        raise ValueError(f"Unknown business day convention: {convention}")
+    Args:
+        dates: Dates to adjust (or a datetime64[D] array)
+        convention: Business day convention
+        calendar: Calendar to use (defaults to weekend-only)
+        
+    Returns:
+        Adjusted dates as a datetime64[D] array
+    """
+    cal = calendar or DEFAULT_CALENDAR
+    return cal.adjust_dates(dates, convention)
 
 
 def business_days_between(
@@ -135,15 +342,4 @@ def business_days_between(
 ) -> int:
     """Count business days between two dates (exclusive of start, inclusive of end)."""
     cal = calendar or DEFAULT_CALENDAR
-    
-    if end <= start:
-        return 0
-    
-    count = 0
-    current = start + timedelta(days=1)
-    while current <= end:
-        if cal.is_business_day(current):
-            count += 1
-        current += timedelta(days=1)
-    
-    return count
+    return cal.business_days_between(start, end)
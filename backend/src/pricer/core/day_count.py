@@ -6,7 +6,10 @@ Supports: ACT/360, ACT/365F, 30/360
 
 from datetime import date
 from enum import Enum
-from typing import Tuple
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
 
 
 class DayCountConvention(str, Enum):
@@ -17,29 +20,68 @@ class DayCountConvention(str, Enum):
     THIRTY_360 = "30/360"
 
 
+# Year basis (denominator) per convention, keyed by convention value
+_YEAR_BASIS = {
+    DayCountConvention.ACT_360.value: 360.0,
+    DayCountConvention.ACT_365F.value: 365.0,
+    DayCountConvention.THIRTY_360.value: 360.0,
+}
+
+
 def _actual_days(start: date, end: date) -> int:
     """Calculate actual number of days between two dates."""
     return (end - start).days
 
 
-def _thirty_360_days(start: date, end: date) -> int:
+# Ordinal of 1970-01-01, the datetime64 epoch
+_EPOCH_ORD = date(1970, 1, 1).toordinal()
+
+
+def _ord_to_ymd(ords: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Calculate days using 30/360 convention (ISDA).
+    Split proleptic Gregorian ordinals into year, month and day arrays.
+    
+    Args:
+        ords: Dates as int64 ordinals (``date.toordinal()``)
+        
+    Returns:
+        Tuple of (year, month, day) int64 arrays
+    """
+    days = (np.asarray(ords, dtype=np.int64) - _EPOCH_ORD).astype("datetime64[D]")
+    months = days.astype("datetime64[M]")
+    y = days.astype("datetime64[Y]").astype(np.int64) + 1970
+    m = months.astype(np.int64) % 12 + 1
+    d = (days - months).astype(np.int64) + 1
+    return y, m, d
+
+
+def _thirty_360_days_vec(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Calculate days using 30/360 convention (ISDA) for arrays of ordinals.
     
     Each month is treated as having 30 days, year has 360 days.
     """
-    d1, m1, y1 = start.day, start.month, start.year
-    d2, m2, y2 = end.day, end.month, end.year
+    y1, m1, d1 = _ord_to_ymd(starts)
+    y2, m2, d2 = _ord_to_ymd(ends)
     
     # Adjust day-of-month per 30/360 ISDA rules
-    if d1 == 31:
-        d1 = 30
-    if d2 == 31 and d1 >= 30:
-        d2 = 30
+    d1 = np.where(d1 == 31, 30, d1)
+    d2 = np.where((d2 == 31) & (d1 >= 30), 30, d2)
     
     return 360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)
 
 
+def _thirty_360_days(start: date, end: date) -> int:
+    """
+    Calculate days using 30/360 convention (ISDA).
+    
+    Each month is treated as having 30 days, year has 360 days.
+    """
+    return int(_thirty_360_days_vec(
+        np.array([start.toordinal()]), np.array([end.toordinal()])
+    )[0])
+
+
 def day_count_fraction(
     start: date,
     end: date,
@@ -67,17 +109,66 @@ def day_count_fraction(
     if end == start:
         return 0.0
     
-    if convention == DayCountConvention.ACT_360:
-        return _actual_days(start, end) / 360.0
-    
-    elif convention == DayCountConvention.ACT_365F:
-        return _actual_days(start, end) / 365.0
+    try:
+        conv = DayCountConvention(convention).value
+    except ValueError:
+        raise ValueError(f"Unknown day count convention: {convention}") from None
     
-    elif convention == DayCountConvention.THIRTY_360:
-        return _thirty_360_days(start, end) / 360.0
+    return _dcf_cached(start.toordinal(), end.toordinal(), conv)
+
+
+@lru_cache(maxsize=4096)
+def _dcf_cached(start_ord: int, end_ord: int, conv: str) -> float:
+    """
+    Cached year fraction keyed on date ordinals and convention value.
     
+    Schedules, discounting and Greeks reprices hit the same small set of
+    date pairs repeatedly, so the result is memoized.
+    """
+    if conv == DayCountConvention.THIRTY_360.value:
+        days = int(_thirty_360_days_vec(np.array([start_ord]), np.array([end_ord]))[0])
     else:
-        raise ValueError(f"Unknown day count convention: {convention}")
+        days = end_ord - start_ord
+    return days / _YEAR_BASIS[conv]
+
+
+def year_fractions(
+    start: date,
+    end_ords: np.ndarray,
+    convention: DayCountConvention
+) -> np.ndarray:
+    """
+    Vectorized year fractions from a start date to many end dates.
+    
+    Args:
+        start: Start date (exclusive for accrual)
+        end_ords: End dates as int64 ordinals (``date.toordinal()``)
+        convention: Day count convention to use
+        
+    Returns:
+        Year fractions as a float64 array aligned with ``end_ords``
+    """
+    end_ords = np.asarray(end_ords, dtype=np.int64)
+    start_ord = start.toordinal()
+    
+    if np.any(end_ords < start_ord):
+        raise ValueError(f"All end dates must be >= start date {start}")
+    
+    try:
+        conv = DayCountConvention(convention).value
+    except ValueError:
+        raise ValueError(f"Unknown day count convention: {convention}") from None
+    
+    if conv == DayCountConvention.THIRTY_360.value:
+        starts = np.full_like(end_ords, start_ord)
+        return _thirty_360_days_vec(starts, end_ords).astype(np.float64) / _YEAR_BASIS[conv]
+    
+    return (end_ords - start_ord).astype(np.float64) / _YEAR_BASIS[conv]
+
+
+def dates_to_ordinals(dates: List[date]) -> np.ndarray:
+    """Convert a sequence of dates to an int64 array of ordinals."""
+    return np.fromiter((d.toordinal() for d in dates), dtype=np.int64, count=len(dates))
 
 
 def year_fraction_to_days(
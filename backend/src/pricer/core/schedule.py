@@ -4,12 +4,21 @@ Schedule generation for structured products.
 Generates observation, coupon, and settlement schedules.
 """
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from datetime import date, timedelta
-from typing import List, Optional
+from functools import lru_cache
+from datetime import date
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
-from pricer.core.calendar import Calendar, BusinessDayConvention, adjust_date, DEFAULT_CALENDAR
+import numpy as np
+
+from pricer.core.calendar import (
+    Calendar,
+    BusinessDayConvention,
+    adjust_dates,
+    DEFAULT_CALENDAR,
+)
 
 
 class Frequency(str, Enum):
@@ -23,33 +32,70 @@ class Frequency(str, Enum):
     DAILY = "DAILY"
 
 
+# Months per period for month-based frequencies
+_MONTHS_PER_PERIOD: Dict[Frequency, int] = {
+    Frequency.ANNUAL: 12,
+    Frequency.SEMI_ANNUAL: 6,
+    Frequency.QUARTERLY: 3,
+    Frequency.MONTHLY: 1,
+}
+
+
 def _months_for_frequency(freq: Frequency) -> int:
     """Get number of months per period for a frequency."""
-    mapping = {
-        Frequency.ANNUAL: 12,
-        Frequency.SEMI_ANNUAL: 6,
-        Frequency.QUARTERLY: 3,
-        Frequency.MONTHLY: 1,
-    }
-    if freq not in mapping:
-        raise ValueError(f"Frequency {freq} not supported for month-based schedules")
-    return mapping[freq]
+    try:
+        return _MONTHS_PER_PERIOD[freq]
+    except KeyError:
+        raise ValueError(
+            f"Frequency {freq} not supported for month-based schedules"
+        ) from None
 
 
-def _add_months(d: date, months: int) -> date:
-    """Add months to a date, handling end-of-month."""
-    year = d.year + (d.month + months - 1) // 12
-    month = (d.month + months - 1) % 12 + 1
-    
-    # Handle end-of-month
-    import calendar
-    max_day = calendar.monthrange(year, month)[1]
-    day = min(d.day, max_day)
+def _months_between(start: date, end: date) -> int:
+    """Whole calendar months from start's month to end's month."""
+    return (end.year - start.year) * 12 + end.month - start.month
+
+
+def _add_months_vec(d: date, month_offsets: np.ndarray) -> np.ndarray:
+    """
+    Add each of many month offsets to one anchor date, handling end-of-month.
     
-    return date(year, month, day)
+    Args:
+        d: Anchor date
+        month_offsets: Month offsets (may be negative) [n]
+        
+    Returns:
+        datetime64[D] dates [n], day clamped to the end of each month
+    """
+    months_arr = np.datetime64(d.replace(day=1), "M") + np.asarray(month_offsets)
+    first_day = months_arr.astype("datetime64[D]")
+    days_in_month = ((months_arr + 1).astype("datetime64[D]") - first_day).astype(np.int64)
+    return first_day + (np.minimum(d.day, days_in_month) - 1)
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _month_roll(anchor: date, months: int, num_periods: int, backward: bool) -> Tuple[date, ...]:
+    """
+    Period dates rolled from an anchor, memoized across schedules.
+    
+    Batch pricing builds many schedules from the same start/end dates and
+    frequency, so the roll is computed once per (anchor, months, count).
+    
+    Args:
+        anchor: Start date (forward) or end date (backward)
+        months: Months per period
+        num_periods: Number of dates to roll, including the anchor
+        backward: Roll backward from the anchor (returned in ascending order)
+        
+    Returns:
+        Tuple of dates in ascending order
+    """
+    offsets = np.arange(num_periods) * months
+    if backward:
+        offsets = -offsets[::-1]
+    return tuple(_add_months_vec(anchor, offsets).tolist())
+
+@dataclass(slots=True)
 class ScheduleDate:
     """A single date in a schedule with associated metadata."""
     
@@ -87,6 +133,33 @@ class Schedule:
     def unadjusted_dates(self) -> List[date]:
         """Get list of unadjusted dates."""
         return [d.unadjusted_date for d in self.dates]
+    
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the schedule as parallel int64 ordinal arrays.
+        
+        Returns:
+            Tuple of (unadjusted, adjusted, period_start, period_end) ordinals,
+            with -1 where a period bound is not set
+        """
+        n = len(self.dates)
+        
+        def ords(attr: str) -> np.ndarray:
+            return np.fromiter(
+                (
+                    d.toordinal() if d is not None else -1
+                    for d in (getattr(sd, attr) for sd in self.dates)
+                ),
+                dtype=np.int64,
+                count=n,
+            )
+        
+        return (
+            ords("unadjusted_date"),
+            ords("adjusted_date"),
+            ords("period_start"),
+            ords("period_end"),
+        )
 
 
 def generate_schedule(
@@ -116,83 +189,58 @@ def generate_schedule(
         Schedule of dates
     """
     cal = calendar or DEFAULT_CALENDAR
-    dates: List[ScheduleDate] = []
-    
-    if frequency == Frequency.DAILY:
-        current = start_date
-        while current <= end_date:
-            if include_start or current != start_date:
-                if include_end or current != end_date:
-                    adjusted = adjust_date(current, convention, cal)
-                    dates.append(ScheduleDate(
-                        unadjusted_date=current,
-                        adjusted_date=adjusted
-                    ))
-            current += timedelta(days=1)
-    
-    elif frequency == Frequency.WEEKLY:
-        current = start_date
-        while current <= end_date:
-            if include_start or current != start_date:
-                if include_end or current != end_date:
-                    adjusted = adjust_date(current, convention, cal)
-                    dates.append(ScheduleDate(
-                        unadjusted_date=current,
-                        adjusted_date=adjusted
-                    ))
-            current += timedelta(weeks=1)
+    unadjusted: List[date] = []
+    
+    if frequency in (Frequency.DAILY, Frequency.WEEKLY):
+        # Day offsets from start; the end date is excluded by the open bound
+        step = 1 if frequency == Frequency.DAILY else 7
+        span = (end_date - start_date).days
+        offsets = np.arange(
+            0 if include_start else step,
+            span + 1 if include_end else span,
+            step,
+        )
+        unadjusted = (np.datetime64(start_date, "D") + offsets).tolist()
     
     else:
         # Month-based frequencies
         months = _months_for_frequency(frequency)
         
+        # Every candidate period date in one shot; month rolls are strictly
+        # increasing, so the in-range dates are one slice found by bisection
+        num_periods = max(_months_between(start_date, end_date) // months, -1) + 1
+        
         if stub_at_end:
             # Roll forward from start
-            current = start_date
-            period_num = 0
-            while current <= end_date:
-                if include_start or period_num > 0:
-                    adjusted = adjust_date(current, convention, cal)
-                    dates.append(ScheduleDate(
-                        unadjusted_date=current,
-                        adjusted_date=adjusted
-                    ))
-                current = _add_months(start_date, (period_num + 1) * months)
-                period_num += 1
+            rolls = _month_roll(start_date, months, num_periods, False)
+            lo = 0 if include_start else 1
+            unadjusted = list(rolls[lo:bisect_right(rolls, end_date)])
             
             # Add end date if needed and not already included
-            if include_end and (not dates or dates[-1].unadjusted_date != end_date):
+            if include_end and (not unadjusted or unadjusted[-1] != end_date):
                 if end_date > start_date:
-                    adjusted = adjust_date(end_date, convention, cal)
-                    dates.append(ScheduleDate(
-                        unadjusted_date=end_date,
-                        adjusted_date=adjusted
-                    ))
+                    unadjusted.append(end_date)
         else:
-            # Roll backward from end
-            temp_dates: List[date] = []
-            current = end_date
-            while current >= start_date:
-                temp_dates.append(current)
-                current = _add_months(end_date, -len(temp_dates) * months)
-            
-            temp_dates.reverse()
-            
-            for d in temp_dates:
-                if (include_start or d != start_date) and (include_end or d != end_date):
-                    adjusted = adjust_date(d, convention, cal)
-                    dates.append(ScheduleDate(
-                        unadjusted_date=d,
-                        adjusted_date=adjusted
-                    ))
-    
-    # Add period start/end for accrual calculations
-    for i, sched_date in enumerate(dates):
-        if i == 0:
-            sched_date.period_start = adjust_date(start_date, convention, cal)
-        else:
-            sched_date.period_start = dates[i - 1].adjusted_date
-        sched_date.period_end = sched_date.adjusted_date
+            # Roll backward from end; the last roll is end_date itself
+            rolls = _month_roll(end_date, months, num_periods, True)
+            lo = bisect_left(rolls, start_date)
+            if not include_start and lo < len(rolls) and rolls[lo] == start_date:
+                lo += 1
+            hi = len(rolls) if include_end else len(rolls) - 1
+            unadjusted = list(rolls[lo:hi])
+    
+    # Adjust the start date and all schedule dates in one vectorized call;
+    # each period runs from the previous adjusted date to its own
+    adjusted = adjust_dates([start_date] + unadjusted, convention, cal).tolist()
+    dates = [
+        ScheduleDate(
+            unadjusted_date=u,
+            adjusted_date=adj,
+            period_start=prev_adj,
+            period_end=adj
+        )
+        for u, prev_adj, adj in zip(unadjusted, adjusted[:-1], adjusted[1:])
+    ]
     
     return Schedule(dates=dates)
 
@@ -214,18 +262,18 @@ def generate_explicit_schedule(
         Schedule of dates
     """
     cal = calendar or DEFAULT_CALENDAR
-    dates: List[ScheduleDate] = []
     
     sorted_dates = sorted(explicit_dates)
+    adjusted = adjust_dates(sorted_dates, convention, cal).tolist()
     
-    for i, d in enumerate(sorted_dates):
-        adjusted = adjust_date(d, convention, cal)
-        period_start = dates[i - 1].adjusted_date if i > 0 else adjusted
-        dates.append(ScheduleDate(
+    dates = [
+        ScheduleDate(
             unadjusted_date=d,
-            adjusted_date=adjusted,
-            period_start=period_start,
-            period_end=adjusted
-        ))
+            adjusted_date=adj,
+            period_start=prev_adj,
+            period_end=adj
+        )
+        for d, prev_adj, adj in zip(sorted_dates, adjusted[:1] + adjusted[:-1], adjusted)
+    ]
     
     return Schedule(dates=dates)
@@ -1,10 +1,17 @@
 """Pricing engines: Path generation, grid building, and MC simulation."""
 
-from pricer.engines.base import PricingEngine, PricingResult, CashFlow
+from pricer.engines.base import (
+    PricingEngine,
+    PricingResult,
+    CashFlow,
+    CashFlowTable,
+    CASHFLOW_TYPE_CODES,
+)
 from pricer.engines.grid import (
     SimulationGrid,
     GridEvent,
     EventType,
+    EVENT_TYPE_CODES,
     build_simulation_grid,
     get_exdiv_schedule_for_underlying,
 )
@@ -40,9 +47,12 @@ __all__ = [
     "PricingEngine",
     "PricingResult",
     "CashFlow",
+    "CashFlowTable",
+    "CASHFLOW_TYPE_CODES",
     "SimulationGrid",
     "GridEvent",
     "EventType",
+    "EVENT_TYPE_CODES",
     "build_simulation_grid",
     "get_exdiv_schedule_for_underlying",
     "PathGenerator",
@@ -0,0 +1,200 @@
+"""
+Numba-compiled kernels for the simulation engines.
+
+Each kernel is optional: callers check HAS_NUMBA and fall back to NumPy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+
+def gbm_fused_block(
+    Z_corr: np.ndarray,
+    drift_dt: np.ndarray,
+    vol_sqrt_dt: np.ndarray,
+    log_spots: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """
+    Fused GBM step: drift + diffusion + running log-sum + exp in one pass.
+
+    Args:
+        Z_corr: Correlated normals, asset-major [num_assets, block, num_steps]
+        drift_dt: (mu - 0.5*vol^2)*dt per step [num_steps, num_assets]
+        vol_sqrt_dt: vol*sqrt(dt) per step [num_steps, num_assets]
+        log_spots: Log initial spots [num_assets]
+        out: Spots after each step, written in place [block, num_steps, num_assets]
+    """
+    num_assets, block, num_steps = Z_corr.shape
+
+    for p in prange(block):
+        for k in range(num_assets):
+            acc = log_spots[k]
+            for t in range(num_steps):
+                acc += drift_dt[t, k] + vol_sqrt_dt[t, k] * Z_corr[k, p, t]
+                out[p, t, k] = np.exp(acc)
+
+
+if HAS_NUMBA:
+    gbm_fused_block = njit(parallel=True, fastmath=True, cache=True)(gbm_fused_block)
+
+
+def gbm_step_ki(
+    S_prev: np.ndarray,
+    S_next: np.ndarray,
+    Z_t: np.ndarray,
+    vol: np.ndarray,
+    r: float,
+    cont_yields: np.ndarray,
+    dt: float,
+    div_amounts: np.ndarray,
+    barriers: np.ndarray,
+    U_t: np.ndarray,
+    ki_state: np.ndarray,
+    ki_step: np.ndarray,
+    step: int,
+) -> None:
+    """
+    One GBM step with dividend jumps and Brownian bridge KI, fused per path.
+
+    Per-step arrays are asset-major (one contiguous row of paths per asset).
+
+    Args:
+        S_prev: Spots at the start of the step [num_assets, num_paths]
+        S_next: Spots at the end of the step, written in place [num_assets, num_paths]
+        Z_t: Correlated normals for the step [num_assets, num_paths]
+        vol: Step vol, shared [num_assets, 1] or per path [num_assets, num_paths]
+        r: Risk-free rate
+        cont_yields: Continuous dividend yields [num_assets]
+        dt: Step length in years (> 0)
+        div_amounts: Discrete dividend paid at the step end, 0 if none [num_assets]
+        barriers: Absolute KI barriers [num_assets], empty to skip the KI check
+        U_t: Uniforms for the probabilistic KI check [num_assets, num_paths]
+        ki_state: Knock-in flag per path, updated in place [num_paths]
+        ki_step: Grid step of the knock-in or -1, updated in place [num_paths]
+        step: Index of the step start on the grid
+    """
+    num_assets, num_paths = S_prev.shape
+    vol_stride = 1 if vol.shape[1] > 1 else 0  # column step into vol per path
+    check_ki = barriers.shape[0] > 0
+    sqrt_dt = np.sqrt(dt)
+
+    for p in prange(num_paths):
+        vp = p * vol_stride
+        for a in range(num_assets):
+            v = vol[a, vp]
+            log_return = (r - cont_yields[a] - 0.5 * v * v) * dt + v * sqrt_dt * Z_t[a, p]
+            s = S_prev[a, p] * np.exp(log_return)
+            if div_amounts[a] > 0.0:
+                s = max(s - div_amounts[a], 0.01)
+            S_next[a, p] = s
+
+        if not check_ki or ki_state[p]:
+            continue
+
+        for a in range(num_assets):
+            s_start = S_prev[a, p]
+            s_end = S_next[a, p]
+            H = barriers[a]
+            if s_start <= H or s_end <= H:
+                prob = 1.0
+            else:
+                v = vol[a, vp]
+                exponent = -2.0 * np.log(s_start / H) * np.log(s_end / H) / (v * v * dt)
+                prob = np.exp(min(exponent, 0.0))
+            if U_t[a, p] < prob:
+                ki_state[p] = True
+                ki_step[p] = step + 1
+                break
+
+
+if HAS_NUMBA:
+    gbm_step_ki = njit(parallel=True, fastmath=True, cache=True)(gbm_step_ki)
+
+
+def bb_hit_probability(
+    S_start: np.ndarray,
+    S_end: np.ndarray,
+    barrier: np.ndarray,
+    vol: np.ndarray,
+    dt: float,
+    down: bool,
+    out: np.ndarray,
+) -> None:
+    """
+    Brownian bridge barrier hit probability, element by element.
+
+    Inputs are 2-D and share out's shape (broadcast views are fine).
+
+    Args:
+        S_start: Spots at the start of the step
+        S_end: Spots at the end of the step
+        barrier: Absolute barrier levels
+        vol: Volatility for the step
+        dt: Step length in years (> 0)
+        down: True for a down barrier, False for up
+        out: Hit probabilities, written in place
+    """
+    rows, cols = out.shape
+
+    for i in prange(rows):
+        for j in range(cols):
+            s_start = S_start[i, j]
+            s_end = S_end[i, j]
+            H = barrier[i, j]
+            if down:
+                hit = s_start <= H or s_end <= H
+            else:
+                hit = s_start >= H or s_end >= H
+            if hit:
+                out[i, j] = 1.0
+            else:
+                # The product of log ratios is the same for up barriers
+                v = vol[i, j]
+                exponent = -2.0 * np.log(s_start / H) * np.log(s_end / H) / (v * v * dt)
+                out[i, j] = np.exp(min(exponent, 0.0))
+
+
+if HAS_NUMBA:
+    bb_hit_probability = njit(parallel=True, fastmath=True, cache=True)(bb_hit_probability)
+
+
+def warmup(dtype: np.dtype = np.float32) -> None:
+    """
+    Compile (or load from the on-disk cache) every kernel in this module.
+
+    Calls each kernel once on tiny inputs with the argument layouts used by
+    the engines, so the first priced request does not pay the JIT latency.
+    A no-op without Numba.
+
+    Args:
+        dtype: Path tensor dtype to specialise for (MonteCarloConfig.dtype,
+            PathGeneratorConfig.dtype)
+    """
+    if not HAS_NUMBA:
+        return
+
+    # MonteCarloEngine writes into a strided view paths[b0:b0+block, 1:, :]
+    paths = np.empty((2, 3, 1), dtype=dtype)
+    gbm_fused_block(
+        np.zeros((1, 2, 2), dtype=dtype),
+        np.zeros((2, 1), dtype=dtype),
+        np.zeros((2, 1), dtype=dtype),
+        np.zeros(1, dtype=dtype),
+        paths[:, 1:, :],
+    )
+
+    # PathGenerator passes per-step rows of [num_steps+1, num_assets, num_paths]
+    spots = np.ones((2, 1, 2), dtype=dtype)
+    draws = np.zeros((1, 1, 2), dtype=dtype)
+    gbm_step_ki(
+        spots[0], spots[1], draws[0], np.ones((1, 1)), 0.0,
+        np.zeros(1), 1.0, np.zeros(1), np.ones(1), draws[0],
+        np.zeros(2, dtype=np.bool_), np.full(2, -1, dtype=np.int32), 0,
+    )
@@ -9,6 +9,8 @@ from dataclasses import dataclass, field
 from datetime import date
 from typing import Dict, List, Optional, Any
 
+import numpy as np
+
 from pricer.products.base import Product
 from pricer.market.market_data import MarketData
 
@@ -31,6 +33,99 @@ class CashFlow:
     underlying: Optional[str] = None
 
 
+# Integer codes for CashFlowTable.type_codes
+CASHFLOW_TYPE_CODES: Dict[str, int] = {
+    "coupon": 0,
+    "redemption": 1,
+    "autocall": 2,
+    "maturity": 3,
+}
+_CASHFLOW_TYPES: List[str] = sorted(CASHFLOW_TYPE_CODES, key=CASHFLOW_TYPE_CODES.get)
+
+
+@dataclass
+class CashFlowTable:
+    """
+    Cash flows stored column-wise, one array per CashFlow attribute.
+    
+    Aggregations are array reductions instead of loops over CashFlow objects.
+    
+    Attributes:
+        date_ords: Payment date ordinals [num_flows]
+        amounts: Cash flow amounts [num_flows]
+        type_codes: CASHFLOW_TYPE_CODES value per flow [num_flows]
+        underlying_codes: Index into underlyings per flow, or -1 [num_flows]
+        underlyings: Underlying ids referenced by underlying_codes
+    """
+    
+    date_ords: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.int64))
+    amounts: np.ndarray = field(default_factory=lambda: np.array([]))
+    type_codes: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.int8))
+    underlying_codes: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.int16))
+    underlyings: List[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.amounts)
+    
+    @classmethod
+    def from_cashflows(cls, cashflows: List[CashFlow]) -> "CashFlowTable":
+        """
+        Build a table from CashFlow objects.
+        
+        Raises:
+            ValueError: If a cash flow type is not in CASHFLOW_TYPE_CODES
+        """
+        unknown = sorted({cf.type for cf in cashflows} - CASHFLOW_TYPE_CODES.keys())
+        if unknown:
+            raise ValueError(
+                f"Unknown cash flow type(s) {unknown}; expected one of {_CASHFLOW_TYPES}"
+            )
+        
+        underlyings: List[str] = []
+        positions: Dict[str, int] = {}
+        underlying_codes = []
+        for cf in cashflows:
+            if cf.underlying is None:
+                underlying_codes.append(-1)
+            else:
+                if cf.underlying not in positions:
+                    positions[cf.underlying] = len(underlyings)
+                    underlyings.append(cf.underlying)
+                underlying_codes.append(positions[cf.underlying])
+        
+        return cls(
+            date_ords=np.array([cf.date.toordinal() for cf in cashflows], dtype=np.int64),
+            amounts=np.array([cf.amount for cf in cashflows], dtype=np.float64),
+            type_codes=np.array([CASHFLOW_TYPE_CODES[cf.type] for cf in cashflows], dtype=np.int8),
+            underlying_codes=np.array(underlying_codes, dtype=np.int16),
+            underlyings=underlyings,
+        )
+    
+    def to_cashflows(self) -> List[CashFlow]:
+        """Convert back to CashFlow objects."""
+        return [
+            CashFlow(
+                date=date.fromordinal(o),
+                amount=amount,
+                type=_CASHFLOW_TYPES[code],
+                underlying=self.underlyings[u_code] if u_code >= 0 else None,
+            )
+            for o, amount, code, u_code in zip(
+                self.date_ords.tolist(),
+                self.amounts.tolist(),
+                self.type_codes.tolist(),
+                self.underlying_codes.tolist(),
+            )
+        ]
+    
+    def total_by_type(self) -> Dict[str, float]:
+        """Sum of amounts per cash flow type."""
+        totals = np.bincount(
+            self.type_codes, weights=self.amounts, minlength=len(_CASHFLOW_TYPES)
+        )
+        return dict(zip(_CASHFLOW_TYPES, totals.astype(np.float64).tolist()))
+
+
 @dataclass
 class PathResult:
     """
@@ -82,6 +177,11 @@ class PricingResult:
     # Additional metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    @property
+    def cashflow_table(self) -> CashFlowTable:
+        """Expected cash flows as a column-wise CashFlowTable."""
+        return CashFlowTable.from_cashflows(self.expected_cashflows)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Serialize result to dictionary."""
         return {
@@ -11,10 +11,10 @@ Builds time grid from term sheet with all relevant dates:
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, Iterator, Tuple, Optional
 import numpy as np
 
-from pricer.core.day_count import DayCountConvention, day_count_fraction
+from pricer.core.day_count import DayCountConvention, year_fractions
 from pricer.products.schema import TermSheet
 
 
@@ -25,11 +25,35 @@ class EventType(str, Enum):
     OBSERVATION = "observation"     # Autocall/coupon check
     EX_DIVIDEND = "ex_dividend"     # Discrete dividend ex-date
     MATURITY = "maturity"
+    
+    @property
+    def code(self) -> int:
+        """Integer code (EVENT_TYPE_CODES) for int comparisons in hot loops."""
+        return EVENT_TYPE_CODES[self]
 
 
-@dataclass
+# Integer codes for SimulationGrid.event_type_codes
+EVENT_TYPE_CODES: Dict[EventType, int] = {
+    EventType.VALUATION: 0,
+    EventType.OBSERVATION: 1,
+    EventType.EX_DIVIDEND: 2,
+    EventType.MATURITY: 3,
+}
+_EVENT_TYPES: List[EventType] = sorted(EVENT_TYPE_CODES, key=EVENT_TYPE_CODES.get)
+_OBSERVATION_CODE = EVENT_TYPE_CODES[EventType.OBSERVATION]
+_EXDIV_CODE = EVENT_TYPE_CODES[EventType.EX_DIVIDEND]
+
+# Bit per event type for per-date type masks; same-date events are emitted
+# in _EMIT_ORDER (alphabetical by value), stored with each type's bit
+_EVENT_BITS: Dict[EventType, int] = {e: 1 << code for e, code in EVENT_TYPE_CODES.items()}
+_EMIT_ORDER: Tuple[Tuple[EventType, int], ...] = tuple(
+    (e, _EVENT_BITS[e]) for e in sorted(EventType, key=lambda e: e.value)
+)
+
+
+@dataclass(slots=True)
 class GridEvent:
-    """A single event in the simulation grid."""
+    """A single event in the simulation grid (a view of one SimulationGrid row)."""
     
     date: date
     event_type: EventType
@@ -38,6 +62,7 @@ class GridEvent:
     observation_index: Optional[int] = None  # Index in observation schedule
     underlying_id: Optional[str] = None      # For ex-dividend events
     dividend_amount: Optional[float] = None  # For ex-dividend events
+    event_type_code: int = -1                # EVENT_TYPE_CODES[event_type]
 
 
 @dataclass
@@ -45,20 +70,37 @@ class SimulationGrid:
     """
     Complete simulation grid with all events.
     
+    Events are stored column-wise (one array per attribute, one row per
+    event, sorted by date) so event scans are array masks.
+    
     Attributes:
-        events: List of grid events, sorted by date
         dates: Unique sorted dates
         times: Year fractions for each date
         dt: Time increments between consecutive dates
+        event_type_codes: EVENT_TYPE_CODES value per event [num_events]
+        time_years: Year fraction per event [num_events]
+        grid_index: Grid date index per event [num_events]
+        observation_index: Observation schedule index per event, or -1
+        underlying_id_codes: Index into underlying_ids per event, or -1
+        dividend_amount: Ex-dividend amount per event (0 if none)
+        underlying_ids: Underlying ids referenced by underlying_id_codes
         observation_indices: Map from observation date to grid index
         exdiv_indices: Map from (underlying, date) to grid index
     """
     
-    events: List[GridEvent] = field(default_factory=list)
     dates: List[date] = field(default_factory=list)
     times: np.ndarray = field(default_factory=lambda: np.array([]))
     dt: np.ndarray = field(default_factory=lambda: np.array([]))
     
+    # Events (structure of arrays)
+    event_type_codes: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.int8))
+    time_years: np.ndarray = field(default_factory=lambda: np.array([]))
+    grid_index: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.int32))
+    observation_index: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.int32))
+    underlying_id_codes: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.int16))
+    dividend_amount: np.ndarray = field(default_factory=lambda: np.array([]))
+    underlying_ids: List[str] = field(default_factory=list)
+    
     # Lookup maps
     observation_indices: Dict[date, int] = field(default_factory=dict)
     exdiv_indices: Dict[Tuple[str, date], int] = field(default_factory=dict)
@@ -69,12 +111,48 @@ class SimulationGrid:
         """Number of simulation steps."""
         return len(self.dates) - 1
     
+    @property
+    def events(self) -> List[GridEvent]:
+        """Grid events as GridEvent objects (built on access)."""
+        return list(self._iter_rows(slice(None)))
+    
+    def iter_events_of_type(self, event_type: EventType) -> Iterator[GridEvent]:
+        """
+        Iterate over events of one type without building the full event list.
+        
+        Args:
+            event_type: Event type to select
+            
+        Yields:
+            GridEvent views in date order
+        """
+        return self._iter_rows(self.event_type_codes == event_type.code)
+    
+    def _iter_rows(self, rows: np.ndarray) -> Iterator[GridEvent]:
+        """Yield GridEvent views of the event rows selected by a mask or slice."""
+        for code, t, idx, obs_idx, u_code, amount in zip(
+            self.event_type_codes[rows].tolist(),
+            self.time_years[rows].tolist(),
+            self.grid_index[rows].tolist(),
+            self.observation_index[rows].tolist(),
+            self.underlying_id_codes[rows].tolist(),
+            self.dividend_amount[rows].tolist(),
+        ):
+            yield GridEvent(
+                date=self.dates[idx],
+                event_type=_EVENT_TYPES[code],
+                time_years=t,
+                index=idx,
+                observation_index=obs_idx if obs_idx >= 0 else None,
+                underlying_id=self.underlying_ids[u_code] if u_code >= 0 else None,
+                dividend_amount=amount if code == _EXDIV_CODE else None,
+                event_type_code=code,
+            )
+    
     def get_observation_grid_indices(self) -> List[int]:
         """Get grid indices for observation dates."""
-        return [
-            e.index for e in self.events 
-            if e.event_type == EventType.OBSERVATION
-        ]
+        mask = self.event_type_codes == _OBSERVATION_CODE
+        return self.grid_index[mask].tolist()
 
 
 def build_simulation_grid(
@@ -99,107 +177,135 @@ def build_simulation_grid(
     """
     valuation_date = term_sheet.meta.valuation_date
     
-    # Collect all dates with their event types
-    date_events: Dict[date, Set[EventType]] = {}
+    val_ord = valuation_date.toordinal()
+    maturity_date = term_sheet.meta.maturity_date
+    mat_ord = maturity_date.toordinal()
+    
+    underlying_ids = [u.id for u in term_sheet.underlyings]
     
-    # Valuation date
-    date_events[valuation_date] = {EventType.VALUATION}
+    # Observation dates on or after valuation
+    obs_ords = term_sheet.schedules.observation_ords
+    obs_ords = obs_ords[obs_ords >= val_ord]
     
-    # Observation dates
-    for obs_date in term_sheet.schedules.observation_dates:
-        if obs_date >= valuation_date:
-            if obs_date not in date_events:
-                date_events[obs_date] = set()
-            date_events[obs_date].add(EventType.OBSERVATION)
+    # Ex-dividend dates in (valuation, maturity], with parallel underlying/amount
+    ords_parts: List[np.ndarray] = []
+    code_parts: List[np.ndarray] = []
+    amount_parts: List[np.ndarray] = []
     
-    # Maturity date
-    maturity_date = term_sheet.meta.maturity_date
-    if maturity_date not in date_events:
-        date_events[maturity_date] = set()
-    date_events[maturity_date].add(EventType.MATURITY)
-    
-    # Ex-dividend dates for discrete dividends
-    exdiv_info: Dict[date, List[Tuple[str, float]]] = {}  # date -> [(underlying, amount)]
-    
-    for underlying in term_sheet.underlyings:
-        if underlying.dividend_model.discrete_dividends:
-            for div in underlying.dividend_model.discrete_dividends:
-                if div.ex_date > valuation_date and div.ex_date <= maturity_date:
-                    if div.ex_date not in date_events:
-                        date_events[div.ex_date] = set()
-                    date_events[div.ex_date].add(EventType.EX_DIVIDEND)
-                    
-                    if div.ex_date not in exdiv_info:
-                        exdiv_info[div.ex_date] = []
-                    exdiv_info[div.ex_date].append((underlying.id, div.amount))
-    
-    # Sort dates
-    sorted_dates = sorted(date_events.keys())
+    for u_code, underlying in enumerate(term_sheet.underlyings):
+        model = underlying.dividend_model
+        if model.discrete_dividends:
+            ex_ords = model.ex_date_ords
+            in_life = (ex_ords > val_ord) & (ex_ords <= mat_ord)
+            ords_parts.append(ex_ords[in_life])
+            code_parts.append(np.full(int(in_life.sum()), u_code, dtype=np.int64))
+            amount_parts.append(model.amounts[in_life])
+    
+    exdiv_ords = np.concatenate(ords_parts) if ords_parts else np.empty(0, dtype=np.int64)
+    exdiv_codes = np.concatenate(code_parts).tolist() if code_parts else []
+    exdiv_amounts = np.concatenate(amount_parts).tolist() if amount_parts else []
+    
+    # Deduplicate all event dates; OR each event's type bit into its date
+    all_ords = np.concatenate([
+        [val_ord], obs_ords, [mat_ord], exdiv_ords
+    ]).astype(np.int64)
+    bits = np.concatenate([
+        [_EVENT_BITS[EventType.VALUATION]],
+        np.full(obs_ords.size, _EVENT_BITS[EventType.OBSERVATION]),
+        [_EVENT_BITS[EventType.MATURITY]],
+        np.full(exdiv_ords.size, _EVENT_BITS[EventType.EX_DIVIDEND]),
+    ]).astype(np.int8)
+    
+    unique_ords, inverse = np.unique(all_ords, return_inverse=True)
+    date_masks = np.zeros(unique_ords.size, dtype=np.int8)
+    np.bitwise_or.at(date_masks, inverse, bits)
+    
+    sorted_dates = [date.fromordinal(o) for o in unique_ords.tolist()]
+    
+    # Ex-dividend rows grouped by grid index (stable: keeps underlying order);
+    # rows of grid date i are exdiv_order[exdiv_bounds[i]:exdiv_bounds[i + 1]]
+    exdiv_grid = inverse[obs_ords.size + 2:]
+    exdiv_order = np.argsort(exdiv_grid, kind="stable")
+    exdiv_bounds = np.searchsorted(
+        exdiv_grid[exdiv_order], np.arange(unique_ords.size + 1)
+    ).tolist()
+    exdiv_order = exdiv_order.tolist()
     
     # Build time array
-    times = np.array([
-        day_count_fraction(valuation_date, d, day_count)
-        for d in sorted_dates
-    ])
+    times = year_fractions(valuation_date, unique_ords, day_count)
     
     # Build dt array
     dt = np.diff(times)
     dt = np.concatenate([[0.0], dt])  # First step has dt=0
     
-    # Build events list
-    events: List[GridEvent] = []
+    # Build event columns
+    # Schedule position of each grid date, -1 if not an observation date
+    # (observation dates are strictly increasing, so searchsorted finds them)
+    sched_ords = term_sheet.schedules.observation_ords
+    obs_pos = np.minimum(np.searchsorted(sched_ords, unique_ords), sched_ords.size - 1)
+    obs_positions = np.where(sched_ords[obs_pos] == unique_ords, obs_pos, -1).tolist()
+    
+    type_codes: List[int] = []
+    grid_index: List[int] = []
+    observation_index: List[int] = []
+    underlying_id_codes: List[int] = []
+    dividend_amount: List[float] = []
+    
+    def add_event(
+        etype: EventType,
+        idx: int,
+        obs_idx: int = -1,
+        u_code: int = -1,
+        amount: float = 0.0
+    ) -> None:
+        type_codes.append(etype.code)
+        grid_index.append(idx)
+        observation_index.append(obs_idx)
+        underlying_id_codes.append(u_code)
+        dividend_amount.append(amount)
+    
     observation_indices: Dict[date, int] = {}
     exdiv_indices: Dict[Tuple[str, date], int] = {}
     maturity_index = -1
     
-    obs_counter = 0
-    
-    for idx, d in enumerate(sorted_dates):
-        event_types = date_events[d]
-        
-        # Create event for each type at this date
-        for etype in sorted(event_types, key=lambda x: x.value):
-            event = GridEvent(
-                date=d,
-                event_type=etype,
-                time_years=times[idx],
-                index=idx,
-            )
+    for idx, (d, date_mask) in enumerate(zip(sorted_dates, date_masks.tolist())):
+        # Create event for each type bit set at this date
+        for etype, bit in _EMIT_ORDER:
+            if not date_mask & bit:
+                continue
             
             if etype == EventType.OBSERVATION:
-                # Find observation index in schedule
-                try:
-                    obs_idx = term_sheet.schedules.observation_dates.index(d)
-                    event.observation_index = obs_idx
+                # Observation index in schedule
+                obs_idx = obs_positions[idx]
+                if obs_idx >= 0:
                     observation_indices[d] = idx
-                except ValueError:
-                    pass
+                add_event(etype, idx, obs_idx=obs_idx)
             
             elif etype == EventType.EX_DIVIDEND:
-                # Add exdiv info
-                for underlying_id, amount in exdiv_info.get(d, []):
-                    exdiv_event = GridEvent(
-                        date=d,
-                        event_type=etype,
-                        time_years=times[idx],
-                        index=idx,
-                        underlying_id=underlying_id,
-                        dividend_amount=amount,
-                    )
-                    events.append(exdiv_event)
-                    exdiv_indices[(underlying_id, d)] = idx
-                continue  # Skip adding the generic event
-            
-            elif etype == EventType.MATURITY:
-                maturity_index = idx
+                # One event per dividend paying on this date
+                for row in exdiv_order[exdiv_bounds[idx]:exdiv_bounds[idx + 1]]:
+                    u_code = exdiv_codes[row]
+                    add_event(etype, idx, u_code=u_code, amount=exdiv_amounts[row])
+                    exdiv_indices[(underlying_ids[u_code], d)] = idx
             
-            events.append(event)
+            else:
+                if etype == EventType.MATURITY:
+                    maturity_index = idx
+                add_event(etype, idx)
+    
+    grid_index_arr = np.array(grid_index, dtype=np.int32)
     
     return SimulationGrid(
-        events=events,
         dates=sorted_dates,
         times=times,
         dt=dt,
+        event_type_codes=np.array(type_codes, dtype=np.int8),
+        time_years=times[grid_index_arr],
+        grid_index=grid_index_arr,
+        observation_index=np.array(observation_index, dtype=np.int32),
+        underlying_id_codes=np.array(underlying_id_codes, dtype=np.int16),
+        dividend_amount=np.array(dividend_amount, dtype=np.float64),
+        underlying_ids=underlying_ids,
         observation_indices=observation_indices,
         exdiv_indices=exdiv_indices,
         maturity_index=maturity_index,
@@ -216,9 +322,10 @@ def get_exdiv_schedule_for_underlying(
     Returns:
         List of (grid_index, dividend_amount) tuples
     """
-    result = []
-    for event in grid.events:
-        if (event.event_type == EventType.EX_DIVIDEND and 
-            event.underlying_id == underlying_id):
-            result.append((event.index, event.dividend_amount or 0.0))
-    return result
+    if underlying_id not in grid.underlying_ids:
+        return []
+    mask = (
+        (grid.event_type_codes == _EXDIV_CODE)
+        & (grid.underlying_id_codes == grid.underlying_ids.index(underlying_id))
+    )
+    return list(zip(grid.grid_index[mask].tolist(), grid.dividend_amount[mask].tolist()))
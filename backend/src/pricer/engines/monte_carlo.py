@@ -16,6 +16,8 @@ from pricer.products.base import Product, Barrier, BarrierType
 from pricer.products.autocallable import AutocallableNote
 from pricer.market.market_data import MarketData
 from pricer.engines.base import PricingEngine, PricingResult, CashFlow
+from pricer.engines.path_generator import block_generator
+from pricer.engines.monte_carlo_gpu import generate_paths_gpu, simulate_gbm_block
 
 
 @dataclass
@@ -27,6 +29,8 @@ class MonteCarloConfig:
     antithetic: bool = True
     block_size: int = 10_000  # Paths per block for memory efficiency
     steps_per_day: int = 1    # For continuous barrier monitoring
+    device: str = "cpu"       # "cpu" or "cuda" (requires cupy)
+    dtype: np.dtype = np.float32  # Path tensor dtype (accumulators stay float64)
 
 
 class MonteCarloEngine(PricingEngine):
@@ -45,6 +49,8 @@ class MonteCarloEngine(PricingEngine):
         seed: Random seed for reproducibility
         antithetic: Use antithetic variates for variance reduction
         block_size: Number of paths to process at once (memory control)
+        device: "cpu" (NumPy) or "cuda" (CuPy) path simulation
+        dtype: Floating dtype of normals and paths (float32 halves memory traffic)
     """
     
     def __init__(
@@ -52,31 +58,27 @@ class MonteCarloEngine(PricingEngine):
         num_paths: int = 100_000,
         seed: Optional[int] = None,
         antithetic: bool = True,
-        block_size: int = 10_000
+        block_size: int = 10_000,
+        device: str = "cpu",
+        dtype: np.dtype = np.float32
     ) -> None:
+        if device not in ("cpu", "cuda"):
+            raise ValueError(f"Unknown device: {device}")
+        
         self.num_paths = num_paths
         self._seed = seed
         self.antithetic = antithetic
         self.block_size = block_size
-        self._rng: Optional[np.random.Generator] = None
-        
-        if seed is not None:
-            self._rng = np.random.default_rng(seed)
+        self.device = device
+        self.dtype = dtype
     
     def get_seed(self) -> Optional[int]:
         """Get current random seed."""
         return self._seed
     
     def set_seed(self, seed: int) -> None:
-        """Set random seed and reinitialize RNG."""
+        """Set random seed for subsequent simulations."""
         self._seed = seed
-        self._rng = np.random.default_rng(seed)
-    
-    def _get_rng(self) -> np.random.Generator:
-        """Get or create random number generator."""
-        if self._rng is None:
-            self._rng = np.random.default_rng(self._seed)
-        return self._rng
     
     def _build_time_grid(
         self,
@@ -133,31 +135,32 @@ class MonteCarloEngine(PricingEngine):
         Returns:
             Paths array [num_paths, num_steps+1, num_assets]
         """
-        rng = self._get_rng()
+        # One PCG64 stream per block via skip-ahead: a block's normals depend only
+        # on (seed, block index), so blocks can be processed in any order or in
+        # parallel, and repeated calls with the same seed reproduce the paths.
+        bit_generator = np.random.PCG64(self._seed)
+        dtype = self.dtype
+        L = np.ascontiguousarray(cholesky, dtype=dtype)
         
         # Initialize paths with spot
-        paths = np.zeros((num_paths, num_steps + 1, num_assets))
+        paths = np.empty((num_paths, num_steps + 1, num_assets), dtype=dtype)
         paths[:, 0, :] = spots
         
-        # Generate random numbers
-        # Shape: [num_paths, num_steps, num_assets]
-        Z = rng.standard_normal((num_paths, num_steps, num_assets))
-        
-        # Apply Cholesky for correlation
-        # Z_corr[p, t, :] = cholesky @ Z[p, t, :]
-        Z_corr = np.einsum('ij,ptj->pti', cholesky, Z)
+        # Per-step deterministic terms, broadcast over paths: [num_steps, num_assets]
+        drift_dt = ((drift - 0.5 * vol ** 2) * dt[:, None]).astype(dtype)
+        vol_sqrt_dt = (vol * np.sqrt(dt)[:, None]).astype(dtype)
+        log_spots = np.log(spots).astype(dtype)
         
-        # Simulate each step
-        for t in range(num_steps):
-            sqrt_dt = np.sqrt(dt[t])
+        # Simulate in blocks of paths; only the cumulative sum runs along time
+        for block_idx, b0 in enumerate(range(0, num_paths, self.block_size)):
+            block = min(self.block_size, num_paths - b0)
+            rng = block_generator(bit_generator, block_idx)
             
-            for a in range(num_assets):
-                # GBM: S(t+dt) = S(t) * exp((mu - 0.5*vol^2)*dt + vol*sqrt(dt)*Z)
-                log_return = (
-                    (drift[t, a] - 0.5 * vol[t, a] ** 2) * dt[t]
-                    + vol[t, a] * sqrt_dt * Z_corr[:, t, a]
-                )
-                paths[:, t + 1, a] = paths[:, t, a] * np.exp(log_return)
+            # Asset-major normals correlated with a single GEMM (see simulate_gbm_block)
+            simulate_gbm_block(
+                np, rng, block, L, drift_dt, vol_sqrt_dt, log_spots,
+                self.antithetic, dtype, out=paths[b0:b0 + block, 1:, :],
+            )
         
         return paths
     
@@ -243,50 +246,55 @@ class MonteCarloEngine(PricingEngine):
         
         # Build drift and vol arrays
         dt = np.diff(yf)
-        drift = np.zeros((num_steps, num_assets))
+        drift = np.empty((num_steps, num_assets))
         vol = np.zeros((num_steps, num_assets))
         
-        for t in range(num_steps):
-            for a_idx, asset in enumerate(assets):
-                underlying = market.underlyings[asset]
-                
-                # Get vol for this period
-                vol[t, a_idx] = underlying.vol_surface.get_instantaneous_vol(
-                    market.valuation_date, dates[t + 1]
-                )
-                
-                # Drift = risk-free rate - dividend yield (for risk-neutral measure)
-                r = market.rate_curve.zero_rate(market.valuation_date, dates[t + 1])
-                
-                # Get dividend adjustment (continuous yield approximation)
-                div_adj = underlying.dividend_model.get_dividend_adjustment(
-                    dates[t], dates[t + 1], spots[a_idx]
-                )
-                q = -np.log(div_adj) / dt[t] if dt[t] > 0 else 0.0
-                
-                drift[t, a_idx] = r - q
+        # Vols for the whole grid in one lookup per asset
+        step_end_ords = np.array([d.toordinal() for d in dates[1:]], dtype=np.int64)
+        for a_idx, asset in enumerate(assets):
+            vol[:, a_idx] = market.underlyings[asset].vol_surface.sigma_grid(
+                market.valuation_date, step_end_ords
+            )
+        
+        # Drift = risk-free rate - dividend yield (for risk-neutral measure);
+        # the zero rate to each step end is shared by all assets
+        r = market.rate_curve.zero_rate_grid(market.valuation_date, step_end_ords)
+        step_start_ords = np.array([d.toordinal() for d in dates[:-1]], dtype=np.int64)
+        
+        for a_idx, asset in enumerate(assets):
+            dividend_model = market.underlyings[asset].dividend_model
+            
+            # Get dividend adjustment (continuous yield approximation)
+            div_adj = dividend_model.adjustment_grid(step_start_ords, step_end_ords, spots[a_idx])
+            q = np.divide(-np.log(div_adj), dt, out=np.zeros(num_steps), where=dt > 0)
+            
+            drift[:, a_idx] = r - q
         
         # Generate paths
-        paths = self._generate_paths(
-            self.num_paths, num_assets, num_steps, dt,
-            drift, vol, cholesky, spots
-        )
+        if self.device == "cuda":
+            paths = generate_paths_gpu(
+                self.num_paths, dt, drift, vol, cholesky, spots,
+                seed=self._seed, block_size=self.block_size, antithetic=self.antithetic,
+                dtype=self.dtype,
+            )
+        else:
+            paths = self._generate_paths(
+                self.num_paths, num_assets, num_steps, dt,
+                drift, vol, cholesky, spots
+            )
         
         # ====================================================================
         # STUB: Event evaluation will be implemented in Phase B
         # For now, return basic statistics
         # ====================================================================
         
-        # Calculate terminal performances
-        final_spots = paths[:, -1, :]  # [num_paths, num_assets]
-        initial_spots = paths[:, 0, :]  # Should be spots for all paths
-        performances = final_spots / initial_spots
-        
-        # Worst-of performance at maturity
+        # Reduce across assets once per step: W[p, t] = worst-of (or best-of)
+        # performance, so all barrier logic reads [num_paths, num_steps+1]
+        performances = paths / spots.astype(paths.dtype)
         if product.worst_of:
-            worst_perf = np.min(performances, axis=1)
+            W = np.min(performances, axis=2)
         else:
-            worst_perf = np.max(performances, axis=1)
+            W = np.max(performances, axis=2)
         
         # Simple PV calculation (placeholder)
         # Full payoff evaluation will be in Phase B
@@ -295,16 +303,17 @@ class MonteCarloEngine(PricingEngine):
         # Placeholder: assume notional redemption at maturity
         pv_paths = product.notional * df_maturity * np.ones(self.num_paths)
         
-        # KI probability estimate (placeholder using final spot)
+        # KI probability over the whole path, not just the final spot
         ki_prob = 0.0
         if product.ki_barrier is not None:
             ki_level = product.ki_barrier.level
-            ki_breached = worst_perf <= ki_level
-            ki_prob = float(np.mean(ki_breached))
+            # Discretely monitored on the simulation grid
+            knocked = np.any(W[:, 1:] <= ki_level, axis=1)
+            ki_prob = float(np.count_nonzero(knocked)) / self.num_paths
         
-        # Compute results
-        pv = float(np.mean(pv_paths))
-        pv_std = float(np.std(pv_paths) / np.sqrt(self.num_paths))
+        # Compute results (float64 accumulation over float32 paths)
+        pv = float(np.sum(pv_paths, dtype=np.float64) / self.num_paths)
+        pv_std = float(np.std(pv_paths, dtype=np.float64) / np.sqrt(self.num_paths))
         
         end_time = time.perf_counter()
         
@@ -13,13 +13,28 @@ from dataclasses import dataclass, field
 from datetime import date
 from typing import Optional, List, Dict, Tuple, Iterator
 import logging
+import warnings
 import numpy as np
-from numpy.random import Generator, default_rng
+from numpy.random import PCG64, Generator, default_rng
+from scipy.special import ndtri
+from scipy.stats import qmc
 
 logger = logging.getLogger(__name__)
 
 from pricer.products.schema import TermSheet, VolModelType, DividendModelType
 from pricer.engines.grid import SimulationGrid, EventType, get_exdiv_schedule_for_underlying
+from pricer.engines._jit_kernels import HAS_NUMBA, bb_hit_probability, gbm_step_ki
+
+try:
+    import numexpr as ne
+    HAS_NUMEXPR = True
+except ImportError:
+    ne = None
+    HAS_NUMEXPR = False
+
+
+# Steps between re-gathering the paths still to be checked for knock-in
+_KI_COMPACT_STEPS = 4
 
 
 @dataclass
@@ -32,6 +47,8 @@ class PathGeneratorConfig:
     dtype: np.dtype = np.float32  # Use float32 for paths (memory efficient)
     accumulator_dtype: np.dtype = np.float64  # Use float64 for accumulators
     block_size: int = 50_000      # Max paths per block
+    use_jit: Optional[bool] = None  # Fused Numba step kernel (default: if installed)
+    use_qmc: bool = False         # Scrambled Sobol spot normals with Brownian bridge construction
 
 
 @dataclass
@@ -40,7 +57,8 @@ class SimulatedPaths:
     Result of path simulation.
     
     Attributes:
-        spots: Spot paths [num_paths, num_steps+1, num_assets]
+        spots: Spot paths [num_paths, num_steps+1, num_assets] (a view of an
+            asset-major buffer when produced by PathGenerator)
         ki_state: Knock-in state per path [num_paths] (True if knocked in)
         ki_step: Step at which KI occurred (or -1) [num_paths]
     """
@@ -50,6 +68,49 @@ class SimulatedPaths:
     ki_step: np.ndarray
 
 
+@dataclass
+class PathRandoms:
+    """
+    Random draws for one simulation, shareable across bumped scenarios.
+    
+    Reusing the same draws for base and bumped market data gives Common
+    Random Numbers without re-running the RNG or the Cholesky correlation.
+    All draws are step- then asset-major, so each (step, asset) row of paths
+    is contiguous.
+    
+    Attributes:
+        Z_corr: Correlated spot normals [num_steps, num_assets, num_paths]
+        U_ki: Uniforms for Brownian bridge KI [num_steps, num_assets, num_paths]
+            (None without a KI barrier)
+        Z_var: Variance normals for LSV assets [num_steps, num_lsv, num_paths] (or None)
+        U_var: QE uniforms for LSV assets [num_steps, num_lsv, num_paths] (or None)
+    """
+    
+    Z_corr: np.ndarray
+    U_ki: Optional[np.ndarray]
+    Z_var: Optional[np.ndarray] = None
+    U_var: Optional[np.ndarray] = None
+
+
+def block_generator(bit_generator: np.random.PCG64, block_idx: int) -> Generator:
+    """
+    Create an independent RNG for one simulation block.
+    
+    Each block draws from ``bit_generator`` jumped ``block_idx`` times
+    (each jump advances PCG64 by 2^127 draws), so a block's numbers depend
+    only on the seed and its index - not on how many numbers earlier blocks
+    consumed, or on the order in which blocks are processed.
+    
+    Args:
+        bit_generator: Base PCG64 bit generator (seeded once per pricing)
+        block_idx: Zero-based block index
+        
+    Returns:
+        Generator for the block
+    """
+    return Generator(bit_generator.jumped(block_idx))
+
+
 def build_correlation_matrix(
     term_sheet: TermSheet
 ) -> np.ndarray:
@@ -70,25 +131,26 @@ def build_correlation_matrix(
     if term_sheet.correlation is None:
         return corr
     
-    # Get asset order
-    asset_ids = [u.id for u in term_sheet.underlyings]
-    
     if term_sheet.correlation.matrix is not None:
         return np.array(term_sheet.correlation.matrix)
     
     if term_sheet.correlation.pairwise is not None:
+        # Asset id -> position, built once instead of list.index per pair
+        asset_index: Dict[str, int] = {}
+        for idx, underlying in enumerate(term_sheet.underlyings):
+            asset_index.setdefault(underlying.id, idx)
+        
         for pair, rho in term_sheet.correlation.pairwise.items():
             # Parse "AAPL_GOOG" format
             assets = pair.split("_")
             if len(assets) != 2:
                 continue
-            try:
-                i = asset_ids.index(assets[0])
-                j = asset_ids.index(assets[1])
-                corr[i, j] = rho
-                corr[j, i] = rho
-            except ValueError:
+            i = asset_index.get(assets[0])
+            j = asset_index.get(assets[1])
+            if i is None or j is None:
                 continue
+            corr[i, j] = rho
+            corr[j, i] = rho
     
     return corr
 
@@ -119,6 +181,14 @@ def validate_and_fix_correlation(corr: np.ndarray, epsilon: float = 1e-8) -> np.
         corr = np.clip(corr, -1.0, 1.0)
         np.fill_diagonal(corr, 1.0)
     
+    # A successful Cholesky factorization proves positive definiteness,
+    # so the common valid case never needs the eigendecomposition
+    try:
+        np.linalg.cholesky(corr)
+        return corr
+    except np.linalg.LinAlgError:
+        pass
+    
     # Check eigenvalues for PSD
     eigenvalues, eigenvectors = np.linalg.eigh(corr)
     min_eigenvalue = np.min(eigenvalues)
@@ -144,9 +214,31 @@ def validate_and_fix_correlation(corr: np.ndarray, epsilon: float = 1e-8) -> np.
     return corr
 
 
+# Diagonal jitter tried in turn when a repaired correlation matrix is only
+# positive semi-definite (zero eigenvalues defeat the factorization)
+_CHOLESKY_JITTER = (0.0, 1e-10, 1e-8, 1e-6, 1e-4)
+
+
 def compute_cholesky(corr: np.ndarray) -> np.ndarray:
-    """Compute Cholesky decomposition (lower triangular)."""
+    """
+    Compute Cholesky decomposition (lower triangular).
+    
+    If the validated matrix does not factorize, it is shrunk towards the
+    identity, (corr + jitter*I) / (1 + jitter), with increasing jitter so
+    the diagonal stays one.
+    """
     corr = validate_and_fix_correlation(corr)
+    identity = np.eye(corr.shape[0])
+    
+    for jitter in _CHOLESKY_JITTER:
+        try:
+            L = np.linalg.cholesky((corr + jitter * identity) / (1.0 + jitter))
+        except np.linalg.LinAlgError:
+            continue
+        if jitter > 0:
+            logger.warning(f"Correlation matrix needed jitter {jitter:g} to factorize")
+        return L
+    
     return np.linalg.cholesky(corr)
 
 
@@ -156,7 +248,8 @@ def brownian_bridge_hit_probability(
     barrier: np.ndarray,
     vol: np.ndarray,
     dt: float,
-    down: bool = True
+    down: bool = True,
+    use_jit: Optional[bool] = None
 ) -> np.ndarray:
     """
     Compute probability of hitting barrier using Brownian bridge in log-space.
@@ -171,6 +264,8 @@ def brownian_bridge_hit_probability(
         vol: Volatility for the period
         dt: Time step
         down: True for down barrier, False for up
+        use_jit: Evaluate with the compiled loop kernel (default: if Numba
+            is installed)
         
     Returns:
         Hit probabilities [num_paths] or [num_paths, num_assets]
@@ -178,49 +273,119 @@ def brownian_bridge_hit_probability(
     if dt <= 0:
         return np.zeros_like(S_start)
     
+    use_jit = HAS_NUMBA if use_jit is None else (use_jit and HAS_NUMBA)
+    shape = np.broadcast_shapes(
+        np.shape(S_start), np.shape(S_end), np.shape(barrier), np.shape(vol)
+    )
+    if use_jit and len(shape) <= 2:
+        # One fused pass over broadcast views, no masked gathers
+        shape_2d = (1,) * (2 - len(shape)) + shape
+        prob = np.empty(shape_2d)
+        bb_hit_probability(
+            *(np.broadcast_to(x, shape_2d) for x in (S_start, S_end, barrier, vol)),
+            float(dt), down, prob,
+        )
+        return prob.reshape(shape)
+    
     # Already hit at endpoints
     if down:
-        hit_start = S_start <= barrier
-        hit_end = S_end <= barrier
+        hit = (S_start <= barrier) | (S_end <= barrier)
     else:
-        hit_start = S_start >= barrier
-        hit_end = S_end >= barrier
-    
-    # Probability from Brownian bridge
-    # Only compute for paths that haven't already hit
-    prob = np.zeros_like(S_start, dtype=np.float64)
+        hit = (S_start >= barrier) | (S_end >= barrier)
     
-    # Mask for paths in the "interior" (neither endpoint hits)
-    in_interior = ~hit_start & ~hit_end
+    # Certain hit if an endpoint touches; the bridge formula is evaluated
+    # only on the compacted "interior" entries (neither endpoint hits)
+    prob = hit.astype(np.float64)
+    in_interior = ~hit
     
     if np.any(in_interior):
-        log_s_start = np.log(np.where(in_interior, S_start, 1.0))
-        log_s_end = np.log(np.where(in_interior, S_end, 1.0))
-        log_barrier = np.log(barrier)
-        
-        if down:
-            # log(S/H) = log(S) - log(H)
-            log_ratio_start = log_s_start - log_barrier
-            log_ratio_end = log_s_end - log_barrier
-        else:
+        shape = S_start.shape
+        log_barrier = np.log(np.broadcast_to(barrier, shape)[in_interior])
+        log_ratio_start = np.log(S_start[in_interior]) - log_barrier
+        log_ratio_end = np.log(S_end[in_interior]) - log_barrier
+        if not down:
             # For up barrier: log(H/S)
-            log_ratio_start = log_barrier - log_s_start
-            log_ratio_end = log_barrier - log_s_end
+            log_ratio_start = -log_ratio_start
+            log_ratio_end = -log_ratio_end
         
         # Brownian bridge formula
-        variance = vol * vol * dt
-        exponent = -2.0 * log_ratio_start * log_ratio_end / np.where(
-            in_interior, variance, 1.0
-        )
+        vol_interior = np.broadcast_to(vol, shape)[in_interior]
+        variance = vol_interior * vol_interior * dt
+        exponent = -2.0 * log_ratio_start * log_ratio_end / variance
         
-        prob = np.where(in_interior, np.exp(np.minimum(exponent, 0)), prob)
-    
-    # Certain hit if endpoint touches
-    prob = np.where(hit_start | hit_end, 1.0, prob)
+        prob[in_interior] = np.exp(np.minimum(exponent, 0))
     
     return prob
 
 
+def brownian_bridge_order(num_points: int) -> np.ndarray:
+    """
+    Order in which a Brownian bridge fills in num_points grid points.
+    
+    The terminal point comes first, then the midpoints of ever finer
+    bisections, so the leading (best distributed) QMC dimensions drive the
+    coarse shape of the path.
+    
+    Args:
+        num_points: Number of grid points after time 0
+        
+    Returns:
+        Point indices (0-based) in construction order [num_points]
+    """
+    if num_points == 0:
+        return np.empty(0, dtype=np.int64)
+    
+    order = [num_points - 1]
+    intervals = [(-1, num_points - 1)]  # (known left, known right), -1 = time 0
+    while intervals:
+        next_intervals = []
+        for left, right in intervals:
+            mid = (left + right + 1) // 2
+            if mid == right:
+                continue
+            order.append(mid)
+            next_intervals += [(left, mid), (mid, right)]
+        intervals = next_intervals
+    
+    return np.array(order, dtype=np.int64)
+
+
+def brownian_bridge_normals(z: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """
+    Turn normals in bridge order into per-step normals via a Brownian bridge.
+    
+    Args:
+        z: Standard normals [num_paths, num_points, num_assets], column k
+            driving the k-th point of brownian_bridge_order(num_points)
+        times: Increasing times of the grid points (after time 0) [num_points]
+        
+    Returns:
+        Standard normals of the Brownian increments per step
+        [num_paths, num_points, num_assets]
+    """
+    num_points = times.shape[0]
+    order = brownian_bridge_order(num_points)
+    t = np.concatenate([[0.0], times])
+    
+    # W at t[0] = 0 and t[1:] as points get filled in
+    W = np.zeros((z.shape[0], num_points + 1, z.shape[2]))
+    known = [0]
+    for k, i in enumerate(order + 1):
+        pos = np.searchsorted(known, i)
+        left = known[pos - 1]
+        if pos == len(known):
+            # Terminal point: unconditional
+            W[:, i] = np.sqrt(t[i] - t[left]) * z[:, k]
+        else:
+            right = known[pos]
+            w_right = (t[i] - t[left]) / (t[right] - t[left])
+            std = np.sqrt((t[i] - t[left]) * (t[right] - t[i]) / (t[right] - t[left]))
+            W[:, i] = (1 - w_right) * W[:, left] + w_right * W[:, right] + std * z[:, k]
+        known.insert(pos, i)
+    
+    return np.diff(W, axis=1) / np.sqrt(np.diff(t))[None, :, None]
+
+
 class PathGenerator:
     """
     Monte Carlo path generator with Brownian bridge barrier monitoring.
@@ -251,7 +416,7 @@ class PathGenerator:
         self.cholesky = compute_cholesky(self.corr)
         
         # Extract initial spots
-        self.spots_0 = np.array([u.spot for u in term_sheet.underlyings])
+        self.spots_0 = term_sheet.spot_array
         
         # Build vol term structure per asset
         self._build_vol_arrays()
@@ -259,6 +424,9 @@ class PathGenerator:
         # Build dividend structures
         self._build_dividend_arrays()
         
+        # Per-step GBM drift and diffusion terms
+        self._build_step_terms()
+        
         # KI barrier
         self.ki_level = None
         self.ki_barriers = None  # Absolute levels
@@ -270,6 +438,8 @@ class PathGenerator:
         self._rng: Optional[Generator] = None
         if config.seed is not None:
             self._rng = default_rng(config.seed)
+        
+        self.use_jit = HAS_NUMBA if config.use_jit is None else (config.use_jit and HAS_NUMBA)
     
     def _build_vol_arrays(self) -> None:
         """Build volatility for each time step and asset."""
@@ -279,6 +449,8 @@ class PathGenerator:
         # Track which assets use LSV
         self.lsv_assets = []  # List of (asset_idx, LSVParams)
         
+        step_ords = np.array([d.toordinal() for d in self.grid.dates], dtype=np.int64)
+        
         for a_idx, underlying in enumerate(self.ts.underlyings):
             vol_model = underlying.vol_model
             
@@ -287,15 +459,17 @@ class PathGenerator:
             
             elif vol_model.type == VolModelType.PIECEWISE_CONSTANT:
                 tenors = vol_model.term_structure or []
+                if not tenors:
+                    self.vols[:, a_idx] = 0.20
+                    continue
                 
-                for step_idx, step_date in enumerate(self.grid.dates):
-                    # Find applicable vol
-                    vol = tenors[-1].vol if tenors else 0.20
-                    for tenor in tenors:
-                        if step_date <= tenor.date:
-                            vol = tenor.vol
-                            break
-                    self.vols[step_idx, a_idx] = vol
+                # Each bucket's vol applies up to and including its tenor date,
+                # flat extrapolation after the last tenor
+                tenor_ords = np.array([t.date.toordinal() for t in tenors], dtype=np.int64)
+                tenor_vols = np.array([t.vol for t in tenors])
+                order = np.argsort(tenor_ords, kind="stable")
+                idx = np.searchsorted(tenor_ords[order], step_ords, side="left")
+                self.vols[:, a_idx] = tenor_vols[order][np.minimum(idx, len(tenors) - 1)]
             
             elif vol_model.type == VolModelType.LOCAL_STOCHASTIC:
                 # LSV: store params, initial vol from sqrt(v0)
@@ -322,12 +496,64 @@ class PathGenerator:
                         self.discrete_divs[grid_idx] = {}
                     self.discrete_divs[grid_idx][a_idx] = amount
         
+        # Same schedule as a dense [num_steps+1, num_assets] array (0 = no dividend)
+        self.div_amounts = np.zeros((self.grid.num_steps + 1, self.num_assets))
+        for grid_idx, divs in self.discrete_divs.items():
+            for a_idx, amount in divs.items():
+                self.div_amounts[grid_idx, a_idx] = amount
+        
         # Continuous yield per asset
         self.cont_yields = np.zeros(self.num_assets)
         for a_idx, underlying in enumerate(self.ts.underlyings):
             if underlying.dividend_model.continuous_yield is not None:
                 self.cont_yields[a_idx] = underlying.dividend_model.continuous_yield
     
+    def _build_step_terms(self) -> None:
+        """
+        Precompute per-step log-return terms of the deterministic vols.
+        
+        drift_dt[step] = (r - q - vol^2 / 2) * dt and vol_sqrtdt[step] =
+        vol * sqrt(dt) for the step from grid date step to step+1, both
+        [num_steps, num_assets] in the path dtype. LSV assets get sqrt(v0)
+        here and are recomputed per path during simulation, from the QE
+        moment constants in _step_consts ([num_steps, num_lsv] each).
+        """
+        r = self.ts.discount_curve.flat_rate or 0.0
+        dt = self.grid.dt[1:, None]
+        vol = self.vols[1:]
+        dtype = self.config.dtype
+        
+        self.drift_dt = ((r - self.cont_yields - 0.5 * vol * vol) * dt).astype(dtype)
+        self.vol_sqrtdt = (vol * np.sqrt(dt)).astype(dtype)
+        
+        # QE conditional moments of V(t+dt) given V(t):
+        # m = m_const + V * exp_kappa_dt, s2 = V * s2_slope + s2_const
+        kappa = np.array([params.kappa for _, params in self.lsv_assets])
+        theta = np.array([params.theta for _, params in self.lsv_assets])
+        xi = np.array([params.xi for _, params in self.lsv_assets])
+        exp_kappa_dt = np.exp(-kappa * dt)
+        self._step_consts: Dict[str, np.ndarray] = {
+            "exp_kappa_dt": exp_kappa_dt,
+            "m_const": theta * (1 - exp_kappa_dt),
+            "s2_slope": xi**2 * exp_kappa_dt * (1 - exp_kappa_dt) / kappa,
+            "s2_const": theta * xi**2 * (1 - exp_kappa_dt)**2 / (2 * kappa),
+        }
+    
+    def rebuild_spots(self, spots_0: np.ndarray) -> None:
+        """
+        Re-point the generator at new initial spots.
+        
+        Spot-only bumps (delta) leave the grid, vols, dividends and
+        correlation unchanged, so only the spots and absolute KI barriers
+        are rebuilt. The term sheet reference is left as is.
+        
+        Args:
+            spots_0: New initial spots [num_assets]
+        """
+        self.spots_0 = np.asarray(spots_0, dtype=np.float64)
+        if self.ki_level is not None:
+            self.ki_barriers = self.spots_0 * self.ki_level
+    
     def _get_rng(self) -> Generator:
         """Get or create RNG."""
         if self._rng is None:
@@ -339,168 +565,427 @@ class PathGenerator:
         self.config.seed = seed
         self._rng = default_rng(seed)
     
-    def generate(self) -> SimulatedPaths:
+    def draw_randoms(
+        self,
+        num_paths: Optional[int] = None,
+        rng: Optional[Generator] = None
+    ) -> PathRandoms:
+        """
+        Draw all random numbers for one simulation.
+        
+        Draw order matches a single generate() call, so passing the result to
+        generate() on several bumped generators reproduces CRN repricing.
+        
+        Args:
+            num_paths: Number of paths to draw for (default: config.num_paths)
+            rng: Generator to draw from (default: this generator's RNG)
+        
+        Returns:
+            PathRandoms for num_paths x num_steps
+        """
+        rng = rng or self._get_rng()
+        
+        num_paths = num_paths or self.config.num_paths
+        num_steps = self.grid.num_steps
+        num_assets = self.num_assets
+        dtype = self.config.dtype
+        
+        # Antithetic: draw spot normals for the first half of the paths only;
+        # the second half reuses them with the sign flipped (not with QMC,
+        # whose points are already balanced)
+        antithetic = self.config.antithetic and not self.config.use_qmc
+        num_draws = (num_paths + 1) // 2 if antithetic else num_paths
+        
+        # Generate all random numbers upfront, drawn directly in the path dtype
+        # into preallocated buffers (no float64 intermediate and copy)
+        if self.config.use_qmc:
+            Z = self._sobol_normals(num_paths, rng)
+        else:
+            Z = np.empty((num_steps, num_assets, num_draws), dtype=dtype)
+            rng.standard_normal(dtype=dtype, out=Z)
+        
+        # For Brownian bridge KI, also need uniform draws for probabilistic check
+        U_ki = None
+        if self.ki_barriers is not None:
+            U_ki = np.empty((num_steps, num_assets, num_paths), dtype=dtype)
+            rng.random(dtype=dtype, out=U_ki)
+        
+        # LSV: variance normals, then per-step QE uniforms
+        Z_var = None
+        U_var = None
+        if self.lsv_assets:
+            num_lsv = len(self.lsv_assets)
+            Z_var = np.empty((num_steps, num_lsv, num_paths), dtype=dtype)
+            rng.standard_normal(dtype=dtype, out=Z_var)
+            U_var = np.zeros((num_steps, num_lsv, num_paths), dtype=dtype)
+            for step in range(num_steps):
+                if self.grid.dt[step + 1] <= 0:
+                    continue
+                for lsv_idx in range(num_lsv):
+                    rng.random(dtype=dtype, out=U_var[step, lsv_idx])
+        
+        # Correlate: Z_corr = L @ Z where L is lower Cholesky, one GEMM per
+        # step over all paths in the draws' dtype (sgemm for float32)
+        L = np.ascontiguousarray(self.cholesky, dtype=dtype)
+        Z_corr = np.empty((num_steps, num_assets, num_paths), dtype=dtype)
+        np.matmul(L, Z, out=Z_corr[:, :, :num_draws])
+        
+        # Correlation is linear, so the mirrored half is the negated product
+        np.negative(Z_corr[:, :, :num_paths - num_draws], out=Z_corr[:, :, num_draws:])
+        
+        return PathRandoms(Z_corr=Z_corr, U_ki=U_ki, Z_var=Z_var, U_var=U_var)
+    
+    @property
+    def randoms_layout(self) -> Tuple[int, bool, int]:
+        """
+        Shape of the draws this generator needs: (num_assets, KI uniforms
+        drawn, number of LSV assets).
+        
+        Generators with equal layouts can share one set of PathRandoms.
+        """
+        return self.num_assets, self.ki_barriers is not None, len(self.lsv_assets)
+    
+    def _check_randoms(self, randoms: PathRandoms) -> None:
+        """
+        Check that pre-drawn randoms provide every draw generate() reads.
+        
+        Raises:
+            ValueError: If the draws were made for a different asset count,
+                lack KI uniforms this generator needs, or lack (or mismatch)
+                its LSV variance draws
+        """
+        num_assets, needs_ki, num_lsv = self.randoms_layout
+        if randoms.Z_corr.shape[1] != num_assets:
+            raise ValueError(
+                f"PathRandoms drawn for {randoms.Z_corr.shape[1]} assets, "
+                f"generator has {num_assets}"
+            )
+        if needs_ki and randoms.U_ki is None:
+            raise ValueError(
+                "PathRandoms have no KI uniforms but the term sheet has a KI barrier"
+            )
+        if num_lsv and (
+            randoms.Z_var is None or randoms.U_var is None or randoms.Z_var.shape[1] != num_lsv
+        ):
+            raise ValueError(
+                f"PathRandoms lack variance draws for the term sheet's {num_lsv} LSV assets"
+            )
+    
+    @property
+    def num_blocks(self) -> int:
+        """Number of config.block_size blocks (at least one, even for 0 paths)."""
+        return max(1, -(-self.config.num_paths // max(1, self.config.block_size)))
+    
+    def _block_num_paths(self, block_idx: int) -> int:
+        """Number of paths in a block (the last block may be short)."""
+        block_size = max(1, min(self.config.block_size, self.config.num_paths))
+        return max(0, min(block_size, self.config.num_paths - block_idx * block_size))
+    
+    def _sobol_normals(self, num_paths: int, rng: Generator) -> np.ndarray:
+        """
+        Spot normals from a scrambled Sobol sequence with Brownian bridge construction.
+        
+        One Sobol dimension per (step, asset) with dt > 0, scrambled from
+        rng so each block is an independent randomized QMC replicate.
+        Zero-length steps get zero normals (they do not move the spots).
+        
+        Args:
+            num_paths: Number of paths (Sobol points)
+            rng: Generator seeding the scramble
+            
+        Returns:
+            Uncorrelated normals [num_steps, num_assets, num_paths]
+        """
+        num_steps = self.grid.num_steps
+        num_assets = self.num_assets
+        Z = np.zeros((num_steps, num_assets, num_paths), dtype=self.config.dtype)
+        
+        dt = self.grid.dt[1:]
+        steps = np.flatnonzero(dt > 0)
+        if num_paths == 0 or steps.size == 0:
+            return Z
+        
+        sobol = qmc.Sobol(d=steps.size * num_assets, scramble=True, seed=rng)
+        with warnings.catch_warnings():
+            # Balance is best at powers of 2, but any prefix is a valid QMC set
+            warnings.filterwarnings("ignore", message="The balance properties", category=UserWarning)
+            u = sobol.random(num_paths)
+        
+        z = ndtri(u).reshape(num_paths, steps.size, num_assets)
+        Z[steps] = brownian_bridge_normals(z, np.cumsum(dt[steps])).transpose(1, 2, 0)
+        return Z
+    
+    def iter_block_randoms(self) -> Iterator[PathRandoms]:
+        """
+        Draw random numbers block by block, config.block_size paths at a time.
+        
+        The first block continues this generator's RNG stream, so a single
+        block draws exactly what draw_randoms() would; block b > 0 draws from
+        that stream's state jumped b times (see block_generator).
+        
+        Yields:
+            PathRandoms per block, in path order
+        """
+        rng = self._get_rng()
+        base = rng.bit_generator.jumped(0)  # Snapshot before block 0 draws
+        
+        for block_idx in range(self.num_blocks):
+            block_rng = rng if block_idx == 0 else block_generator(base, block_idx)
+            yield self.draw_randoms(self._block_num_paths(block_idx), block_rng)
+    
+    def block_randoms(self, block_idx: int) -> PathRandoms:
+        """
+        Draw the random numbers of one block directly from config.seed.
+        
+        Gives the same draws as iter_block_randoms() on a freshly seeded
+        generator, without drawing the earlier blocks, so blocks can be
+        simulated independently (e.g. in worker processes).
+        
+        Args:
+            block_idx: Zero-based block index
+            
+        Returns:
+            PathRandoms for the block
+        """
+        rng = block_generator(PCG64(self.config.seed), block_idx)
+        return self.draw_randoms(self._block_num_paths(block_idx), rng)
+    
+    def generate_blocks(self) -> Iterator[SimulatedPaths]:
+        """
+        Generate paths block by block.
+        
+        Only one block of random numbers and spot paths is alive at a time,
+        so peak memory scales with config.block_size instead of num_paths.
+        
+        Yields:
+            SimulatedPaths per block, in path order
+        """
+        for randoms in self.iter_block_randoms():
+            yield self.generate(randoms)
+    
+    def generate(self, randoms: Optional[PathRandoms] = None) -> SimulatedPaths:
         """
         Generate Monte Carlo paths.
         
+        Args:
+            randoms: Pre-drawn random numbers (e.g. shared with other bumped
+                scenarios). Drawn from this generator's RNG if None.
+        
         Returns:
             SimulatedPaths with spots and KI state
+        
+        Raises:
+            ValueError: If randoms lack draws this generator needs
         """
-        rng = self._get_rng()
+        if randoms is None:
+            randoms = self.draw_randoms()
+        else:
+            self._check_randoms(randoms)
         
-        num_paths = self.config.num_paths
+        num_paths = randoms.Z_corr.shape[2]
         num_steps = self.grid.num_steps
         num_assets = self.num_assets
         dtype = self.config.dtype
         
+        Z_corr = randoms.Z_corr
+        U_ki = randoms.U_ki
+        Z_var = randoms.Z_var
+        
         # Get discount rate from term sheet
         r = self.ts.discount_curve.flat_rate or 0.0
         
-        # Initialize arrays
-        spots = np.zeros((num_paths, num_steps + 1, num_assets), dtype=dtype)
-        spots[:, 0, :] = self.spots_0
+        # Asset-major buffer [num_steps+1, num_assets, num_paths]: each step's
+        # per-asset row of paths is contiguous; every step is written once
+        S = np.empty((num_steps + 1, num_assets, num_paths), dtype=dtype)
+        S[0] = self.spots_0[:, None]
+        
+        # Per-step scratch for log return -> growth factor in the path dtype
+        # (float32 halves the memory traffic of the exp and multiply; the
+        # rounding is far below MC error), reused across steps
+        growth = np.empty((num_assets, num_paths), dtype=dtype)
         
         ki_state = np.zeros(num_paths, dtype=bool)
         ki_step = np.full(num_paths, -1, dtype=np.int32)
+        no_barriers = np.empty(0)
+        ki_barriers = self.ki_barriers if self.ki_barriers is not None else no_barriers
+        # Stays False without a barrier; cleared once every path has knocked in
+        ki_pending = self.ki_barriers is not None
+        # Unread stand-in for the kernel's uniforms when the KI check is off
+        no_uniforms = np.empty((num_assets, 1), dtype=dtype)
+        # NumPy KI check: indices of paths not yet knocked in, refreshed every
+        # _KI_COMPACT_STEPS steps (may briefly include knocked-in paths)
+        alive_idx = np.arange(num_paths)
+        if ki_pending:
+            barrier_col = self.ki_barriers[:, None]  # [num_assets, 1]
         
-        # Generate all random numbers upfront
-        Z = rng.standard_normal((num_paths, num_steps, num_assets)).astype(dtype)
-        
-        # For Brownian bridge KI, also need uniform draws for probabilistic check
-        U_ki = rng.uniform(0, 1, (num_paths, num_steps, num_assets)).astype(dtype)
-        
-        # LSV: Initialize variance paths and generate additional randoms for variance
-        variance = np.zeros((num_paths, num_assets), dtype=dtype)
-        Z_var = None
-        if self.lsv_assets:
-            Z_var = rng.standard_normal((num_paths, num_steps, len(self.lsv_assets))).astype(dtype)
-            for lsv_idx, (a_idx, params) in enumerate(self.lsv_assets):
-                variance[:, a_idx] = params.v0
-        
-        # Correlate: Z_corr = Z @ L^T where L is lower Cholesky
-        Z_corr = np.einsum('ijk,lk->ijl', Z, self.cholesky)
+        # LSV: Initialize variance paths
+        variance = np.zeros((num_assets, num_paths), dtype=dtype)
+        for a_idx, params in self.lsv_assets:
+            variance[a_idx] = params.v0
         
         # Simulate step by step
         for step in range(num_steps):
             dt = self.grid.dt[step + 1]
             
             if dt <= 0:
-                spots[:, step + 1, :] = spots[:, step, :]
+                S[step + 1] = S[step]
                 continue
             
-            sqrt_dt = np.sqrt(dt)
+            S_prev = S[step]      # [num_assets, num_paths]
+            S_next = S[step + 1]
+            Z_t = Z_corr[step]
             
             # Get vol for this step (use step+1 date's vol)
-            vol = self.vols[step + 1, :].copy()  # [num_assets]
+            vol = self.vols[step + 1, :]  # [num_assets], read-only below
             
             # LSV: Update variance and use sqrt(V) as vol for LSV assets
             if self.lsv_assets:
                 for lsv_idx, (a_idx, params) in enumerate(self.lsv_assets):
-                    V = variance[:, a_idx]
+                    V = variance[a_idx]
                     
                     # QE (Quadratic Exponential) scheme for variance
                     # Reference: Andersen (2008)
-                    kappa, theta, xi = params.kappa, params.theta, params.xi
-                    rho = params.rho
                     
-                    # Exp decay
-                    exp_kappa_dt = np.exp(-kappa * dt)
+                    # Step constants of the conditional moments (scalars,
+                    # precomputed per step and asset at construction)
+                    exp_kappa_dt = self._step_consts["exp_kappa_dt"][step, lsv_idx]
+                    m_const = self._step_consts["m_const"][step, lsv_idx]
+                    s2_slope = self._step_consts["s2_slope"][step, lsv_idx]
+                    s2_const = self._step_consts["s2_const"][step, lsv_idx]
                     
                     # Mean and variance of V(t+dt) given V(t)
-                    m = theta + (V - theta) * exp_kappa_dt
-                    s2 = V * xi**2 * exp_kappa_dt * (1 - exp_kappa_dt) / kappa
-                    s2 += theta * xi**2 * (1 - exp_kappa_dt)**2 / (2 * kappa)
-                    s2 = np.maximum(s2, 1e-10)  # Ensure positive
+                    m = m_const + V * exp_kappa_dt
+                    s2 = np.maximum(V * s2_slope + s2_const, 1e-10)  # Ensure positive
                     
                     # Psi = s2 / m^2
-                    psi = s2 / np.maximum(m**2, 1e-10)
+                    psi = s2 / np.maximum(m * m, 1e-10)
                     
                     # QE switching threshold
                     psi_c = 1.5
                     
-                    # Generate uniform for inverse CDF
-                    U_v = rng.uniform(0, 1, num_paths).astype(dtype)
+                    # Uniform for inverse CDF
+                    U_v = randoms.U_var[step, lsv_idx]
                     
-                    # Case 1: psi <= psi_c (use moment matching)
+                    # Each case is evaluated on its own subset of paths only
+                    V_new = np.empty_like(V)
                     mask_low = psi <= psi_c
-                    b2 = np.where(mask_low, 2 / psi - 1 + np.sqrt(2 / psi) * np.sqrt(2 / psi - 1), 0)
-                    b2 = np.maximum(b2, 0)
-                    a = np.where(mask_low, m / (1 + b2), 0)
-                    V_new_low = a * (np.sqrt(b2) + Z_var[:, step, lsv_idx])**2
+                    mask_high = ~mask_low
+                    
+                    # Case 1: psi <= psi_c (use moment matching)
+                    two_over_psi = 2 / psi[mask_low]
+                    b2 = np.maximum(
+                        two_over_psi - 1 + np.sqrt(two_over_psi) * np.sqrt(two_over_psi - 1), 0
+                    )
+                    a = m[mask_low] / (1 + b2)
+                    V_new[mask_low] = a * (np.sqrt(b2) + Z_var[step, lsv_idx][mask_low])**2
                     
                     # Case 2: psi > psi_c (use exponential approximation)
-                    p = np.where(~mask_low, (psi - 1) / (psi + 1), 0)
-                    beta = np.where(~mask_low, (1 - p) / np.maximum(m, 1e-10), 0)
-                    V_new_high = np.where(
-                        U_v <= p,
+                    psi_high = psi[mask_high]
+                    U_high = U_v[mask_high]
+                    p = (psi_high - 1) / (psi_high + 1)
+                    beta = (1 - p) / np.maximum(m[mask_high], 1e-10)
+                    V_new[mask_high] = np.where(
+                        U_high <= p,
                         0,
-                        np.log((1 - p) / np.maximum(1 - U_v, 1e-10)) / np.maximum(beta, 1e-10)
+                        np.log((1 - p) / np.maximum(1 - U_high, 1e-10)) / np.maximum(beta, 1e-10)
                     )
                     
-                    # Combine
-                    V_new = np.where(mask_low, V_new_low, V_new_high)
-                    V_new = np.maximum(V_new, 1e-10)  # Floor at small positive
+                    np.maximum(V_new, 1e-10, out=V_new)  # Floor at small positive
                     
-                    variance[:, a_idx] = V_new
+                    variance[a_idx] = V_new
                     
                     # Use average vol for this step (trapezoidal)
                     vol_step = np.sqrt(0.5 * (V + V_new))
                     
                     # Override vol array for this asset
-                    vol = np.broadcast_to(vol, (num_paths, num_assets)).copy()
-                    vol[:, a_idx] = vol_step
+                    if vol.ndim == 1:
+                        vol = np.repeat(vol[:, None], num_paths, axis=1)  # [num_assets, num_paths]
+                    vol[a_idx] = vol_step
                     
                     # Adjust spot diffusion for spot-vol correlation
                     # dS = ... + rho * (xi/sqrt(V)) * S * dV_normalized
                     # Already handled via correlation in Z_corr if assets are correlated
             
-            # Drift: r - q - 0.5*vol^2
-            drift = r - self.cont_yields - 0.5 * vol * vol  # [num_assets] or [num_paths, num_assets]
+            # Step vol as a column per asset: [num_assets, 1] or [num_assets, num_paths]
+            vol_col = vol if vol.ndim == 2 else vol[:, None]
             
-            # Log return
-            log_return = drift * dt + vol * sqrt_dt * Z_corr[:, step, :]
+            if self.use_jit:
+                # Drift, exp, dividend jump and KI check fused per path
+                gbm_step_ki(
+                    S_prev, S_next, Z_t, vol_col, r, self.cont_yields, dt,
+                    self.div_amounts[step + 1],
+                    ki_barriers if ki_pending else no_barriers,
+                    U_ki[step] if ki_pending else no_uniforms,
+                    ki_state, ki_step, step,
+                )
+                ki_pending = ki_pending and not ki_state.all()
+                continue
             
-            # Update spots
-            spots[:, step + 1, :] = spots[:, step, :] * np.exp(log_return)
+            if HAS_NUMEXPR and not self.lsv_assets:
+                # Log return, exp and spot update in one multi-threaded pass,
+                # written straight into the next step's rows
+                ne.evaluate(
+                    "S * exp(d + v * Z)",
+                    local_dict={
+                        "S": S_prev,
+                        "d": self.drift_dt[step][:, None],
+                        "v": self.vol_sqrtdt[step][:, None],
+                        "Z": Z_t,
+                    },
+                    out=S_next,
+                    casting="same_kind",
+                )
+            else:
+                # Log return, exponentiated in place; deterministic vols use
+                # the precomputed step terms, LSV paths carry their own vol
+                if self.lsv_assets:
+                    drift = r - self.cont_yields[:, None] - 0.5 * vol * vol  # [num_assets, num_paths]
+                    np.multiply(vol * np.sqrt(dt), Z_t, out=growth)
+                    growth += drift * dt
+                else:
+                    np.multiply(self.vol_sqrtdt[step][:, None], Z_t, out=growth)
+                    growth += self.drift_dt[step][:, None]
+                np.exp(growth, out=growth)
+                
+                # Update spots straight into the next step's rows
+                np.multiply(S_prev, growth, out=S_next)
             
-            # Apply discrete dividends (spot jump)
+            # Apply discrete dividends (spot jump) to all assets in one
+            # subtract; only paying assets are floored, at 0.01 to avoid
+            # negative spots
             if (step + 1) in self.discrete_divs:
-                for a_idx, div_amount in self.discrete_divs[step + 1].items():
-                    spots[:, step + 1, a_idx] = np.maximum(
-                        spots[:, step + 1, a_idx] - div_amount,
-                        0.01  # Floor at 0.01 to avoid negative spots
-                    )
+                div_col = self.div_amounts[step + 1][:, None]  # [num_assets, 1]
+                np.subtract(S_next, div_col, out=S_next, casting="same_kind")
+                np.maximum(S_next, 0.01, out=S_next, where=div_col > 0)
+            
+            # Continuous KI barrier check via Brownian bridge, all assets at
+            # once, on the paths that have not knocked in yet
+            if ki_pending and step % _KI_COMPACT_STEPS == 0:
+                alive_idx = np.flatnonzero(~ki_state)
+                ki_pending = alive_idx.size > 0
             
-            # Continuous KI barrier check via Brownian bridge
-            if self.ki_barriers is not None and not np.all(ki_state):
-                S_start = spots[:, step, :]     # [num_paths, num_assets]
-                S_end = spots[:, step + 1, :]   # [num_paths, num_assets]
+            if ki_pending:
+                cols = alive_idx if alive_idx.size < num_paths else slice(None)
+                hit_prob = brownian_bridge_hit_probability(
+                    S_prev[:, cols],        # [num_assets, num_alive]
+                    S_next[:, cols],
+                    barrier_col,            # [num_assets, 1]
+                    vol_col if vol_col.shape[1] == 1 else vol_col[:, cols],
+                    dt,
+                    down=True,
+                    use_jit=False  # This is the NumPy step; the kernel checks KI inline
+                )
                 
-                # Check each asset
-                for a_idx in range(num_assets):
-                    barrier = self.ki_barriers[a_idx]
-                    # Handle both 1D and 2D vol arrays
-                    if vol.ndim == 1:
-                        v = vol[a_idx]
-                    else:
-                        v = vol[:, a_idx]
-                    
-                    # Compute hit probability
-                    hit_prob = brownian_bridge_hit_probability(
-                        S_start[:, a_idx],
-                        S_end[:, a_idx],
-                        barrier,
-                        v,
-                        dt,
-                        down=True
-                    )
-                    
-                    # Probabilistic KI: if U < P(hit), then KI occurred
-                    new_ki = (~ki_state) & (U_ki[:, step, a_idx] < hit_prob)
-                    
-                    # Update state
-                    ki_step = np.where(new_ki & (ki_step < 0), step + 1, ki_step)
-                    ki_state = ki_state | new_ki
+                # Probabilistic KI: if U < P(hit) for any asset, then KI occurred
+                hit = np.any(U_ki[step][:, cols] < hit_prob, axis=0)
+                new_ki = alive_idx[hit & ~ki_state[alive_idx]]
+                
+                # Update state
+                ki_step[new_ki] = step + 1
+                ki_state[new_ki] = True
+        
+        # Path-major view [num_paths, num_steps+1, num_assets] of the buffer
+        spots = S.transpose(2, 0, 1)
         
         return SimulatedPaths(
             spots=spots,
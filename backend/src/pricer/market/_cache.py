@@ -0,0 +1,201 @@
+"""
+On-disk cache of daily close prices.
+
+Closes are stored per (ticker, day) in SQLite together with the day range
+already downloaded for each ticker, so a request only fetches the days
+outside that range (typically appending the days since the last run).
+Completed ranges are also memoized in memory.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import sqlite3
+import threading
+
+import numpy as np
+
+
+# fetch(tickers, first_day, last_day) -> (day ordinals [T], closes [T, K]),
+# both days inclusive, NaN where a ticker has no close
+CloseFetcher = Callable[[List[str], int, int], Tuple[np.ndarray, np.ndarray]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS closes (
+    ticker TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    close REAL NOT NULL,
+    PRIMARY KEY (ticker, day)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    ticker TEXT PRIMARY KEY,
+    first_day INTEGER NOT NULL,
+    last_day INTEGER NOT NULL
+);
+"""
+
+
+class ClosePriceCache:
+    """
+    Two-tier (memory + SQLite) cache of daily closes.
+    
+    Days from today onwards are never marked as covered, so the live bar is
+    refetched (and overwritten) on every request that reaches it.
+    
+    Attributes:
+        path: SQLite database file
+        memo_size: Number of completed range queries kept in memory
+    """
+    
+    def __init__(self, path: Path, memo_size: int = 64) -> None:
+        self.path = Path(path)
+        self.memo_size = memo_size
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._memo: "OrderedDict[Tuple, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+    
+    def open(self) -> None:
+        """
+        Open the database now rather than on first use.
+        
+        Raises:
+            OSError: If the cache directory cannot be created
+            sqlite3.Error: If the database cannot be opened
+        """
+        with self._lock:
+            self._connect()
+    
+    def closes(
+        self,
+        tickers: List[str],
+        first_day: int,
+        last_day: int,
+        fetch: CloseFetcher,
+        today: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Daily closes for tickers over [first_day, last_day], fetching only
+        the days not yet cached.
+        
+        Args:
+            tickers: Stock tickers (column order of the result)
+            first_day: First day as a date ordinal
+            last_day: Last day as a date ordinal
+            fetch: Downloads closes for the missing days
+            today: Today's ordinal; days >= today are not marked cached
+        
+        Returns:
+            Tuple of (day ordinals [T], closes [T, num_tickers] with NaN
+            where a ticker has no close on a day)
+        """
+        key = (tuple(tickers), first_day, last_day)
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                return self._memo[key]
+            
+            conn = self._connect()
+            coverage = self._coverage(conn, tickers)
+            
+            # Group tickers that miss the same day range into one download
+            missing: Dict[Tuple[int, int], List[str]] = {}
+            for ticker in dict.fromkeys(tickers):
+                lo, hi = coverage.get(ticker, (None, None))
+                if lo is None:
+                    ranges = [(first_day, last_day)]
+                else:
+                    ranges = []
+                    if first_day < lo:
+                        ranges.append((first_day, lo - 1))
+                    if last_day > hi:
+                        ranges.append((hi + 1, last_day))
+                for day_range in ranges:
+                    missing.setdefault(day_range, []).append(ticker)
+            
+            for (lo, hi), group in missing.items():
+                days, values = fetch(group, lo, hi)
+                self._store(conn, group, days, values, lo, min(hi, today - 1))
+            conn.commit()
+            
+            result = self._read(conn, tickers, first_day, last_day)
+            if last_day < today and not missing:
+                self._memo[key] = result
+                if len(self._memo) > self.memo_size:
+                    self._memo.popitem(last=False)
+            return result
+    
+    @staticmethod
+    def _coverage(conn: sqlite3.Connection, tickers: List[str]) -> Dict[str, Tuple[int, int]]:
+        """Cached (first_day, last_day) per ticker."""
+        marks = ",".join("?" * len(tickers))
+        rows = conn.execute(
+            f"SELECT ticker, first_day, last_day FROM coverage WHERE ticker IN ({marks})",
+            list(tickers),
+        )
+        return {ticker: (lo, hi) for ticker, lo, hi in rows}
+    
+    @staticmethod
+    def _store(
+        conn: sqlite3.Connection,
+        tickers: List[str],
+        days: np.ndarray,
+        values: np.ndarray,
+        lo: int,
+        hi: int
+    ) -> None:
+        """
+        Upsert downloaded closes and extend each ticker's covered range.
+        
+        A ticker with no close in the download (failed request, or no
+        trading days) keeps its coverage, so the range is retried.
+        """
+        for k, ticker in enumerate(tickers):
+            column = values[:, k]
+            ok = np.isfinite(column)
+            if not ok.any():
+                continue
+            conn.executemany(
+                "INSERT OR REPLACE INTO closes (ticker, day, close) VALUES (?, ?, ?)",
+                zip([ticker] * int(ok.sum()), days[ok].tolist(), column[ok].tolist()),
+            )
+            if lo <= hi:
+                conn.execute(
+                    "INSERT INTO coverage (ticker, first_day, last_day) VALUES (?, ?, ?) "
+                    "ON CONFLICT(ticker) DO UPDATE SET "
+                    "first_day = MIN(first_day, excluded.first_day), "
+                    "last_day = MAX(last_day, excluded.last_day)",
+                    (ticker, lo, hi),
+                )
+    
+    @staticmethod
+    def _read(
+        conn: sqlite3.Connection,
+        tickers: List[str],
+        first_day: int,
+        last_day: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Pivot cached rows into a [day, ticker] matrix over the day union."""
+        marks = ",".join("?" * len(tickers))
+        rows = conn.execute(
+            f"SELECT ticker, day, close FROM closes "
+            f"WHERE ticker IN ({marks}) AND day BETWEEN ? AND ?",
+            [*tickers, first_day, last_day],
+        ).fetchall()
+        
+        column = {ticker: k for k, ticker in enumerate(tickers)}
+        row_days = np.array([r[1] for r in rows], dtype=np.int64)
+        days, row_idx = np.unique(row_days, return_inverse=True)
+        values = np.full((len(days), len(tickers)), np.nan)
+        if rows:
+            col_idx = np.array([column[r[0]] for r in rows])
+            values[row_idx, col_idx] = [r[2] for r in rows]
+        return days, values
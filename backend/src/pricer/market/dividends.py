@@ -7,10 +7,105 @@ Supports continuous dividend yield and discrete cash dividends.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
 from typing import List, Tuple, Optional
 import math
 
-from pricer.core.day_count import DayCountConvention, day_count_fraction
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+from pricer.core.day_count import DayCountConvention, day_count_fraction, year_fractions
+
+
+def _schedule_arrays(
+    dividends: List[Tuple[date, float]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split a sorted dividend schedule into parallel arrays.
+    
+    Returns:
+        Tuple of (ex-dates as int64 ordinals, amounts as float64)
+    """
+    ex_ordinals = np.fromiter((d.toordinal() for d, _ in dividends), dtype=np.int64,
+                              count=len(dividends))
+    amounts = np.fromiter((a for _, a in dividends), dtype=np.float64, count=len(dividends))
+    return ex_ordinals, amounts
+
+
+def _ex_date_range(ex_ordinals: np.ndarray, start_date: date, end_date: date) -> Tuple[int, int]:
+    """Slice bounds of the sorted schedule with start_date < ex_date <= end_date."""
+    i0, i1 = np.searchsorted(ex_ordinals, (start_date.toordinal(), end_date.toordinal()), side="right")
+    return int(i0), max(int(i0), int(i1))
+
+
+def _discrete_adjust(amounts: np.ndarray, spot: float) -> float:
+    """
+    Multiplicative forward adjustment prod(1 - D_i/S_i) for sorted amounts.
+    
+    S_i is approximated as spot less the dividends already applied; a
+    dividend at or above the remaining spot is skipped. With S_{i+1} =
+    S_i - D_i the product telescopes to S_final / spot, so the loop is a
+    select-and-subtract with no per-dividend branch or division.
+    """
+    if spot == 0.0:
+        return 1.0
+    forward_spot = spot
+    for i in range(amounts.shape[0]):
+        amount = amounts[i]
+        forward_spot -= amount if forward_spot > amount else 0.0
+    return forward_spot / spot
+
+
+def _discrete_adjust_vec(amounts: np.ndarray, spots: np.ndarray) -> np.ndarray:
+    """_discrete_adjust for each spot in spots (e.g. one per path)."""
+    out = np.empty(spots.shape[0])
+    for p in prange(spots.shape[0]):
+        spot = spots[p]
+        forward_spot = spot
+        for i in range(amounts.shape[0]):
+            amount = amounts[i]
+            forward_spot -= amount if forward_spot > amount else 0.0
+        out[p] = forward_spot / spot if spot > 0.0 else 1.0
+    return out
+
+
+def _forward_spots(amounts: np.ndarray, spot: float) -> np.ndarray:
+    """Forward spot after each dividend in turn (same skip rule as above)."""
+    out = np.empty(amounts.shape[0])
+    forward_spot = spot
+    for i in range(amounts.shape[0]):
+        amount = amounts[i]
+        forward_spot -= amount if forward_spot > amount else 0.0
+        out[i] = forward_spot
+    return out
+
+
+if HAS_NUMBA:
+    _discrete_adjust = njit(fastmath=True, cache=True)(_discrete_adjust)
+    _forward_spots = njit(fastmath=True, cache=True)(_forward_spots)
+    _discrete_adjust_vec = njit(parallel=True, fastmath=True, cache=True)(_discrete_adjust_vec)
+
+
+@lru_cache(maxsize=2048)
+def _continuous_factor(
+    yield_rate: float,
+    day_count: DayCountConvention,
+    ref_ord: int,
+    tgt_ord: int
+) -> float:
+    """
+    Cached exp(-q * t) keyed on yield, convention and date ordinals.
+    
+    Pricing asks for the same observation/payment date pairs repeatedly.
+    """
+    yf = day_count_fraction(date.fromordinal(ref_ord), date.fromordinal(tgt_ord), day_count)
+    return math.exp(-yield_rate * yf)
 
 
 class DividendModel(ABC):
@@ -33,6 +128,28 @@ class DividendModel(ABC):
         """
         pass
     
+    def adjustment_grid(
+        self,
+        start_ords: np.ndarray,
+        end_ords: np.ndarray,
+        spot: float
+    ) -> np.ndarray:
+        """
+        Get dividend adjustments for many periods in one call.
+        
+        Args:
+            start_ords: Period start dates as int64 ordinals
+            end_ords: Period end dates as int64 ordinals
+            spot: Spot price used by discrete adjustments
+            
+        Returns:
+            get_dividend_adjustment per period, aligned with the inputs
+        """
+        return np.array([
+            self.get_dividend_adjustment(date.fromordinal(int(s)), date.fromordinal(int(e)), spot)
+            for s, e in zip(start_ords, end_ords)
+        ], dtype=np.float64)
+    
     @abstractmethod
     def get_discrete_dividends_between(
         self,
@@ -66,8 +183,22 @@ class ContinuousDividend(DividendModel):
         if target_date <= reference_date:
             return 1.0
         
-        yf = day_count_fraction(reference_date, target_date, self.day_count)
-        return math.exp(-self.yield_rate * yf)
+        return _continuous_factor(
+            self.yield_rate, self.day_count, reference_date.toordinal(), target_date.toordinal()
+        )
+    
+    def adjustment_grid(
+        self,
+        start_ords: np.ndarray,
+        end_ords: np.ndarray,
+        spot: float
+    ) -> np.ndarray:
+        """Calculate exp(-q * t) per period, vectorized for ACT/365F."""
+        if self.day_count != DayCountConvention.ACT_365F:
+            return super().adjustment_grid(start_ords, end_ords, spot)
+        
+        yf = np.maximum(np.asarray(end_ords) - np.asarray(start_ords), 0) / 365.0
+        return np.exp(-self.yield_rate * yf)
     
     def get_discrete_dividends_between(
         self,
@@ -92,8 +223,9 @@ class DiscreteDividend(DividendModel):
     dividends: List[Tuple[date, float]] = field(default_factory=list)
     
     def __post_init__(self) -> None:
-        """Sort dividends by date."""
+        """Sort dividends by date and cache the schedule as arrays."""
         self.dividends = sorted(self.dividends, key=lambda x: x[0])
+        self._ex_ordinals, self._amounts = _schedule_arrays(self.dividends)
     
     def get_dividend_adjustment(
         self,
@@ -113,18 +245,33 @@ class DiscreteDividend(DividendModel):
         if target_date <= reference_date or spot <= 0:
             return 1.0
         
-        adjustment = 1.0
-        cumulative_div = 0.0
+        # Dividends with reference_date < ex_date <= target_date
+        i0, i1 = _ex_date_range(self._ex_ordinals, reference_date, target_date)
+        return _discrete_adjust(self._amounts[i0:i1], float(spot))
+    
+    def get_dividend_adjustments(
+        self,
+        reference_date: date,
+        target_date: date,
+        spots: np.ndarray
+    ) -> np.ndarray:
+        """
+        get_dividend_adjustment for an array of spots, e.g. one per path.
         
-        for ex_date, amount in self.dividends:
-            if reference_date < ex_date <= target_date:
-                # Approximate forward spot at ex-date
-                forward_spot = spot - cumulative_div
-                if forward_spot > amount:
-                    adjustment *= (forward_spot - amount) / forward_spot
-                    cumulative_div += amount
+        Args:
+            reference_date: Period start (exclusive)
+            target_date: Period end (inclusive)
+            spots: Spot per path [num_paths]
+            
+        Returns:
+            Adjustment factor per path [num_paths]
+        """
+        spots = np.ascontiguousarray(spots, dtype=np.float64)
+        if target_date <= reference_date:
+            return np.ones(spots.shape[0])
         
-        return adjustment
+        i0, i1 = _ex_date_range(self._ex_ordinals, reference_date, target_date)
+        return _discrete_adjust_vec(self._amounts[i0:i1], spots)
     
     def get_discrete_dividends_between(
         self,
@@ -132,11 +279,8 @@ class DiscreteDividend(DividendModel):
         end_date: date
     ) -> List[Tuple[date, float]]:
         """Get dividends with ex-date between start and end."""
-        return [
-            (ex_date, amount)
-            for ex_date, amount in self.dividends
-            if start_date < ex_date <= end_date
-        ]
+        i0, i1 = _ex_date_range(self._ex_ordinals, start_date, end_date)
+        return self.dividends[i0:i1]
     
     def get_total_dividends_between(
         self,
@@ -144,11 +288,8 @@ class DiscreteDividend(DividendModel):
         end_date: date
     ) -> float:
         """Get total dividend amount between two dates."""
-        return sum(
-            amount
-            for ex_date, amount in self.dividends
-            if start_date < ex_date <= end_date
-        )
+        i0, i1 = _ex_date_range(self._ex_ordinals, start_date, end_date)
+        return float(self._amounts[i0:i1].sum())
 
 
 @dataclass
@@ -170,8 +311,9 @@ class MixedDividend(DividendModel):
     day_count: DayCountConvention = DayCountConvention.ACT_365F
     
     def __post_init__(self) -> None:
-        """Sort dividends by date."""
+        """Sort dividends by date and cache the schedule as arrays."""
         self.discrete_dividends = sorted(self.discrete_dividends, key=lambda x: x[0])
+        self._ex_ordinals, self._amounts = _schedule_arrays(self.discrete_dividends)
     
     def get_dividend_adjustment(
         self,
@@ -185,26 +327,78 @@ class MixedDividend(DividendModel):
         
         adjustment = 1.0
         
-        # Apply discrete dividends
-        cumulative_div = 0.0
-        for ex_date, amount in self.discrete_dividends:
-            if reference_date < ex_date <= target_date:
-                if self.discrete_horizon is None or ex_date <= self.discrete_horizon:
-                    forward_spot = spot - cumulative_div
-                    if forward_spot > amount:
-                        adjustment *= (forward_spot - amount) / forward_spot
-                        cumulative_div += amount
+        # Apply discrete dividends up to the horizon
+        last = target_date
+        if self.discrete_horizon is not None and self.discrete_horizon < last:
+            last = self.discrete_horizon
+        i0, i1 = _ex_date_range(self._ex_ordinals, reference_date, last)
+        if i1 > i0:
+            adjustment *= _discrete_adjust(self._amounts[i0:i1], float(spot))
         
         # Apply continuous yield for period beyond discrete horizon
         if self.discrete_horizon is not None and target_date > self.discrete_horizon:
             start = max(reference_date, self.discrete_horizon)
-            yf = day_count_fraction(start, target_date, self.day_count)
-            adjustment *= math.exp(-self.continuous_yield * yf)
+            adjustment *= _continuous_factor(
+                self.continuous_yield, self.day_count, start.toordinal(), target_date.toordinal()
+            )
         elif self.discrete_horizon is None and self.continuous_yield > 0:
             # Apply continuous yield to entire period
-            yf = day_count_fraction(reference_date, target_date, self.day_count)
-            adjustment *= math.exp(-self.continuous_yield * yf)
+            adjustment *= _continuous_factor(
+                self.continuous_yield, self.day_count,
+                reference_date.toordinal(), target_date.toordinal()
+            )
+        
+        return adjustment
+    
+    def get_dividend_adjustment_vec(
+        self,
+        reference_date: date,
+        target_ords: np.ndarray,
+        spot: float
+    ) -> np.ndarray:
+        """
+        get_dividend_adjustment from one reference date to many target dates.
+        
+        The discrete part walks the dividend schedule once and buckets the
+        targets with searchsorted; the continuous part uses vectorized year
+        fractions.
+        
+        Args:
+            reference_date: Start of every period
+            target_ords: Target dates as int64 ordinals [num_targets]
+            spot: Spot price at the reference date
+            
+        Returns:
+            Adjustment factor per target date [num_targets]
+        """
+        target_ords = np.asarray(target_ords, dtype=np.int64)
+        ref_ord = reference_date.toordinal()
+        adjustment = np.ones(target_ords.shape[0])
+        
+        # Discrete: after k applied dividends the factor is forward_k / spot
+        last_ords = target_ords
+        if self.discrete_horizon is not None:
+            last_ords = np.minimum(target_ords, self.discrete_horizon.toordinal())
+        i0 = int(np.searchsorted(self._ex_ordinals, ref_ord, side="right"))
+        counts = np.searchsorted(self._ex_ordinals, last_ords, side="right") - i0
+        if spot != 0.0 and counts.max(initial=0) > 0:
+            forwards = _forward_spots(self._amounts[i0:i0 + counts.max()], float(spot))
+            has_divs = counts > 0
+            adjustment[has_divs] = forwards[counts[has_divs] - 1] / spot
+        
+        # Continuous: beyond the horizon, or over the whole period
+        if self.discrete_horizon is not None:
+            start = max(reference_date, self.discrete_horizon)
+            start_ord = start.toordinal()
+        elif self.continuous_yield > 0:
+            start, start_ord = reference_date, ref_ord
+        else:
+            start = None
+        if start is not None:
+            yf = year_fractions(start, np.maximum(target_ords, start_ord), self.day_count)
+            adjustment *= np.exp(-self.continuous_yield * yf)
         
+        adjustment[target_ords <= ref_ord] = 1.0
         return adjustment
     
     def get_discrete_dividends_between(
@@ -213,8 +407,5 @@ class MixedDividend(DividendModel):
         end_date: date
     ) -> List[Tuple[date, float]]:
         """Get discrete dividends between dates."""
-        return [
-            (ex_date, amount)
-            for ex_date, amount in self.discrete_dividends
-            if start_date < ex_date <= end_date
-        ]
+        i0, i1 = _ex_date_range(self._ex_ordinals, start_date, end_date)
+        return self.discrete_dividends[i0:i1]
@@ -9,26 +9,50 @@ Provides functions to fetch:
 - Risk-free rates
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, ParamSpec, Tuple, TypeVar
+import copy
+import hashlib
+import os
+import pickle
+import random
+import sqlite3
+import threading
+import time
 import numpy as np
 
+from pricer.core.day_count import _EPOCH_ORD
+from pricer.market._cache import ClosePriceCache
+from pricer.market.correlation import CorrelationMatrix
+
 try:
     import yfinance as yf
     HAS_YFINANCE = True
 except ImportError:
     HAS_YFINANCE = False
 
+# Errors worth retrying: Yahoo rate limiting and dropped connections
+_TRANSIENT_ERRORS: Tuple[type, ...] = (ConnectionError, TimeoutError)
+if HAS_YFINANCE:
+    try:
+        from yfinance.exceptions import YFRateLimitError
+        _TRANSIENT_ERRORS += (YFRateLimitError,)
+    except ImportError:
+        pass
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DividendInfo:
     """Dividend information for a stock."""
     ex_date: date
     amount: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VolInfo:
     """Volatility term structure entry."""
     date: date
@@ -37,29 +61,126 @@ class VolInfo:
 
 @dataclass
 class UnderlyingMarketData:
-    """Market data for a single underlying."""
+    """
+    Market data for a single underlying.
+    
+    The vol term structure and the dividend schedule are stored as
+    parallel arrays (int64 date ordinals alongside float64 values), so
+    lookups interpolate or binary-search without touching per-entry
+    Python objects.
+    """
     ticker: str
     spot: float
     currency: str = "USD"
     historical_vol: float = 0.25
-    vol_term_structure: List[VolInfo] = field(default_factory=list)
-    dividends: List[DividendInfo] = field(default_factory=list)
+    vol_dates_ord: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    vol_values: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    dividend_ords: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    dividend_amounts: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
     dividend_yield: float = 0.0
+    
+    def __post_init__(self) -> None:
+        """Coerce scalars to Python floats and schedules to contiguous typed arrays."""
+        self.spot = float(self.spot)
+        self.historical_vol = float(self.historical_vol)
+        self.dividend_yield = float(self.dividend_yield)
+        self.vol_dates_ord = np.ascontiguousarray(self.vol_dates_ord, dtype=np.int64)
+        self.vol_values = np.ascontiguousarray(self.vol_values, dtype=np.float64)
+        self.dividend_ords = np.ascontiguousarray(self.dividend_ords, dtype=np.int64)
+        self.dividend_amounts = np.ascontiguousarray(self.dividend_amounts, dtype=np.float64)
+    
+    @property
+    def dividends(self) -> List[DividendInfo]:
+        """Dividend schedule as DividendInfo entries, by ex-date."""
+        return [
+            DividendInfo(ex_date=date.fromordinal(int(o)), amount=float(a))
+            for o, a in zip(self.dividend_ords, self.dividend_amounts)
+        ]
+    
+    def dividends_between(
+        self,
+        start_date: date,
+        end_date: date
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Dividends with start_date < ex_date <= end_date.
+        
+        Returns:
+            Tuple of (ex-date ordinals, amounts) slices of the schedule
+        """
+        i0, i1 = np.searchsorted(
+            self.dividend_ords, (start_date.toordinal(), end_date.toordinal()), side="right"
+        )
+        return self.dividend_ords[i0:i1], self.dividend_amounts[i0:i1]
+    
+    @property
+    def vol_term_structure(self) -> List[VolInfo]:
+        """Vol term structure as VolInfo entries."""
+        return [
+            VolInfo(date=date.fromordinal(int(o)), vol=float(v))
+            for o, v in zip(self.vol_dates_ord, self.vol_values)
+        ]
+    
+    def vol_at(self, target_date: date) -> float:
+        """
+        Interpolated vol at a date (flat beyond the first and last knots).
+        
+        Falls back to historical_vol when there is no term structure.
+        """
+        if len(self.vol_dates_ord) == 0:
+            return self.historical_vol
+        return float(np.interp(target_date.toordinal(), self.vol_dates_ord, self.vol_values))
 
 
 @dataclass
 class MarketDataSnapshot:
-    """Complete market data snapshot for multiple underlyings."""
+    """
+    Complete market data snapshot for multiple underlyings.
+    
+    Correlations are kept as a dense matrix (NaN where a pair could not be
+    estimated) indexed through ticker_index, alongside the legacy
+    "T1_T2"-keyed dict used for serialization.
+    """
     as_of_date: date
     underlyings: Dict[str, UnderlyingMarketData] = field(default_factory=dict)
     correlations: Dict[str, float] = field(default_factory=dict)
     risk_free_rate: float = 0.05
+    correlation_matrix: Optional[np.ndarray] = None
+    ticker_index: Dict[str, int] = field(default_factory=dict)
+    
+    def correlation_submatrix(self, assets: List[str]) -> np.ndarray:
+        """
+        Correlation matrix for a subset of tickers, in the given order.
+        
+        Pairs without an estimate are uncorrelated (0), as in
+        CorrelationMatrix.from_dict.
+        """
+        if self.correlation_matrix is None or not all(a in self.ticker_index for a in assets):
+            return CorrelationMatrix.from_dict(assets, self.correlations).matrix
+        
+        idx = [self.ticker_index[a] for a in assets]
+        sub = self.correlation_matrix[np.ix_(idx, idx)]
+        return np.where(np.isfinite(sub), sub, 0.0)
 
 
 # Alias for backwards compatibility with existing engine interfaces
 MarketData = MarketDataSnapshot
 
 
+# Upper bound on concurrent Yahoo requests
+_MAX_FETCH_WORKERS = 32
+
+# Tickers per bulk spot-price request
+_SPOT_BATCH_SIZE = 20
+
+# On-disk snapshot cache (override the directory with PRICER_CACHE_DIR)
+_SNAPSHOT_CACHE_DIR = Path(os.environ.get("PRICER_CACHE_DIR", "~/.pricer_cache")).expanduser()
+_SNAPSHOT_TTL_SECONDS = 24 * 3600
+
+# Daily closes, downloaded incrementally (see ClosePriceCache)
+_PRICE_CACHE = ClosePriceCache(_SNAPSHOT_CACHE_DIR / "closes.sqlite")
+
+
 def _check_yfinance():
     """Check if yfinance is available."""
     if not HAS_YFINANCE:
@@ -68,37 +189,430 @@ def _check_yfinance():
         )
 
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Fetches currently running, keyed by (function name, arguments)
+_IN_FLIGHT: Dict[Tuple[Any, ...], "Future[Any]"] = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+
+def _coalesce(fn: Callable[P, R]) -> Callable[P, R]:
+    """
+    Share one in-flight call among concurrent identical calls.
+    
+    The first caller runs fn; callers arriving with the same arguments
+    while it runs wait for and receive its result (or exception) instead
+    of issuing their own request. List arguments are keyed as tuples.
+    Waiting callers get a deep copy of the result, so no two callers
+    share a mutable dict or list.
+    """
+    def hashable(value: Any) -> Any:
+        return tuple(value) if isinstance(value, list) else value
+    
+    @wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        key = (fn.__name__,) + tuple(hashable(a) for a in args) + tuple(
+            (name, hashable(value)) for name, value in sorted(kwargs.items())
+        )
+        
+        with _IN_FLIGHT_LOCK:
+            future = _IN_FLIGHT.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                _IN_FLIGHT[key] = future
+        
+        if not owner:
+            return copy.deepcopy(future.result())
+        
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _IN_FLIGHT_LOCK:
+                _IN_FLIGHT.pop(key, None)
+        future.set_result(result)
+        return result
+    
+    return wrapper
+
+
+# Bounded retry of transient Yahoo failures (see _with_retry)
+_RETRY_ATTEMPTS = 4
+_RETRY_BASE_DELAY = 0.5
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Rate limiting, a 5xx response or a dropped connection."""
+    if isinstance(exc, _TRANSIENT_ERRORS):
+        return True
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status in _RETRY_STATUS
+
+
+def _with_retry(fn: Callable[P, R]) -> Callable[P, R]:
+    """
+    Retry transient failures with exponential backoff and jitter.
+    
+    Up to _RETRY_ATTEMPTS calls are made, sleeping about
+    _RETRY_BASE_DELAY * 2**attempt between them, so a burst of 429s backs
+    off instead of hammering Yahoo. Other errors propagate immediately.
+    """
+    @wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        for attempt in range(_RETRY_ATTEMPTS - 1):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if not _is_transient(e):
+                    raise
+                time.sleep(_RETRY_BASE_DELAY * 2 ** attempt * (1.0 + random.random()))
+        return fn(*args, **kwargs)
+    
+    return wrapper
+
+
+# Lifetime of a shared yf.Ticker (and the info/dividends it has loaded)
+_TICKER_TTL_SECONDS = 300
+
+
+@lru_cache(maxsize=256)
+def _cached_ticker(symbol: str, epoch: int) -> "yf.Ticker":
+    """yf.Ticker for one TTL epoch; a new epoch builds a fresh object."""
+    return yf.Ticker(symbol)
+
+
+def _ticker(symbol: str) -> "yf.Ticker":
+    """
+    Shared yf.Ticker for a symbol.
+    
+    yfinance keeps loaded info, fast_info and dividends on the Ticker, so
+    reusing one object lets every helper in a snapshot (and snapshots taken
+    within _TICKER_TTL_SECONDS of each other) share those HTTP responses.
+    """
+    return _cached_ticker(symbol, int(time.time() // _TICKER_TTL_SECONDS))
+
+
+@lru_cache(maxsize=256)
+@_with_retry
+def _cached_info(symbol: str, epoch: int) -> Dict[str, Any]:
+    """
+    Ticker.info for one TTL epoch.
+    
+    The info endpoint is the slowest and most rate-limited Yahoo call, so
+    the dict is memoized here rather than relying on the Ticker object to
+    keep it. Failures raise and are therefore not cached.
+    """
+    return _cached_ticker(symbol, epoch).info or {}
+
+
+def _info(symbol: str) -> Dict[str, Any]:
+    """Shared Ticker.info for a symbol (see _ticker)."""
+    return _cached_info(symbol, int(time.time() // _TICKER_TTL_SECONDS))
+
+
+@_with_retry
+def _last_price(symbol: str) -> Optional[float]:
+    """Ticker.fast_info last price (None if Yahoo has none)."""
+    return _ticker(symbol).fast_info.get("lastPrice")
+
+
+@_with_retry
+def _yf_download(tickers: List[str], **kwargs: Any) -> Any:
+    """yf.download of daily bars for several tickers (no progress bar)."""
+    return yf.download(tickers, auto_adjust=False, threads=True, progress=False, **kwargs)
+
+
+@_with_retry
+def _ticker_dividends(symbol: str) -> Any:
+    """Ticker.dividends series."""
+    return _ticker(symbol).dividends
+
+
+def _fetch_pool(num_tasks: int) -> ThreadPoolExecutor:
+    """
+    Thread pool for overlapping Yahoo HTTP round-trips.
+    
+    Fetching is I/O-bound, so threads overlap the network latency of the
+    per-ticker requests (the GIL is released while waiting).
+    """
+    return ThreadPoolExecutor(max_workers=max(1, min(_MAX_FETCH_WORKERS, 4 * num_tasks)))
+
+
+# Ticker.info keys holding the current price, in order of preference
+_SPOT_INFO_KEYS = ("regularMarketPrice", "currentPrice")
+
+
+@_coalesce
+def _fetch_spot(ticker: str) -> Optional[float]:
+    """Fetch one ticker's current price, or None if unavailable."""
+    try:
+        # Try fast_info first, fall back to info
+        price = _last_price(ticker)
+        if not price:
+            info = _info(ticker)
+            price = next((info[key] for key in _SPOT_INFO_KEYS if info.get(key)), None)
+        
+        if price:
+            return float(price)
+    except Exception as e:
+        print(f"Warning: Could not fetch price for {ticker}: {e}")
+    return None
+
+
+@_coalesce
+def _fetch_spot_batch(tickers: List[str]) -> Dict[str, float]:
+    """
+    Latest prices for a chunk of tickers from one bulk download.
+    
+    Today's daily bar carries the latest traded price, so the last finite
+    close of a short daily history is the spot. Tickers without one are
+    left out.
+    """
+    try:
+        df = _yf_download(tickers, period="5d", interval="1d")
+        close = df["Close"]
+        if close.ndim == 1:
+            close = close.to_frame(tickers[0])
+        closes = close.reindex(columns=tickers).to_numpy(dtype=np.float64)
+    except Exception as e:
+        print(f"Warning: Could not batch-fetch prices for {tickers}: {e}")
+        return {}
+    
+    # Last finite row per column
+    finite = np.isfinite(closes)
+    last_row = len(closes) - 1 - np.argmax(finite[::-1], axis=0)
+    last = closes[last_row, np.arange(len(tickers))]
+    return {
+        ticker: float(price)
+        for ticker, price, ok in zip(tickers, last, finite.any(axis=0))
+        if ok and price > 0
+    }
+
+
+def _chunks(items: List[str], size: int) -> List[List[str]]:
+    """Split a list into consecutive chunks of at most size items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
 def fetch_spot_prices(tickers: List[str]) -> Dict[str, float]:
     """
     Fetch current spot prices for given tickers.
     
+    Tickers are priced in batches of _SPOT_BATCH_SIZE per request, batches
+    running concurrently; any ticker a batch misses is retried on its own.
+    
     Args:
         tickers: List of stock tickers (e.g., ["AAPL", "GOOG", "MSFT"])
         
     Returns:
-        Dictionary mapping ticker to current price
+        Dictionary mapping ticker to current price, in input order
     """
     _check_yfinance()
     
-    prices = {}
-    for ticker in tickers:
-        try:
-            stock = yf.Ticker(ticker)
-            # Try fast_info first, fall back to info
-            try:
-                price = stock.fast_info.last_price
-            except:
-                info = stock.info
-                price = info.get("regularMarketPrice") or info.get("currentPrice")
-            
+    fetched: Dict[str, float] = {}
+    chunks = _chunks(list(dict.fromkeys(tickers)), _SPOT_BATCH_SIZE)
+    with _fetch_pool(len(chunks)) as pool:
+        for prices in pool.map(_fetch_spot_batch, chunks):
+            fetched.update(prices)
+        
+        missing = [ticker for ticker in dict.fromkeys(tickers) if ticker not in fetched]
+        futures = {pool.submit(_fetch_spot, ticker): ticker for ticker in missing}
+        for future in as_completed(futures):
+            price = future.result()
             if price:
-                prices[ticker] = float(price)
-        except Exception as e:
-            print(f"Warning: Could not fetch price for {ticker}: {e}")
+                fetched[futures[future]] = price
+    
+    return {ticker: fetched[ticker] for ticker in tickers if ticker in fetched}
+
+
+def _history_window(window_days: int) -> Tuple[datetime, datetime]:
+    """Calendar range covering window_days trading days."""
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=int(window_days * 1.5) + 10)
+    return start_date, end_date
+
+
+def _index_ordinals(index: Any) -> np.ndarray:
+    """
+    Date ordinals of a pandas date index without per-row Timestamp objects.
+    
+    Timezone-aware indexes use their local (exchange) calendar date. Any
+    other index falls back to calling toordinal() on each entry.
+    """
+    if not hasattr(index, "tz_localize"):
+        return np.fromiter((d.toordinal() for d in index), dtype=np.int64, count=len(index))
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    days = np.asarray(index.values).astype("datetime64[D]").astype(np.int64)
+    return days + _EPOCH_ORD
+
+
+def _download_closes(
+    tickers: List[str],
+    first_day: int,
+    last_day: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Download daily closes for all tickers in a single request.
     
-    return prices
+    Args:
+        tickers: List of stock tickers
+        first_day: First day as a date ordinal
+        last_day: Last day as a date ordinal (inclusive)
+        
+    Returns:
+        Tuple of (day ordinals [num_days], closes [num_days, num_tickers]
+        float64 with NaN where a ticker did not trade or failed to download)
+    """
+    df = _yf_download(
+        tickers,
+        start=date.fromordinal(first_day),
+        end=date.fromordinal(last_day + 1),  # exclusive
+    )
+    close = df["Close"]
+    if close.ndim == 1:
+        close = close.to_frame(tickers[0])
+    close = close.reindex(columns=tickers)
+    return _index_ordinals(close.index), close.to_numpy(dtype=np.float64)
 
 
+def _fetch_prices_frame(
+    tickers: List[str],
+    start: datetime,
+    end: datetime
+) -> Tuple[np.ndarray, List[str]]:
+    """
+    Daily closes for all tickers, from the on-disk cache where possible.
+    
+    Only days outside each ticker's cached range are downloaded, in one
+    bulk request per distinct missing range. Without a usable cache the
+    whole range is downloaded directly.
+    
+    Args:
+        tickers: List of stock tickers
+        start: History start
+        end: History end
+        
+    Returns:
+        Tuple of (closes [num_days, num_tickers] float64 with NaN where a
+        ticker did not trade or failed to download, ticker column order)
+    """
+    first_day, last_day = start.toordinal(), end.toordinal()
+    # Only cache errors fall back; a failed download propagates as-is
+    # instead of running the whole retry cycle a second time
+    cache_error: Optional[Exception] = None
+    try:
+        _PRICE_CACHE.open()
+    except (sqlite3.Error, OSError) as e:
+        cache_error = e
+    if cache_error is None:
+        try:
+            _, closes = _PRICE_CACHE.closes(
+                tickers, first_day, last_day, _download_closes, date.today().toordinal()
+            )
+            return closes, list(tickers)
+        except sqlite3.Error as e:
+            cache_error = e
+    
+    print(f"Warning: Price cache unavailable, downloading directly: {cache_error}")
+    _, closes = _download_closes(tickers, first_day, last_day)
+    return closes, list(tickers)
+
+
+def _log_returns(closes: np.ndarray) -> np.ndarray:
+    """Daily log returns per column [num_days-1, num_tickers]."""
+    return np.diff(np.log(closes), axis=0)
+
+
+def _vols_from_returns(
+    returns: np.ndarray,
+    window_days: int,
+    annualization_factor: float = 252.0
+) -> np.ndarray:
+    """
+    Annualized vol of each column over the last window_days returns.
+    
+    Columns with fewer than window_days valid returns get NaN.
+    """
+    recent = returns[-window_days:]
+    finite = np.isfinite(recent)
+    min_valid = max(window_days - 1, 2)
+    if finite.all() and len(recent) >= min_valid:
+        return recent.std(axis=0, ddof=1) * np.sqrt(annualization_factor)
+    
+    valid = finite.sum(axis=0)
+    vols = np.full(returns.shape[1], np.nan)
+    enough = valid >= min_valid
+    if enough.any():
+        vols[enough] = np.nanstd(recent[:, enough], axis=0, ddof=1) * np.sqrt(annualization_factor)
+    return vols
+
+
+def _correlation_matrix_from_returns(
+    returns: np.ndarray,
+    window_days: int
+) -> np.ndarray:
+    """
+    Dense correlation matrix over the last window_days returns.
+    
+    Tickers without a full window get NaN off-diagonal entries; the
+    remaining columns are correlated over the days on which all of them
+    traded.
+    
+    Returns:
+        Correlation matrix [num_tickers, num_tickers] with unit diagonal
+    """
+    num_tickers = returns.shape[1]
+    matrix = np.full((num_tickers, num_tickers), np.nan)
+    np.fill_diagonal(matrix, 1.0)
+    
+    recent = returns[-window_days:]
+    finite = np.isfinite(recent)
+    cols = np.flatnonzero(finite.sum(axis=0) >= window_days - 1)
+    if len(cols) < 2:
+        return matrix
+    
+    rows = finite[:, cols].all(axis=1)
+    if rows.sum() < 20:
+        return matrix
+    
+    # Pearson correlation as one GEMM of mean-centred, unit-norm columns
+    centred = recent[np.ix_(rows, cols)]
+    centred = centred - centred.mean(axis=0)
+    norms = np.linalg.norm(centred, axis=0)
+    unit = np.divide(centred, norms, out=np.full_like(centred, np.nan), where=norms > 0)
+    corr = np.clip(unit.T @ unit, -1.0, 1.0)
+    np.fill_diagonal(corr, 1.0)
+    matrix[np.ix_(cols, cols)] = corr
+    return matrix
+
+
+def _correlation_dict(matrix: np.ndarray, tickers: List[str]) -> Dict[str, float]:
+    """Estimated upper-triangle entries keyed like "AAPL_GOOG"."""
+    i_idx, j_idx = np.triu_indices(len(tickers), k=1)
+    values = matrix[i_idx, j_idx]
+    keep = np.isfinite(values)
+    return {
+        f"{tickers[i]}_{tickers[j]}": v
+        for i, j, v in zip(i_idx[keep].tolist(), j_idx[keep].tolist(), values[keep].tolist())
+    }
+
+
+def _correlations_from_returns(
+    returns: np.ndarray,
+    tickers: List[str],
+    window_days: int
+) -> Dict[str, float]:
+    """Pairwise correlations over the last window_days returns."""
+    return _correlation_dict(_correlation_matrix_from_returns(returns, window_days), tickers)
+
+
+@_coalesce
 def fetch_historical_vol(
     ticker: str, 
     window_days: int = 30,
@@ -117,33 +631,47 @@ def fetch_historical_vol(
     """
     _check_yfinance()
     
-    stock = yf.Ticker(ticker)
     # Fetch enough data for the window
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=int(window_days * 1.5) + 10)
-    
-    hist = stock.history(start=start_date, end=end_date)
-    
-    if len(hist) < window_days:
-        raise ValueError(f"Not enough history for {ticker}: got {len(hist)} days")
+    closes, _ = _fetch_prices_frame([ticker], *_history_window(window_days))
+    closes = closes[:, 0]
+    closes = closes[np.isfinite(closes)]
     
-    # Use the most recent window_days
-    close_prices = hist["Close"].tail(window_days + 1)
+    if len(closes) < window_days:
+        raise ValueError(f"Not enough history for {ticker}: got {len(closes)} days")
     
-    # Calculate log returns
-    log_returns = np.log(close_prices / close_prices.shift(1)).dropna()
+    # Log returns over the most recent window_days
+    log_returns = np.diff(np.log(closes[-(window_days + 1):]))
     
-    # Annualized volatility
-    daily_vol = log_returns.std()
-    annualized_vol = daily_vol * np.sqrt(annualization_factor)
+    return float(log_returns.std(ddof=1) * np.sqrt(annualization_factor))
+
+
+@_coalesce
+def _dividend_history(ticker: str) -> Optional[Any]:
+    """Ticker.dividends series, or None if it cannot be fetched."""
+    try:
+        return _ticker_dividends(ticker)
+    except Exception:
+        return None
+
+
+def _dividend_arrays(divs: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ex-date ordinals and amounts of a Ticker.dividends series, in series order.
     
-    return float(annualized_vol)
+    Args:
+        divs: Dividend series indexed by ex-date (Timestamps or dates)
+        
+    Returns:
+        Tuple of (ex-date ordinals [int64], amounts [float64])
+    """
+    return _index_ordinals(divs.index), np.asarray(divs.to_numpy(), dtype=np.float64)
 
 
 def fetch_dividends(
     ticker: str, 
     start_date: Optional[date] = None,
-    end_date: Optional[date] = None
+    end_date: Optional[date] = None,
+    divs_series: Optional[Any] = None
 ) -> List[DividendInfo]:
     """
     Fetch dividend information for a stock.
@@ -152,36 +680,29 @@ def fetch_dividends(
         ticker: Stock ticker
         start_date: Optional start date filter
         end_date: Optional end date filter
+        divs_series: Preloaded Ticker.dividends series (fetched if None)
         
     Returns:
         List of DividendInfo with ex-dates and amounts
     """
     _check_yfinance()
     
-    stock = yf.Ticker(ticker)
-    
     # Get dividend history
-    try:
-        divs = stock.dividends
-    except:
+    divs = divs_series if divs_series is not None else _dividend_history(ticker)
+    if divs is None or divs.empty:
         return []
     
-    if divs.empty:
-        return []
-    
-    result = []
-    for idx, amount in divs.items():
-        ex_date = idx.date() if hasattr(idx, 'date') else idx
-        
-        # Filter by date range
-        if start_date and ex_date < start_date:
-            continue
-        if end_date and ex_date > end_date:
-            continue
-            
-        result.append(DividendInfo(ex_date=ex_date, amount=float(amount)))
+    ords, amounts = _dividend_arrays(divs)
+    keep = np.ones(len(ords), dtype=bool)
+    if start_date:
+        keep &= ords >= start_date.toordinal()
+    if end_date:
+        keep &= ords <= end_date.toordinal()
     
-    return result
+    return [
+        DividendInfo(ex_date=date.fromordinal(o), amount=a)
+        for o, a in zip(ords[keep].tolist(), amounts[keep].tolist())
+    ]
 
 
 def fetch_correlations(
@@ -203,48 +724,32 @@ def fetch_correlations(
     if len(tickers) < 2:
         return {}
     
-    # Fetch historical data
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=int(window_days * 1.5) + 10)
+    # One bulk download instead of a history request per ticker
+    try:
+        closes, columns = _fetch_prices_frame(tickers, *_history_window(window_days))
+    except Exception as e:
+        print(f"Warning: Could not fetch history for {tickers}: {e}")
+        return {}
+    
+    return _correlations_from_returns(_log_returns(closes), columns, window_days)
+
+
+# Risk-free rate used when no Treasury quote can be fetched
+_FALLBACK_RATE = 0.05
+
+
+@_coalesce
+def _fetch_treasury_rate() -> Optional[float]:
+    """Quoted Treasury rate as a decimal, or None if no quote could be fetched."""
+    _check_yfinance()
     
-    # Collect returns for each ticker
-    returns_data = {}
-    for ticker in tickers:
+    # 3-month Treasury Bill rate, then the 10-year Treasury
+    for symbol in ("^IRX", "^TNX"):
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(start=start_date, end=end_date)
-            if len(hist) > window_days:
-                close = hist["Close"].tail(window_days + 1)
-                returns = np.log(close / close.shift(1)).dropna()
-                returns_data[ticker] = returns
+            return float(_last_price(symbol) / 100)  # Convert from percentage
         except Exception as e:
-            print(f"Warning: Could not fetch history for {ticker}: {e}")
-    
-    # Calculate pairwise correlations
-    correlations = {}
-    ticker_list = list(returns_data.keys())
-    
-    for i in range(len(ticker_list)):
-        for j in range(i + 1, len(ticker_list)):
-            t1, t2 = ticker_list[i], ticker_list[j]
-            
-            # Align dates
-            returns1 = returns_data[t1]
-            returns2 = returns_data[t2]
-            
-            # Get common dates
-            common_idx = returns1.index.intersection(returns2.index)
-            if len(common_idx) < 20:
-                continue
-                
-            r1 = returns1.loc[common_idx]
-            r2 = returns2.loc[common_idx]
-            
-            corr = np.corrcoef(r1, r2)[0, 1]
-            key = f"{t1}_{t2}"
-            correlations[key] = float(corr)
-    
-    return correlations
+            print(f"Warning: Could not fetch rate from {symbol}: {e}")
+    return None
 
 
 def fetch_risk_free_rate() -> float:
@@ -254,93 +759,269 @@ def fetch_risk_free_rate() -> float:
     Returns:
         Risk-free rate as decimal (e.g., 0.05 for 5%)
     """
-    _check_yfinance()
+    rate = _fetch_treasury_rate()
     
-    try:
-        # Use 3-month Treasury Bill rate
-        irx = yf.Ticker("^IRX")
-        info = irx.fast_info
-        rate = info.last_price / 100  # Convert from percentage
-        return float(rate)
-    except:
-        # Fallback to 10-year Treasury
-        try:
-            tnx = yf.Ticker("^TNX")
-            info = tnx.fast_info
-            rate = info.last_price / 100
-            return float(rate)
-        except:
-            # Default fallback
-            return 0.05
+    # Default fallback
+    return _FALLBACK_RATE if rate is None else rate
+
+
+def _project_dividend_arrays(
+    ords: np.ndarray,
+    amounts: np.ndarray,
+    from_ord: int,
+    to_ord: int,
+    lookback_years: int = 2
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Project future ex-dates from a dividend history held as arrays.
+
+    Looks at trailing history to detect payment frequency and amount,
+    then projects forward from the last known ex-date through to_ord.
+
+    Args:
+        ords: Historical ex-date ordinals, oldest first
+        amounts: Historical amounts aligned with ords
+        from_ord: Start of the projection window (ordinal)
+        to_ord: End of the projection window (ordinal, inclusive)
+        lookback_years: Years of history to analyze
+
+    Returns:
+        Tuple of (projected ex-date ordinals, amounts)
+    """
+    empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+
+    # Filter to trailing lookback_years
+    recent = ords >= from_ord - lookback_years * 365
+    recent_ords = ords[recent]
+    if len(recent_ords) < 2:
+        return empty
+
+    # Detect frequency from median gap between consecutive payments
+    # (upper median, selected in O(n) rather than by sorting)
+    gaps = np.diff(recent_ords)
+    mid = len(gaps) // 2
+    median_gap = int(np.partition(gaps, mid)[mid])
+
+    # Classify: quarterly (~90d), semi-annual (~180d), annual (~365d)
+    if median_gap < 135:
+        freq_days = 91  # quarterly
+    elif median_gap < 270:
+        freq_days = 182  # semi-annual
+    else:
+        freq_days = 365  # annual
+
+    # Use most recent payment amount
+    last_ord = int(recent_ords[-1])
+    last_amount = float(amounts[recent][-1])
+
+    # Project forward from last known ex-date
+    next_ords = np.arange(last_ord + freq_days, to_ord + 1, freq_days, dtype=np.int64)
+    next_ords = next_ords[next_ords >= from_ord]
+
+    return next_ords, np.full(len(next_ords), last_amount)
 
 
 def _project_future_dividends(
     ticker: str,
     from_date: date,
     to_date: date,
-    lookback_years: int = 2
+    lookback_years: int = 2,
+    divs_series: Optional[Any] = None
 ) -> List[DividendInfo]:
     """
     Project future dividends from historical payment pattern.
 
-    Looks at trailing history to detect payment frequency and amount,
-    then projects forward from the last known ex-date through to_date.
-
     Args:
         ticker: Stock ticker
         from_date: Start date for projections
         to_date: End date for projections
         lookback_years: Years of history to analyze
+        divs_series: Preloaded Ticker.dividends series (fetched if None)
 
     Returns:
         List of projected DividendInfo
     """
     _check_yfinance()
 
-    stock = yf.Ticker(ticker)
+    divs = divs_series if divs_series is not None else _dividend_history(ticker)
+    if divs is None or divs.empty or len(divs) < 2:
+        return []
+
+    ords, amounts = _project_dividend_arrays(
+        *_dividend_arrays(divs), from_date.toordinal(), to_date.toordinal(), lookback_years
+    )
+    return [
+        DividendInfo(ex_date=date.fromordinal(o), amount=a)
+        for o, a in zip(ords.tolist(), amounts.tolist())
+    ]
+
+
+def _fetch_dividend_schedule(
+    ticker: str,
+    valuation_date: date,
+    maturity_date: date
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Dividends between valuation and maturity for one ticker.
+    
+    Uses known ex-dates in the range, or projects them from history,
+    sharing one dividend history download. Works on ordinal/amount
+    arrays throughout, without per-dividend objects.
+    
+    Returns:
+        Tuple of (ex-date ordinals, amounts), sorted by ex-date
+    """
+    div_ords = np.empty(0, dtype=np.int64)
+    div_amounts = np.empty(0, dtype=np.float64)
+    divs_series = _dividend_history(ticker)
+    if divs_series is not None and not divs_series.empty:
+        hist_ords, hist_amounts = _dividend_arrays(divs_series)
+        val_ord, mat_ord = valuation_date.toordinal(), maturity_date.toordinal()
+        in_range = (hist_ords >= val_ord) & (hist_ords <= mat_ord)
+        if in_range.any():
+            div_ords, div_amounts = hist_ords[in_range], hist_amounts[in_range]
+        else:
+            div_ords, div_amounts = _project_dividend_arrays(
+                hist_ords, hist_amounts, val_ord, mat_ord
+            )
+    order = np.argsort(div_ords, kind="stable")
+    return div_ords[order], div_amounts[order]
+
+
+@_coalesce
+def _fetch_info(ticker: str) -> Dict[str, Any]:
+    """Ticker.info, or an empty dict if it cannot be fetched."""
     try:
-        divs = stock.dividends
+        return _info(ticker)
     except Exception:
-        return []
+        return {}
 
-    if divs.empty or len(divs) < 2:
-        return []
 
-    # Filter to trailing lookback_years
-    cutoff = from_date - timedelta(days=lookback_years * 365)
-    recent = []
-    for idx, amount in divs.items():
-        ex = idx.date() if hasattr(idx, 'date') else idx
-        if ex >= cutoff:
-            recent.append((ex, float(amount)))
-
-    if len(recent) < 2:
-        return []
+def _dividend_yield(info: Dict[str, Any], spot: float) -> float:
+    """
+    Dividend yield estimate from Ticker.info using a multi-strategy approach.
+    
+    Args:
+        info: Ticker.info dict
+        spot: Current spot price
+        
+    Returns:
+        Dividend yield as decimal, capped at 10%
+    """
+    try:
+        # Strategy 1 (primary): dividendRate / spot
+        # dividendRate is annual dividend per share in currency (e.g. $1.00)
+        dividend_rate = info.get("dividendRate", 0) or 0
+        computed_yield = dividend_rate / spot if (dividend_rate > 0 and spot > 0) else 0
 
-    # Detect frequency from median gap between consecutive payments
-    gaps = [(recent[i + 1][0] - recent[i][0]).days for i in range(len(recent) - 1)]
-    median_gap = sorted(gaps)[len(gaps) // 2]
+        # Strategy 2 (fallback): trailingAnnualDividendYield (already decimal)
+        trailing_yield = info.get("trailingAnnualDividendYield", 0) or 0
 
-    # Classify: quarterly (~90d), semi-annual (~180d), annual (~365d)
-    if median_gap < 135:
-        freq_days = 91  # quarterly
-    elif median_gap < 270:
-        freq_days = 182  # semi-annual
-    else:
-        freq_days = 365  # annual
+        # Strategy 3 (last resort): dividendYield with minimal normalization
+        raw_div_yield = info.get("dividendYield", 0) or 0
+        if raw_div_yield > 1.0:
+            raw_div_yield = raw_div_yield / 100
 
-    # Use most recent payment amount
-    last_date, last_amount = recent[-1]
+        # Pick best estimate
+        if computed_yield > 0:
+            div_yield = computed_yield
+        elif trailing_yield > 0:
+            div_yield = trailing_yield
+        else:
+            div_yield = raw_div_yield
 
-    # Project forward from last known ex-date
-    projected = []
-    next_date = last_date + timedelta(days=freq_days)
-    while next_date <= to_date:
-        if next_date >= from_date:
-            projected.append(DividendInfo(ex_date=next_date, amount=last_amount))
-        next_date += timedelta(days=freq_days)
+        # Cross-validate: if we used a fallback but dividendRate is available,
+        # trust the computed value when they disagree by > 2%
+        if computed_yield > 0 and div_yield != computed_yield and abs(div_yield - computed_yield) > 0.02:
+            div_yield = computed_yield
+
+        # Safety cap at 10%
+        div_yield = min(div_yield, 0.10)
+    except Exception:
+        div_yield = 0
+    return float(div_yield)
 
-    return projected
+
+def _build_underlying(
+    ticker: str,
+    spot: float,
+    valuation_date: date,
+    maturity_date: date,
+    hist_vol: float,
+    schedule: Tuple[np.ndarray, np.ndarray],
+    info: Dict[str, Any]
+) -> UnderlyingMarketData:
+    """
+    Assemble UnderlyingMarketData from the separately fetched pieces.
+    
+    Args:
+        ticker: Stock ticker
+        spot: Current spot price
+        valuation_date: Valuation date
+        maturity_date: Product maturity date
+        hist_vol: Historical vol from the bulk price download
+        schedule: Dividend (ex-date ordinals, amounts)
+        info: Ticker.info dict for the dividend yield
+        
+    Returns:
+        UnderlyingMarketData for the ticker
+    """
+    # The sourced vol is flat, so the term structure is a single pillar at
+    # maturity (extrapolated flat by vol_at and PiecewiseConstantVol)
+    vol_dates_ord = np.array([maturity_date.toordinal()], dtype=np.int64)
+    vol_values = np.array([hist_vol], dtype=np.float64)
+    
+    div_ords, div_amounts = schedule
+    return UnderlyingMarketData(
+        ticker=ticker,
+        spot=spot,
+        historical_vol=hist_vol,
+        vol_dates_ord=vol_dates_ord,
+        vol_values=vol_values,
+        dividend_ords=div_ords,
+        dividend_amounts=div_amounts,
+        dividend_yield=_dividend_yield(info, spot),
+    )
+
+
+def _snapshot_cache_path(
+    tickers: List[str],
+    valuation_date: date,
+    maturity_date: date,
+    vol_window: int,
+    corr_window: int
+) -> Path:
+    """Cache file for a snapshot request, named by a hash of its inputs."""
+    key = repr((
+        tuple(tickers), valuation_date.isoformat(), maturity_date.isoformat(),
+        vol_window, corr_window,
+    ))
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return _SNAPSHOT_CACHE_DIR / f"snapshot_{digest}.pkl"
+
+
+def _load_cached_snapshot(path: Path) -> Optional[MarketDataSnapshot]:
+    """Cached snapshot at path, or None if missing, expired or unreadable."""
+    try:
+        if time.time() - path.stat().st_mtime > _SNAPSHOT_TTL_SECONDS:
+            return None
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except Exception:
+        return None
+    return snapshot if isinstance(snapshot, MarketDataSnapshot) else None
+
+
+def _store_snapshot(path: Path, snapshot: MarketDataSnapshot) -> None:
+    """Write a snapshot to the cache; failures only warn."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception as e:
+        print(f"Warning: Could not cache market data snapshot: {e}")
 
 
 def fetch_market_data_snapshot(
@@ -348,113 +1029,102 @@ def fetch_market_data_snapshot(
     valuation_date: Optional[date] = None,
     maturity_date: Optional[date] = None,
     vol_window: int = 90,
-    corr_window: int = 60
+    corr_window: int = 60,
+    ignore_cache: bool = False
 ) -> MarketDataSnapshot:
     """
     Fetch complete market data snapshot for multiple underlyings.
     
+    Snapshots are cached on disk for a day, keyed by all arguments, so
+    repeated requests within a session skip the network. A snapshot that
+    fell back to defaults for any ticker, the history or the rate is
+    returned but not cached.
+    
     Args:
         tickers: List of stock tickers
         valuation_date: Valuation date (default: today)
         maturity_date: Product maturity date (for vol term structure)
         vol_window: Days for historical vol calculation
         corr_window: Days for correlation calculation
+        ignore_cache: Refetch even if a cached snapshot exists
         
     Returns:
         MarketDataSnapshot with all market data
     """
-    _check_yfinance()
-    
     if valuation_date is None:
         valuation_date = date.today()
     
     if maturity_date is None:
         maturity_date = valuation_date + timedelta(days=365 * 3)  # 3 years default
     
-    # Fetch spot prices
-    spots = fetch_spot_prices(tickers)
+    cache_path = _snapshot_cache_path(tickers, valuation_date, maturity_date, vol_window, corr_window)
+    if not ignore_cache:
+        cached = _load_cached_snapshot(cache_path)
+        if cached is not None:
+            return cached
     
-    # Fetch risk-free rate
-    rf_rate = fetch_risk_free_rate()
-    
-    # Fetch correlations
-    correlations = fetch_correlations(tickers, corr_window)
+    _check_yfinance()
     
-    # Build underlying data
-    underlyings = {}
-    for ticker in tickers:
-        spot = spots.get(ticker)
-        if spot is None:
-            continue
-        
-        # Fetch historical vol
-        try:
-            hist_vol = fetch_historical_vol(ticker, vol_window)
-        except:
-            hist_vol = 0.25  # Default
-        
-        # Build simple vol term structure (flat for now)
-        vol_ts = []
-        current = valuation_date
-        while current <= maturity_date:
-            current += timedelta(days=182)  # ~6 months
-            if current <= maturity_date:
-                vol_ts.append(VolInfo(date=current, vol=hist_vol))
-        vol_ts.append(VolInfo(date=maturity_date, vol=hist_vol))
+    # Every request is independent of the others, so the rate, the price
+    # history and each ticker's dividends and info all run alongside the
+    # spot fetch; only the yield calculation waits for the spot
+    with _fetch_pool(2 * len(tickers) + 2) as pool:
+        rf_future = pool.submit(_fetch_treasury_rate)
+        history_future = pool.submit(
+            _fetch_prices_frame, tickers, *_history_window(max(vol_window, corr_window))
+        )
+        schedule_futures = {
+            ticker: pool.submit(_fetch_dividend_schedule, ticker, valuation_date, maturity_date)
+            for ticker in tickers
+        }
+        info_futures = {ticker: pool.submit(_fetch_info, ticker) for ticker in tickers}
         
-        # Fetch dividends (historical in future range, or project from history)
-        divs = fetch_dividends(ticker, valuation_date, maturity_date)
-        if not divs:
-            divs = _project_future_dividends(ticker, valuation_date, maturity_date)
+        # Fetch spot prices
+        spots = fetch_spot_prices(tickers)
         
-        # Calculate dividend yield using multi-strategy approach
+        # Vols and correlations from one bulk close-price download
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
-
-            # Strategy 1 (primary): dividendRate / spot
-            # dividendRate is annual dividend per share in currency (e.g. $1.00)
-            dividend_rate = info.get("dividendRate", 0) or 0
-            computed_yield = dividend_rate / spot if (dividend_rate > 0 and spot > 0) else 0
-
-            # Strategy 2 (fallback): trailingAnnualDividendYield (already decimal)
-            trailing_yield = info.get("trailingAnnualDividendYield", 0) or 0
-
-            # Strategy 3 (last resort): dividendYield with minimal normalization
-            raw_div_yield = info.get("dividendYield", 0) or 0
-            if raw_div_yield > 1.0:
-                raw_div_yield = raw_div_yield / 100
-
-            # Pick best estimate
-            if computed_yield > 0:
-                div_yield = computed_yield
-            elif trailing_yield > 0:
-                div_yield = trailing_yield
-            else:
-                div_yield = raw_div_yield
-
-            # Cross-validate: if we used a fallback but dividendRate is available,
-            # trust the computed value when they disagree by > 2%
-            if computed_yield > 0 and div_yield != computed_yield and abs(div_yield - computed_yield) > 0.02:
-                div_yield = computed_yield
-
-            # Safety cap at 10%
-            div_yield = min(div_yield, 0.10)
-        except:
-            div_yield = 0
+            closes, columns = history_future.result()
+            returns = _log_returns(closes)
+            vols = _vols_from_returns(returns, vol_window)
+            corr_matrix = _correlation_matrix_from_returns(returns, corr_window)
+        except Exception as e:
+            print(f"Warning: Could not fetch history for {tickers}: {e}")
+            vols = np.full(len(tickers), np.nan)
+            corr_matrix = np.full((len(tickers), len(tickers)), np.nan)
+            np.fill_diagonal(corr_matrix, 1.0)
         
-        underlyings[ticker] = UnderlyingMarketData(
-            ticker=ticker,
-            spot=spot,
-            historical_vol=hist_vol,
-            vol_term_structure=vol_ts,
-            dividends=divs,
-            dividend_yield=float(div_yield),
-        )
+        # Build underlying data for the priced tickers
+        underlyings = {
+            ticker: _build_underlying(
+                ticker, spots[ticker], valuation_date, maturity_date,
+                float(vol) if np.isfinite(vol) else 0.25,  # Default
+                schedule_futures[ticker].result(), info_futures[ticker].result(),
+            )
+            for ticker, vol in zip(tickers, vols)
+            if ticker in spots
+        }
+        
+        rf_rate = rf_future.result()
     
-    return MarketDataSnapshot(
+    snapshot = MarketDataSnapshot(
         as_of_date=valuation_date,
         underlyings=underlyings,
-        correlations=correlations,
-        risk_free_rate=rf_rate,
+        correlations=_correlation_dict(corr_matrix, tickers),
+        risk_free_rate=_FALLBACK_RATE if rf_rate is None else rf_rate,
+        correlation_matrix=corr_matrix,
+        ticker_index={ticker: i for i, ticker in enumerate(tickers)},
+    )
+    
+    # Only cache complete data: a snapshot patched with fallbacks (default
+    # vol or rate, NaN correlations, missing spots) would otherwise be
+    # served for a day after a transient outage
+    complete = (
+        rf_rate is not None
+        and all(ticker in underlyings for ticker in tickers)
+        and bool(np.isfinite(vols).all())
+        and bool(np.isfinite(corr_matrix).all())
     )
+    if complete:
+        _store_snapshot(cache_path, snapshot)
+    return snapshot
@@ -8,8 +8,11 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date
 from typing import List, Tuple
+import bisect
 import math
 
+import numpy as np
+
 from pricer.core.day_count import DayCountConvention, day_count_fraction
 
 
@@ -26,6 +29,21 @@ class RateCurve(ABC):
         """Calculate continuously compounded zero rate."""
         pass
     
+    def zero_rate_grid(self, from_date: date, to_ords: np.ndarray) -> np.ndarray:
+        """
+        Get zero rates to a whole grid of dates in one call.
+        
+        Args:
+            from_date: Valuation date
+            to_ords: Target dates as int64 ordinals
+            
+        Returns:
+            Zero rate per target date, aligned with ``to_ords``
+        """
+        return np.array([
+            self.zero_rate(from_date, date.fromordinal(int(o))) for o in to_ords
+        ], dtype=np.float64)
+    
     def forward_rate(
         self,
         from_date: date,
@@ -59,17 +77,28 @@ class FlatRateCurve(RateCurve):
     rate: float
     day_count: DayCountConvention = DayCountConvention.ACT_365F
     
+    def __post_init__(self) -> None:
+        """Resolve the day count once; ACT/365F is computed inline."""
+        self._is_act365 = self.day_count == DayCountConvention.ACT_365F
+    
     def discount_factor(self, from_date: date, to_date: date) -> float:
         """Calculate discount factor."""
         if to_date < from_date:
             raise ValueError(f"to_date {to_date} must be >= from_date {from_date}")
         
-        yf = day_count_fraction(from_date, to_date, self.day_count)
+        if self._is_act365:
+            yf = (to_date.toordinal() - from_date.toordinal()) / 365.0
+        else:
+            yf = day_count_fraction(from_date, to_date, self.day_count)
         return math.exp(-self.rate * yf)
     
     def zero_rate(self, from_date: date, to_date: date) -> float:
         """Return the flat rate."""
         return self.rate
+    
+    def zero_rate_grid(self, from_date: date, to_ords: np.ndarray) -> np.ndarray:
+        """Return the flat rate for every target date."""
+        return np.full(len(to_ords), self.rate, dtype=np.float64)
 
 
 @dataclass
@@ -90,28 +119,51 @@ class PiecewiseConstantRateCurve(RateCurve):
     day_count: DayCountConvention = DayCountConvention.ACT_365F
     
     def __post_init__(self) -> None:
-        """Sort tenors by date."""
+        """Sort tenors by date and cache them as ordinal/rate arrays."""
         self.tenors = sorted(self.tenors, key=lambda x: x[0])
+        self._ords = np.fromiter((t.toordinal() for t, _ in self.tenors), dtype=np.int64,
+                                 count=len(self.tenors))
+        self._rates = np.fromiter((r for _, r in self.tenors), dtype=np.float64,
+                                  count=len(self.tenors))
+        self._is_act365 = self.day_count == DayCountConvention.ACT_365F
+        # Plain-list copies for scalar bisect lookups
+        self._ord_list: List[int] = self._ords.tolist()
+        self._rate_list: List[float] = self._rates.tolist()
+    
+    def _rates_at(self, ords: np.ndarray) -> np.ndarray:
+        """
+        Rates applicable at many dates (ordinals).
+        
+        The first rate applies up to the first tenor, each tenor's rate
+        from its date to the next tenor, and the last rate beyond.
+        """
+        if len(self._rates) == 0:
+            return np.zeros(len(ords))
+        idx = np.searchsorted(self._ords, ords, side="right") - 1
+        return self._rates[np.clip(idx, 0, len(self._rates) - 1)]
     
     def _get_rate_at(self, target_date: date) -> float:
         """Get the rate applicable at a target date."""
-        if not self.tenors:
+        if not self._rate_list:
             return 0.0
+        i = bisect.bisect_right(self._ord_list, target_date.toordinal()) - 1
+        return self._rate_list[min(max(i, 0), len(self._rate_list) - 1)]
+    
+    def _integrated_rates(self, from_ord: int, to_ords: np.ndarray) -> np.ndarray:
+        """
+        Integral of the rate from from_ord to each target (ACT/365F).
         
-        # Before first tenor, use first rate
-        if target_date <= self.tenors[0][0]:
-            return self.tenors[0][1]
-        
-        # After last tenor, use last rate
-        if target_date >= self.tenors[-1][0]:
-            return self.tenors[-1][1]
-        
-        # Find applicable tenor bucket
-        for i in range(len(self.tenors) - 1):
-            if target_date < self.tenors[i + 1][0]:
-                return self.tenors[i][1]
+        Segments start at from_ord and at each later tenor; cumulative
+        segment integrals are built once and each target adds its partial
+        last segment.
+        """
+        knots = self._ords[self._ords > from_ord]
+        seg_starts = np.concatenate(([from_ord], knots))
+        seg_rates = self._rates_at(seg_starts)
+        cum = np.concatenate(([0.0], np.cumsum(seg_rates[:-1] * np.diff(seg_starts) / 365.0)))
         
-        return self.tenors[-1][1]
+        j = np.searchsorted(knots, to_ords, side="left")
+        return cum[j] + seg_rates[j] * (to_ords - seg_starts[j]) / 365.0
     
     def discount_factor(self, from_date: date, to_date: date) -> float:
         """
@@ -125,31 +177,28 @@ class PiecewiseConstantRateCurve(RateCurve):
         if to_date == from_date:
             return 1.0
         
-        # Simple integration over rate segments
-        total_log_df = 0.0
-        current = from_date
-        
-        # Get all breakpoints between from_date and to_date
-        breakpoints = [from_date]
-        for tenor_date, _ in self.tenors:
-            if from_date < tenor_date < to_date:
-                breakpoints.append(tenor_date)
-        breakpoints.append(to_date)
-        
-        for i in range(len(breakpoints) - 1):
-            seg_start = breakpoints[i]
-            seg_end = breakpoints[i + 1]
-            rate = self._get_rate_at(seg_start)
-            yf = day_count_fraction(seg_start, seg_end, self.day_count)
-            total_log_df += rate * yf
-        
-        return math.exp(-total_log_df)
+        from_ord, to_ord = from_date.toordinal(), to_date.toordinal()
+        if self._is_act365:
+            return math.exp(-float(self._integrated_rates(from_ord, np.array([to_ord]))[0]))
+        
+        # Breakpoints at every tenor strictly inside (from_date, to_date)
+        inner = self._ords[(self._ords > from_ord) & (self._ords < to_ord)]
+        bps = np.concatenate(([from_ord], inner, [to_ord]))
+        rates = self._rates_at(bps[:-1])
+        yfs = [
+            day_count_fraction(date.fromordinal(int(a)), date.fromordinal(int(b)), self.day_count)
+            for a, b in zip(bps[:-1], bps[1:])
+        ]
+        return math.exp(-float(np.dot(rates, yfs)))
     
     def zero_rate(self, from_date: date, to_date: date) -> float:
         """Calculate effective zero rate."""
         if to_date <= from_date:
             return self._get_rate_at(from_date)
         
+        if self._is_act365:
+            return float(self.zero_rate_grid(from_date, np.array([to_date.toordinal()]))[0])
+        
         df = self.discount_factor(from_date, to_date)
         yf = day_count_fraction(from_date, to_date, self.day_count)
         
@@ -157,3 +206,15 @@ class PiecewiseConstantRateCurve(RateCurve):
             return 0.0
         
         return -math.log(df) / yf
+    
+    def zero_rate_grid(self, from_date: date, to_ords: np.ndarray) -> np.ndarray:
+        """Zero rates to every target, vectorized for ACT/365F."""
+        if not self._is_act365:
+            return super().zero_rate_grid(from_date, to_ords)
+        
+        from_ord = from_date.toordinal()
+        to_ords = np.asarray(to_ords, dtype=np.int64)
+        later = to_ords > from_ord
+        days = np.where(later, to_ords - from_ord, 1)
+        zero = self._integrated_rates(from_ord, np.maximum(to_ords, from_ord)) * 365.0 / days
+        return np.where(later, zero, self._get_rate_at(from_date))
@@ -7,9 +7,12 @@ Supports piecewise constant vol by tenor buckets.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+import bisect
 import math
 
+import numpy as np
+
 from pricer.core.day_count import DayCountConvention, day_count_fraction
 
 
@@ -58,6 +61,26 @@ class VolatilitySurface(ABC):
             forward_var = 0.0
         
         return math.sqrt(forward_var / yf)
+    
+    def sigma_grid(self, reference_date: date, time_grid_ords: np.ndarray) -> np.ndarray:
+        """
+        Get instantaneous vols for a whole time grid in one call.
+        
+        Args:
+            reference_date: Valuation date
+            time_grid_ords: Grid dates as int64 ordinals
+            
+        Returns:
+            Vol per grid date, aligned with ``time_grid_ords``
+        """
+        return np.array([
+            self.get_instantaneous_vol(reference_date, date.fromordinal(int(o)))
+            for o in time_grid_ords
+        ], dtype=np.float64)
+    
+    def get_instantaneous_vol(self, reference_date: date, target_date: date) -> float:
+        """Get the instantaneous (local) vol at a specific date."""
+        return self.get_vol(reference_date, target_date)
 
 
 @dataclass
@@ -69,6 +92,14 @@ class FlatVolatility(VolatilitySurface):
     def get_vol(self, reference_date: date, expiry: date, strike: Optional[float] = None) -> float:
         """Return flat volatility."""
         return self.vol
+    
+    def sigma_grid(self, reference_date: date, time_grid_ords: np.ndarray) -> np.ndarray:
+        """Return the flat vol for every grid date."""
+        return np.full(len(time_grid_ords), self.vol, dtype=np.float64)
+
+
+# Bound on memoized (reference, expiry) pairs per PiecewiseConstantVol
+_TERM_VOL_CACHE_SIZE = 1024
 
 
 @dataclass
@@ -87,25 +118,52 @@ class PiecewiseConstantVol(VolatilitySurface):
     tenors: List[Tuple[date, float]] = field(default_factory=list)
     
     def __post_init__(self) -> None:
-        """Sort tenors by date."""
+        """Sort tenors by date and build parallel ordinal/vol arrays."""
         self.tenors = sorted(self.tenors, key=lambda x: x[0])
+        self._ords = np.fromiter(
+            (t[0].toordinal() for t in self.tenors), dtype=np.int64, count=len(self.tenors)
+        )
+        self._vols = np.fromiter(
+            (t[1] for t in self.tenors), dtype=np.float64, count=len(self.tenors)
+        )
+        # Plain-list copies for scalar bisect lookups
+        self._ord_list: List[int] = self._ords.tolist()
+        self._vol_list: List[float] = self._vols.tolist()
+        # get_vol results keyed by (reference, expiry) ordinals
+        self._term_vol_cache: Dict[Tuple[int, int], float] = {}
+    
+    def get_vols_batch(self, ords: np.ndarray) -> np.ndarray:
+        """
+        Get the vol applicable at each target date.
+        
+        The vol of a bucket applies up to and including its tenor date;
+        dates after the last tenor use the last vol (flat extrapolation).
+        
+        Args:
+            ords: Target dates as int64 ordinals
+            
+        Returns:
+            Vol per target date
+        """
+        if self._vols.size == 0:
+            raise ValueError("No volatility tenors defined")
+        
+        idx = np.searchsorted(self._ords, ords, side="left")
+        return self._vols[np.minimum(idx, self._vols.size - 1)]
     
     def _get_vol_at(self, reference_date: date, target_date: date) -> float:
         """Get the vol applicable at a target date."""
-        if not self.tenors:
+        if not self._vol_list:
             raise ValueError("No volatility tenors defined")
         
-        # For dates at or before first tenor, use first vol
-        if target_date <= self.tenors[0][0]:
-            return self.tenors[0][1]
-        
-        # Find the applicable tenor bucket
-        for i in range(len(self.tenors)):
-            if target_date <= self.tenors[i][0]:
-                return self.tenors[i][1]
-        
-        # After last tenor, use last vol (flat extrapolation)
-        return self.tenors[-1][1]
+        i = bisect.bisect_left(self._ord_list, target_date.toordinal())
+        return self._vol_list[min(i, len(self._vol_list) - 1)]
+    
+    def sigma_grid(self, reference_date: date, time_grid_ords: np.ndarray) -> np.ndarray:
+        """Get instantaneous vols for a whole time grid in one call."""
+        if len(self._vol_list) == 1:
+            return np.full(len(time_grid_ords), self._vol_list[0])
+        return self.get_vols_batch(np.asarray(time_grid_ords, dtype=np.int64))
     
     def get_vol(self, reference_date: date, expiry: date, strike: Optional[float] = None) -> float:
         """
@@ -117,28 +175,30 @@ class PiecewiseConstantVol(VolatilitySurface):
         if expiry <= reference_date:
             return self._get_vol_at(reference_date, reference_date)
         
-        # Calculate total variance by integrating over segments
-        total_variance = 0.0
-        current = reference_date
-        
-        # Get all breakpoints between reference_date and expiry
-        breakpoints = [reference_date]
-        for tenor_date, _ in self.tenors:
-            if reference_date < tenor_date < expiry:
-                breakpoints.append(tenor_date)
-        breakpoints.append(expiry)
+        # A single pillar is a flat vol at every expiry
+        if len(self._vol_list) == 1:
+            return self._vol_list[0]
         
-        for i in range(len(breakpoints) - 1):
-            seg_start = breakpoints[i]
-            seg_end = breakpoints[i + 1]
-            vol = self._get_vol_at(reference_date, seg_end)
-            yf = day_count_fraction(seg_start, seg_end, DayCountConvention.ACT_365F)
-            total_variance += vol * vol * yf
-        
-        total_yf = day_count_fraction(reference_date, expiry, DayCountConvention.ACT_365F)
-        if total_yf <= 0:
-            return self._get_vol_at(reference_date, expiry)
+        key = (reference_date.toordinal(), expiry.toordinal())
+        vol = self._term_vol_cache.get(key)
+        if vol is None:
+            if len(self._term_vol_cache) >= _TERM_VOL_CACHE_SIZE:
+                self._term_vol_cache.clear()
+            vol = self._term_vol_cache[key] = self._term_vol(*key)
+        return vol
+    
+    def _term_vol(self, ref_ord: int, expiry_ord: int) -> float:
+        """
+        Variance-preserving average vol over (ref_ord, expiry_ord] (ACT/365F).
         
+        Segments break at every tenor strictly inside the period; each uses
+        the vol applicable at its end date.
+        """
+        inner = self._ords[(self._ords > ref_ord) & (self._ords < expiry_ord)]
+        bps = np.concatenate(([ref_ord], inner, [expiry_ord]))
+        vols = self.get_vols_batch(bps[1:])
+        total_variance = float(np.dot(vols * vols, np.diff(bps))) / 365.0
+        total_yf = (expiry_ord - ref_ord) / 365.0
         return math.sqrt(total_variance / total_yf)
     
     def get_instantaneous_vol(self, reference_date: date, target_date: date) -> float:
@@ -1,7 +1,7 @@
 """Product-specific pricers."""
 
 from pricer.pricers.event_engine import EventEngine, EvaluationResult, CashFlow, PathResult
-from pricer.pricers.autocall_pricer import AutocallPricer
+from pricer.pricers.autocall_pricer import AutocallPricer, PricedProductPlan
 
 __all__ = [
     "EventEngine",
@@ -9,4 +9,5 @@ __all__ = [
     "CashFlow",
     "PathResult",
     "AutocallPricer",
+    "PricedProductPlan",
 ]
@@ -4,16 +4,29 @@ Autocallable pricer: ties together term sheet, grid, path generator, and event e
 This is the main entry point for pricing autocallable structured products.
 """
 
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import date
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+import copy
+import multiprocessing
 import time
 import numpy as np
 
+from pricer.core.day_count import DayCountConvention, year_fractions
 from pricer.products.schema import TermSheet, load_term_sheet
 from pricer.engines.grid import build_simulation_grid, SimulationGrid
-from pricer.engines.path_generator import PathGenerator, PathGeneratorConfig, SimulatedPaths
-from pricer.pricers.event_engine import EventEngine, EvaluationResult
+from pricer.engines.path_generator import (
+    PathGenerator,
+    PathGeneratorConfig,
+    PathRandoms,
+    SimulatedPaths,
+)
+from pricer.pricers.event_engine import EventEngine, EvaluationResult, combine_evaluations
+from pricer.pricers.event_kernel import HAS_NUMBA
+
+if HAS_NUMBA:
+    import numba
 
 
 @dataclass
@@ -24,6 +37,9 @@ class PricingConfig:
     seed: Optional[int] = None
     antithetic: bool = True
     block_size: int = 50_000
+    num_workers: int = 1  # Worker processes for blocks (1 = in-process)
+    use_qmc: bool = False  # Sobol + Brownian bridge spot normals
+    dtype: np.dtype = np.float32  # Spot path dtype (PV accumulators stay float64)
 
 
 @dataclass
@@ -73,6 +89,40 @@ class PricingResult:
         }
 
 
+@dataclass(frozen=True)
+class PricedProductPlan:
+    """
+    Market-independent pricing inputs for one product.
+    
+    Schedule dates, the simulation grid and payment year fractions depend only
+    on the term sheet's dates, so they are built once and reused across
+    spot/vol bumps. A rate bump only re-derives the discount factors.
+    
+    Attributes:
+        grid: Simulation grid (valuation, observation, ex-div, maturity dates)
+        obs_ords: Observation date ordinals [num_obs]
+        payment_ords: Observation payment dates then maturity payment [num_obs + 1]
+        payment_times: Year fractions of payment_ords on the curve day count
+        rate: Flat discount rate the factors were built with
+        discount_factors: exp(-rate * payment_times) [num_obs + 1]
+    """
+    
+    grid: SimulationGrid
+    obs_ords: np.ndarray
+    payment_ords: np.ndarray
+    payment_times: np.ndarray
+    rate: float
+    discount_factors: np.ndarray
+    
+    def with_rate(self, rate: float) -> "PricedProductPlan":
+        """Return a plan with discount factors rebuilt for a new flat rate."""
+        if rate == self.rate:
+            return self
+        return replace(
+            self, rate=rate, discount_factors=np.exp(-rate * self.payment_times)
+        )
+
+
 class AutocallPricer:
     """
     Pricer for Autocallable structured products.
@@ -97,27 +147,246 @@ class AutocallPricer:
         Returns:
             PricingResult with PV and statistics
         """
-        start_time = time.perf_counter()
+        return self.price_with_plan(term_sheet, self.build_plan(term_sheet))
+    
+    def price_batch(
+        self,
+        term_sheets: List[TermSheet],
+        seed: Optional[int] = None
+    ) -> List[PricingResult]:
+        """
+        Price term sheets sharing dates over one set of random draws.
         
-        # 1. Build simulation grid
+        The term sheets may differ in market data, barrier and coupon levels
+        or payoff flags; each result equals a seeded price() of that term
+        sheet, so A/B comparisons carry no sampling noise from the draws.
+        Adding or removing a KI barrier or an LSV vol model changes the
+        draws themselves, so such term sheets cannot be batched.
+        
+        Args:
+            term_sheets: Term sheets with the same simulation and payment dates
+            seed: Seed for this batch (default: the config's seed); the
+                config is left unchanged
+        
+        Returns:
+            PricingResult per term sheet, in input order
+        
+        Raises:
+            ValueError: If the term sheets' simulation or payment dates, or
+                the draws they need, differ
+        """
+        if not term_sheets:
+            return []
+        
+        plans = [self.build_plan(ts) for ts in term_sheets]
+        base = plans[0]
+        for plan in plans[1:]:
+            if plan.grid.dates != base.grid.dates or not np.array_equal(
+                plan.payment_ords, base.payment_ords
+            ):
+                raise ValueError(
+                    "price_batch term sheets must share simulation and payment dates"
+                )
+        
+        pricer = self if seed is None else AutocallPricer(replace(self.config, seed=seed))
+        return pricer.price_scenarios(term_sheets, base)
+    
+    def build_plan(self, term_sheet: TermSheet) -> PricedProductPlan:
+        """
+        Build the market-independent part of a pricing.
+        
+        The plan can be passed to price_with_plan and price_scenarios to
+        reprice bumped market data of the same product.
+        
+        Args:
+            term_sheet: Validated TermSheet object
+            
+        Returns:
+            PricedProductPlan for the term sheet's schedules and curve
+        """
         grid = build_simulation_grid(term_sheet)
         
-        # 2. Configure and create path generator
-        pg_config = PathGeneratorConfig(
-            num_paths=self.config.num_paths,
-            seed=self.config.seed,
-            antithetic=self.config.antithetic,
-            block_size=self.config.block_size,
+        schedules = term_sheet.schedules
+        payment_ords = np.append(
+            schedules.payment_ords, term_sheet.meta.maturity_payment_date.toordinal()
+        )
+        day_count = DayCountConvention(term_sheet.discount_curve.day_count.value)
+        payment_times = year_fractions(
+            term_sheet.meta.valuation_date, payment_ords, day_count
         )
-        path_gen = PathGenerator(term_sheet, grid, pg_config)
+        rate = term_sheet.discount_curve.flat_rate or 0.0
+        
+        return PricedProductPlan(
+            grid=grid,
+            obs_ords=schedules.observation_ords,
+            payment_ords=payment_ords,
+            payment_times=payment_times,
+            rate=rate,
+            discount_factors=np.exp(-rate * payment_times),
+        )
+    
+    def price_with_plan(
+        self,
+        term_sheet: TermSheet,
+        plan: PricedProductPlan,
+        randoms: Optional[PathRandoms] = None
+    ) -> PricingResult:
+        """
+        Price with a plan built for the same product's dates.
+        
+        Used when repricing under bumped market data (spot, vol, rate): the
+        plan's grid and payment times are reused and only discount factors
+        are rebuilt if the term sheet's flat rate differs from the plan's.
+        
+        Args:
+            term_sheet: Term sheet, possibly with bumped market data
+            plan: Plan from build_plan on a term sheet with the same dates
+            randoms: Pre-drawn random numbers shared with other scenarios
+            
+        Returns:
+            PricingResult with PV and statistics
+        """
+        start_time = time.perf_counter()
+        
+        # 1. Reuse simulation grid; re-discount only on a rate change
+        plan = plan.with_rate(term_sheet.discount_curve.flat_rate or 0.0)
+        grid = plan.grid
+        
+        # 2. Create path generator and event engine
+        path_gen = self._path_generator(term_sheet, grid)
+        event_engine = EventEngine(term_sheet, grid, payment_dfs=plan.discount_factors)
+        
+        # 3. Generate and evaluate paths one block at a time (shared draws
+        # are evaluated as given)
+        if randoms is None and self.config.num_workers > 1 and path_gen.num_blocks > 1:
+            return self._pricing_result(
+                self._evaluate_blocks_parallel(term_sheet, plan, path_gen), start_time
+            )
+        
+        blocks = path_gen.iter_block_randoms() if randoms is None else [randoms]
+        eval_result = combine_evaluations([
+            event_engine.evaluate(path_gen.generate(block)) for block in blocks
+        ])
         
-        # 3. Generate paths
-        paths = path_gen.generate()
+        return self._pricing_result(eval_result, start_time)
+    
+    def price_scenarios(
+        self,
+        term_sheets: List[TermSheet],
+        plan: PricedProductPlan
+    ) -> List[PricingResult]:
+        """
+        Price several market scenarios of one product in a single MC pass.
+        
+        Random numbers and their Cholesky correlation are drawn once per
+        block and shared by every scenario (Common Random Numbers), so each
+        result equals a seeded price() of that scenario. Scenarios may differ
+        in spot, vol and flat rate but must share dates and correlation, and
+        need the same draws (KI barrier presence and LSV assets).
+        
+        Args:
+            term_sheets: Bumped term sheets of the same product
+            plan: Plan from build_plan on the base term sheet
+            
+        Returns:
+            PricingResult per scenario, in input order
+        
+        Raises:
+            ValueError: If a scenario needs different draws than the first
+        """
+        if not term_sheets:
+            return []
+        
+        start_time = time.perf_counter()
+        
+        base_ts = term_sheets[0]
+        base_gen = self._path_generator(base_ts, plan.grid)
+        
+        path_gens = []
+        event_engines = []
+        for ts in term_sheets:
+            scenario_plan = plan.with_rate(ts.discount_curve.flat_rate or 0.0)
+            if ts is base_ts:
+                path_gen = base_gen
+            elif _differs_only_in_spots(base_ts, ts):
+                # Spot bump: reuse the base vol/dividend/correlation setup
+                path_gen = copy.copy(base_gen)
+                path_gen.rebuild_spots(ts.spot_array)
+            else:
+                path_gen = self._path_generator(ts, scenario_plan.grid)
+            if path_gen.randoms_layout != base_gen.randoms_layout:
+                raise ValueError(
+                    "Scenarios must share draw layout (asset count, KI barrier "
+                    "presence and LSV assets) with the first term sheet"
+                )
+            path_gens.append(path_gen)
+            event_engines.append(
+                EventEngine(ts, scenario_plan.grid, payment_dfs=scenario_plan.discount_factors)
+            )
         
-        # 4. Create event engine and evaluate
-        event_engine = EventEngine(term_sheet, grid)
-        eval_result = event_engine.evaluate(paths)
+        def evaluate_scenario(scenario: int, randoms: PathRandoms) -> EvaluationResult:
+            return event_engines[scenario].evaluate(path_gens[scenario].generate(randoms))
         
+        # Scenarios of a block only share the (read-only) draws, so with
+        # num_workers > 1 they are simulated and evaluated on a thread pool
+        scenarios = range(len(term_sheets))
+        num_threads = min(self.config.num_workers, len(term_sheets))
+        block_results: List[List[EvaluationResult]] = [[] for _ in term_sheets]
+        with ThreadPoolExecutor(max_workers=num_threads) as pool:
+            for randoms in path_gens[0].iter_block_randoms():
+                if num_threads > 1:
+                    block = pool.map(evaluate_scenario, scenarios, [randoms] * len(scenarios))
+                else:
+                    block = [evaluate_scenario(s, randoms) for s in scenarios]
+                for results, result in zip(block_results, block):
+                    results.append(result)
+        
+        return [
+            self._pricing_result(combine_evaluations(results), start_time)
+            for results in block_results
+        ]
+    
+    def _evaluate_blocks_parallel(
+        self,
+        term_sheet: TermSheet,
+        plan: PricedProductPlan,
+        path_gen: PathGenerator
+    ) -> EvaluationResult:
+        """
+        Simulate and evaluate blocks in a pool of worker processes.
+        
+        Each worker builds its path generator and event engine once (pool
+        initializer), so tasks only carry a block index. Block b draws from
+        the seed's PCG64 stream jumped b times, the same as a serial price()
+        from a fresh seed; an unseeded config gets one fresh seed shared by
+        all workers.
+        
+        Args:
+            term_sheet: Validated term sheet
+            plan: Plan with discount factors for the term sheet's rate
+            path_gen: Path generator of the serial pricing (for its config)
+            
+        Returns:
+            EvaluationResult over all blocks
+        """
+        pg_config = replace(path_gen.config)
+        if pg_config.seed is None:
+            pg_config.seed = np.random.SeedSequence().entropy
+        
+        num_workers = min(self.config.num_workers, path_gen.num_blocks)
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("spawn"),  # Numba's thread pool is not fork-safe
+            initializer=_init_block_worker,
+            initargs=(term_sheet, plan, pg_config, num_workers),
+        ) as pool:
+            results = list(pool.map(_evaluate_block, range(path_gen.num_blocks)))
+        
+        return combine_evaluations(results)
+    
+    @staticmethod
+    def _pricing_result(eval_result: EvaluationResult, start_time: float) -> PricingResult:
+        """Wrap an evaluation as a PricingResult timed from start_time."""
         end_time = time.perf_counter()
         
         return PricingResult(
@@ -133,11 +402,77 @@ class AutocallPricer:
             autocall_prob_by_date=eval_result.autocall_prob_by_date,
         )
     
+    def simulate(self, term_sheet: TermSheet) -> Tuple[SimulationGrid, SimulatedPaths]:
+        """
+        Simulate all paths of the config in one array.
+        
+        For reports that need per-path outcomes; the cashflow report and PV
+        decomposition both accept the result, so one simulation serves both.
+        
+        Args:
+            term_sheet: Validated TermSheet object
+            
+        Returns:
+            Tuple of (simulation grid, simulated paths)
+        """
+        grid = build_simulation_grid(term_sheet)
+        return grid, self._path_generator(term_sheet, grid).generate()
+    
+    def _path_generator(self, term_sheet: TermSheet, grid: SimulationGrid) -> PathGenerator:
+        """Create a path generator from the pricing config."""
+        pg_config = PathGeneratorConfig(
+            num_paths=self.config.num_paths,
+            seed=self.config.seed,
+            antithetic=self.config.antithetic,
+            block_size=self.config.block_size,
+            use_qmc=self.config.use_qmc,
+            dtype=self.config.dtype,
+        )
+        return PathGenerator(term_sheet, grid, pg_config)
+    
     def set_seed(self, seed: int) -> None:
         """Set random seed for reproducibility."""
         self.config.seed = seed
 
 
+def _differs_only_in_spots(base: TermSheet, term_sheet: TermSheet) -> bool:
+    """Check whether a term sheet equals base up to underlying spots."""
+    def without_spots(ts: TermSheet) -> TermSheet:
+        return ts.model_copy(update={
+            "underlyings": [u.model_copy(update={"spot": 0.0}) for u in ts.underlyings]
+        })
+    
+    return without_spots(term_sheet) == without_spots(base)
+
+
+# Per-process state of block workers, set by _init_block_worker
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_block_worker(
+    term_sheet: TermSheet,
+    plan: PricedProductPlan,
+    pg_config: PathGeneratorConfig,
+    num_workers: int
+) -> None:
+    """Build the path generator and event engine of a block worker."""
+    if HAS_NUMBA:
+        # Share the cores between workers instead of oversubscribing them
+        numba.set_num_threads(max(1, numba.config.NUMBA_NUM_THREADS // num_workers))
+    
+    _WORKER_STATE["path_gen"] = PathGenerator(term_sheet, plan.grid, pg_config)
+    _WORKER_STATE["event_engine"] = EventEngine(
+        term_sheet, plan.grid, payment_dfs=plan.discount_factors
+    )
+
+
+def _evaluate_block(block_idx: int) -> EvaluationResult:
+    """Simulate and evaluate one block in a worker process."""
+    path_gen: PathGenerator = _WORKER_STATE["path_gen"]
+    paths = path_gen.generate(path_gen.block_randoms(block_idx))
+    return _WORKER_STATE["event_engine"].evaluate(paths)
+
+
 def price_from_json(
     json_path: str,
     num_paths: int = 100_000,
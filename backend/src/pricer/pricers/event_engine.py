@@ -11,17 +11,35 @@ At maturity:
 - Apply redemption based on KI state
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Union
+import os
+import threading
 import numpy as np
 
-from pricer.products.schema import TermSheet
+from pricer.products.schema import TermSheet, Payoff
 from pricer.engines.grid import SimulationGrid
 from pricer.engines.path_generator import SimulatedPaths
+from pricer.pricers.event_kernel import (
+    HAS_NUMBA,
+    KI_REDEMPTION_CODES,
+    _autocall_payoff_kernel,
+    _wof_plain_payoff_kernel,
+)
 
 
-@dataclass
+# Paths per tile in the NumPy sweep: the per-path state (alive, unpaid,
+# accumulators) and the performance columns of a tile fit in L2
+SWEEP_BLOCK_SIZE = 16_384
+
+# Per-path coupon counts and autocall observation indices are bounded by the
+# number of observations, so they are stored narrow
+COUNT_DTYPE = np.int16
+
+
+@dataclass(slots=True)
 class CashFlow:
     """A single cash flow."""
     
@@ -33,7 +51,7 @@ class CashFlow:
     pv: float = 0.0     # Discounted amount
 
 
-@dataclass
+@dataclass(slots=True)
 class PathResult:
     """Result for a single Monte Carlo path."""
     
@@ -76,6 +94,121 @@ class EvaluationResult:
     num_steps: int = 0
 
 
+def performance_matrix(
+    spots: np.ndarray,
+    spots_0: np.ndarray,
+    steps: Union[int, np.ndarray],
+    worst_of: bool
+) -> np.ndarray:
+    """
+    Worst-of (or best-of) performance at one or several grid steps.
+    
+    Gathering every step needed up front reduces across assets in one pass
+    over the path tensor, so autocall, coupon and maturity logic can all
+    index the same [num_paths, len(steps)] matrix.
+    
+    Args:
+        spots: Spot paths [num_paths, num_steps+1, num_assets]
+        spots_0: Initial spots [num_assets]
+        steps: Grid step index, or array of step indices
+        worst_of: Min over assets (True) or max (False)
+        
+    Returns:
+        Performance array [num_paths] (or [num_paths, len(steps)])
+    """
+    # Reduce on a (step, asset, path) view: PathGenerator's buffer is asset-
+    # major, so each gathered asset plane is contiguous across paths and the
+    # min/max runs elementwise over a few planes instead of along a short axis
+    planes = spots.transpose(1, 2, 0)[steps]  # [(len(steps),) num_assets, num_paths]
+    # Stay in the path dtype (float32 by default) rather than upcasting, and
+    # scale by reciprocals exactly as the compiled kernel does
+    inv_spots_0 = (1.0 / spots_0).astype(planes.dtype)
+    perf = planes * inv_spots_0[:, None]
+    if worst_of:
+        return np.min(perf, axis=-2).T
+    return np.max(perf, axis=-2).T
+
+
+def maturity_redemption(
+    payoff: Payoff,
+    final_perf: np.ndarray,
+    ki_state: np.ndarray
+) -> np.ndarray:
+    """
+    Maturity redemption per path as a fraction of notional.
+    
+    Every KI rule is a single np.where over the paths, so callers select
+    the paths they need (e.g. those still alive) from the result.
+    
+    Args:
+        payoff: Payoff rules of the term sheet
+        final_perf: Worst-of (or best-of) performance at maturity [num_paths]
+        ki_state: Knock-in flag per path [num_paths]
+        
+    Returns:
+        Redemption fraction per path [num_paths]
+    """
+    # Redemption amounts are accumulated in float64 whatever the path dtype
+    final_perf = np.asarray(final_perf, dtype=np.float64)
+    floor = payoff.ki_redemption_floor or 0.0
+    if payoff.redemption_if_ki == "worst_performance":
+        ki_redemption = final_perf
+    elif payoff.redemption_if_ki == "fixed":
+        ki_redemption = floor
+    else:  # "floored"
+        ki_redemption = np.maximum(final_perf, floor)
+    return np.where(ki_state, ki_redemption, payoff.redemption_if_no_ki)
+
+
+def combine_evaluations(results: List[EvaluationResult]) -> EvaluationResult:
+    """
+    Combine evaluations of disjoint path blocks into one result.
+    
+    Means and per-date probabilities are path-weighted; the standard error
+    is rebuilt from each block's mean and (population) variance.
+    
+    Args:
+        results: Per-block results on the same grid
+        
+    Returns:
+        EvaluationResult over all paths
+    """
+    if len(results) == 1:
+        return results[0]
+    
+    n = np.array([r.num_paths for r in results], dtype=np.float64)
+    total = n.sum()
+    w = n / total
+    
+    def mean_of(attr: str) -> float:
+        return float(np.dot(w, [getattr(r, attr) for r in results]))
+    
+    def by_date(attr: str) -> Dict[date, float]:
+        combined: Dict[date, float] = {}
+        for weight, r in zip(w.tolist(), results):
+            for d, p in getattr(r, attr).items():
+                combined[d] = combined.get(d, 0.0) + weight * p
+        return combined
+    
+    pv_means = np.array([r.pv for r in results])
+    pv_vars = np.array([r.pv_std_error for r in results]) ** 2 * n
+    pv = float(np.dot(w, pv_means))
+    pv_var = max(float(np.dot(w, pv_vars + pv_means ** 2)) - pv * pv, 0.0)
+    
+    return EvaluationResult(
+        pv=pv,
+        pv_std_error=float(np.sqrt(pv_var / total)),
+        autocall_probability=mean_of("autocall_probability"),
+        ki_probability=mean_of("ki_probability"),
+        expected_coupon_count=mean_of("expected_coupon_count"),
+        expected_life=mean_of("expected_life"),
+        autocall_prob_by_date=dict(sorted(by_date("autocall_prob_by_date").items())),
+        coupon_prob_by_date=dict(sorted(by_date("coupon_prob_by_date").items())),
+        num_paths=int(total),
+        num_steps=results[0].num_steps,
+    )
+
+
 class EventEngine:
     """
     Event-driven payoff evaluation engine.
@@ -86,35 +219,73 @@ class EventEngine:
     - Maturity redemption (based on KI state)
     """
     
-    def __init__(self, term_sheet: TermSheet, grid: SimulationGrid) -> None:
+    def __init__(
+        self,
+        term_sheet: TermSheet,
+        grid: SimulationGrid,
+        use_jit: Optional[bool] = None,
+        payment_dfs: Optional[np.ndarray] = None
+    ) -> None:
         self.ts = term_sheet
         self.grid = grid
         
+        # Compiled per-path kernel (defaults to on when Numba is installed)
+        self.use_jit = HAS_NUMBA if use_jit is None else (use_jit and HAS_NUMBA)
+        
         # Extract parameters
         self.notional = term_sheet.meta.notional
         self.worst_of = term_sheet.payoff.worst_of
         self.coupon_memory = term_sheet.payoff.coupon_memory
         self.coupon_on_autocall = term_sheet.payoff.coupon_on_autocall
         
+        # Worst-of without memory or coupon on autocall has a specialised kernel
+        self.plain_worst_of = (
+            self.worst_of and not self.coupon_memory and not self.coupon_on_autocall
+        )
+        
         # Schedules
         self.obs_dates = term_sheet.schedules.observation_dates
         self.payment_dates = term_sheet.schedules.payment_dates
-        self.autocall_levels = np.array(term_sheet.schedules.autocall_levels)
-        self.coupon_barriers = np.array(term_sheet.schedules.coupon_barriers)
-        self.coupon_rates = np.array(term_sheet.schedules.coupon_rates)
+        self.autocall_levels = term_sheet.schedules.autocall_level_array
+        self.coupon_barriers = term_sheet.schedules.coupon_barrier_array
+        self.coupon_rates = term_sheet.schedules.coupon_rate_array
         
         # Maturity
         self.maturity_date = term_sheet.meta.maturity_date
         self.maturity_payment_date = term_sheet.meta.maturity_payment_date
         
         # Initial spots for performance calculation
-        self.spots_0 = np.array([u.spot for u in term_sheet.underlyings])
+        self.spots_0 = term_sheet.spot_array
         
         # === GUARDRAILS ===
         self._validate_inputs()
         
-        # Build discount factor lookup
-        self._build_discount_factors()
+        # Build discount factor lookup (reuse precomputed factors if given)
+        self._build_discount_factors(payment_dfs)
+        
+        # Loop invariants of the NumPy sweep and the plain worst-of kernel:
+        # autocall redemption amount, and the discounted coupon per
+        # observation when there is no memory
+        self.autocall_amount = term_sheet.payoff.redemption_if_autocall * self.notional
+        self.coupon_pvs = self.coupon_rates * self.notional * self.payment_dfs
+        
+        # Grid step per observation (-1 if off-grid), flattened once for the kernel
+        self.obs_steps = np.array(
+            [grid.observation_indices.get(d, -1) for d in self.obs_dates],
+            dtype=np.int64,
+        )
+        # Observations that fall on the grid, in observation order
+        self.obs_used = np.flatnonzero(self.obs_steps >= 0)
+        # Grid steps whose performance the NumPy sweep reads: the used
+        # observations, then maturity when it is on the grid
+        self.perf_steps = self.obs_steps[self.obs_used]
+        if grid.maturity_index >= 0:
+            self.perf_steps = np.append(self.perf_steps, grid.maturity_index)
+        
+        # Sweep output buffers by path count, reused by evaluate() across
+        # blocks and repricings instead of reallocating per call. Pools are
+        # per thread so concurrent evaluate() calls never share buffers.
+        self._local = threading.local()
     
     def _validate_inputs(self) -> None:
         """Validate inputs and raise on inconsistencies."""
@@ -157,6 +328,11 @@ class EventEngine:
             raise ValueError(
                 f"coupon_rates length {len(self.coupon_rates)} != obs_dates length {n_obs}"
             )
+        if n_obs > np.iinfo(COUNT_DTYPE).max:
+            raise ValueError(
+                f"{n_obs} observations exceed the per-path count limit "
+                f"{np.iinfo(COUNT_DTYPE).max}"
+            )
         
         # Validate spots are positive
         if np.any(self.spots_0 <= 0):
@@ -164,49 +340,67 @@ class EventEngine:
                 f"All spot prices must be positive, got {self.spots_0}"
             )
     
-    def _build_discount_factors(self) -> None:
-        """Pre-compute discount factors for all payment dates."""
-        from pricer.core.day_count import DayCountConvention, day_count_fraction
-        
-        valuation = self.ts.meta.valuation_date
-        r = self.ts.discount_curve.flat_rate or 0.0
-        day_count = DayCountConvention(self.ts.discount_curve.day_count.value)
+    def _build_discount_factors(self, payment_dfs: Optional[np.ndarray] = None) -> None:
+        """
+        Pre-compute discount factors for all payment dates.
         
-        self.discount_factors: Dict[date, float] = {}
+        Args:
+            payment_dfs: Optional precomputed factors for the observation payment
+                dates followed by the maturity payment date [num_obs + 1]
+        """
+        if payment_dfs is not None:
+            dfs = np.asarray(payment_dfs, dtype=np.float64)
+        else:
+            from pricer.core.day_count import DayCountConvention, year_fractions
+            
+            valuation = self.ts.meta.valuation_date
+            r = self.ts.discount_curve.flat_rate or 0.0
+            day_count = DayCountConvention(self.ts.discount_curve.day_count.value)
+            
+            # Observation payment dates, then maturity payment date, in one pass
+            pmt_ords = np.append(
+                self.ts.schedules.payment_ords, self.maturity_payment_date.toordinal()
+            )
+            dfs = np.exp(-r * year_fractions(valuation, pmt_ords, day_count))
         
-        # Observation payment dates
-        for pmt_date in self.payment_dates:
-            yf = day_count_fraction(valuation, pmt_date, day_count)
-            self.discount_factors[pmt_date] = np.exp(-r * yf)
+        # Array form, aligned with the observation axis, for the path kernels
+        self.payment_dfs = dfs[:-1].copy()
+        self.maturity_df = float(dfs[-1])
+        self._discount_factor_map: Optional[Dict[date, float]] = None
+    
+    @property
+    def discount_factors(self) -> Dict[date, float]:
+        """
+        Discount factors keyed by payment date (maturity payment included).
         
-        # Maturity payment date
-        yf = day_count_fraction(valuation, self.maturity_payment_date, day_count)
-        self.discount_factors[self.maturity_payment_date] = np.exp(-r * yf)
+        Only for callers that look factors up by date; evaluation indexes
+        payment_dfs / maturity_df by position. Built on first access, so
+        engines created per scenario or block never hash the dates.
+        """
+        if self._discount_factor_map is None:
+            dfs = dict(zip(self.payment_dates, self.payment_dfs.tolist()))
+            dfs[self.maturity_payment_date] = self.maturity_df
+            self._discount_factor_map = dfs
+        return self._discount_factor_map
     
     def _compute_performance(
         self,
         spots: np.ndarray,
-        step: int
+        step: Union[int, np.ndarray]
     ) -> np.ndarray:
         """
-        Compute performance at a given step.
+        Compute performance at one or several grid steps.
         
         Args:
             spots: Spot paths [num_paths, num_steps+1, num_assets]
-            step: Grid step index
+            step: Grid step index, or array of step indices
             
         Returns:
-            Performance array [num_paths]
+            Performance array [num_paths] (or [num_paths, len(step)])
             For worst-of: min over assets
             For best-of: max over assets
         """
-        current_spots = spots[:, step, :]  # [num_paths, num_assets]
-        perf = current_spots / self.spots_0  # [num_paths, num_assets]
-        
-        if self.worst_of:
-            return np.min(perf, axis=1)
-        else:
-            return np.max(perf, axis=1)
+        return performance_matrix(spots, self.spots_0, step, self.worst_of)
     
     def evaluate(self, paths: SimulatedPaths) -> EvaluationResult:
         """
@@ -217,147 +411,326 @@ class EventEngine:
             
         Returns:
             EvaluationResult with PV and statistics
+            
+        Raises:
+            ValueError: If there are no paths
         """
         num_paths = paths.spots.shape[0]
-        num_assets = paths.spots.shape[2]
+        if num_paths == 0:
+            raise ValueError("Cannot evaluate an empty set of paths")
+        maturity_step = self.grid.maturity_index
         
-        # Path state
-        alive = np.ones(num_paths, dtype=bool)  # Still active (not autocalled)
-        unpaid_coupons = np.zeros(num_paths)    # Accumulated unpaid for memory
-        
-        # Accumulators
-        total_pv = np.zeros(num_paths)
-        coupon_count = np.zeros(num_paths)
-        autocall_step = np.full(num_paths, -1, dtype=np.int32)
-        
-        # Per-date statistics
-        autocall_counts: Dict[date, int] = {}
-        coupon_counts: Dict[date, int] = {}
-        
-        # Process each observation date
-        for obs_idx, obs_date in enumerate(self.obs_dates):
-            if obs_date not in self.grid.observation_indices:
-                continue
-                
-            grid_step = self.grid.observation_indices[obs_date]
-            pmt_date = self.payment_dates[obs_idx]
-            df = self.discount_factors.get(pmt_date, 1.0)
+        # Statistics are reduced from the outputs right away, so the sweep
+        # may write into this engine's pooled buffers
+        total_pv, _, _, _, coupon_count, autocall_obs, coupon_hit = self.sweep(
+            paths, reuse_buffers=True
+        )
+        
+        # Per-observation counts in one reduction each (autocalled paths are
+        # shifted to bins 1.., survivors land in bin 0)
+        num_obs = len(self.obs_dates)
+        autocall_counts = np.bincount(autocall_obs + 1, minlength=num_obs + 1)[1:]
+        coupon_counts = coupon_hit.sum(axis=1)
+        num_autocalled = int(autocall_counts.sum())
+        
+        # Expected life (in years) from the counts: autocalled paths end at
+        # their observation's grid time, the rest at maturity. Observations
+        # off the grid never autocall, so their (wrapped) times get weight 0.
+        maturity_time = float(self.grid.times[maturity_step]) if maturity_step >= 0 else 0.0
+        life_total = (
+            float(np.dot(autocall_counts, self.grid.times[self.obs_steps]))
+            + (num_paths - num_autocalled) * maturity_time
+        )
+        
+        # PV mean and (population) variance from the sum and the sum of
+        # squares: two BLAS-style reductions instead of mean + two-pass std
+        pv = float(total_pv.sum()) / num_paths
+        pv_var = max(float(np.dot(total_pv, total_pv)) / num_paths - pv * pv, 0.0)
+        
+        # Per-date statistics, only for dates where something happened
+        return EvaluationResult(
+            pv=pv,
+            pv_std_error=float(np.sqrt(pv_var / num_paths)),
+            autocall_probability=num_autocalled / num_paths,
+            ki_probability=float(np.mean(paths.ki_state)),
+            expected_coupon_count=float(np.mean(coupon_count)),
+            expected_life=life_total / num_paths,
+            autocall_prob_by_date={
+                d: c / num_paths
+                for d, c in zip(self.obs_dates, autocall_counts.tolist()) if c > 0
+            },
+            coupon_prob_by_date={
+                d: c / num_paths
+                for d, c in zip(self.obs_dates, coupon_counts.tolist()) if c > 0
+            },
+            num_paths=num_paths,
+            num_steps=self.grid.num_steps,
+        )
+    
+    def evaluate_batch(
+        self,
+        paths_list: List[SimulatedPaths],
+        max_workers: Optional[int] = None
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate several path sets concurrently in a thread pool.
+        
+        NumPy releases the GIL in the sweep's large array operations, so
+        independent path sets (e.g. blocks or bumped scenarios) overlap.
+        
+        Args:
+            paths_list: Path sets to evaluate
+            max_workers: Thread count (defaults to the CPU count)
             
-            # Compute worst-of performance
-            perf = self._compute_performance(paths.spots, grid_step)
+        Returns:
+            EvaluationResult per path set, in input order
+        """
+        if len(paths_list) <= 1 or max_workers == 1:
+            return [self.evaluate(paths) for paths in paths_list]
+        
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            return list(pool.map(self.evaluate, paths_list))
+    
+    def sweep(self, paths: SimulatedPaths, reuse_buffers: bool = False) -> Tuple[np.ndarray, ...]:
+        """
+        Sweep all paths through the event timeline in one pass.
+        
+        Pricing and the PV decomposition both consume this; the compiled
+        kernel (specialised for plain worst-of structures) is used when
+        enabled, otherwise the NumPy sweep.
+        
+        Args:
+            paths: Simulated paths from PathGenerator
+            reuse_buffers: Write into this engine's pooled output arrays.
+                They are overwritten by the next pooled sweep of the same
+                path count, so callers must finish with them first.
+        
+        Returns:
+            Per-path (total_pv, coupon_pv, autocall_pv, maturity_pv,
+            coupon_count, autocall_obs) and the coupon hit matrix
+            [num_obs, num_paths]. autocall_obs is the observation index of
+            the autocall, or -1.
+        """
+        out = self._output_buffers(paths.spots.shape[0], reuse_buffers)
+        if self.use_jit:
+            return self._sweep_jit(paths, out)
+        return self._sweep_numpy(paths, out)
+    
+    def _output_buffers(self, num_paths: int, reuse: bool) -> Tuple[np.ndarray, ...]:
+        """
+        Output arrays for a sweep of num_paths paths (contents undefined).
+        
+        Args:
+            num_paths: Number of paths swept
+            reuse: Take the pooled arrays for this path count
             
-            # === 1. AUTOCALL CHECK ===
-            autocall_level = self.autocall_levels[obs_idx]
-            autocall_triggered = alive & (perf >= autocall_level)
+        Returns:
+            (total_pv, coupon_pv, autocall_pv, maturity_pv, coupon_count,
+            autocall_obs, coupon_hit) buffers
+        """
+        pool = self._buffer_pool()
+        if reuse and num_paths in pool:
+            return pool[num_paths]
+        
+        out = (
+            *(np.empty(num_paths) for _ in range(4)),
+            np.empty(num_paths, dtype=COUNT_DTYPE),
+            np.empty(num_paths, dtype=COUNT_DTYPE),
+            np.empty((len(self.obs_dates), num_paths), dtype=np.uint8),
+        )
+        if reuse:
+            pool[num_paths] = out
+        return out
+    
+    def _buffer_pool(self) -> Dict[int, Tuple[np.ndarray, ...]]:
+        """This thread's pooled sweep outputs, by path count."""
+        pool = getattr(self._local, "buffers", None)
+        if pool is None:
+            pool = self._local.buffers = {}
+        return pool
+    
+    def _sweep_jit(
+        self,
+        paths: SimulatedPaths,
+        out: Tuple[np.ndarray, ...]
+    ) -> Tuple[np.ndarray, ...]:
+        """Sweep with the compiled per-path kernel into the output buffers."""
+        payoff = self.ts.payoff
+        inv_spots_0 = (1.0 / self.spots_0).astype(paths.spots.dtype)
+        ki_mode = KI_REDEMPTION_CODES[payoff.redemption_if_ki]
+        if self.plain_worst_of:
+            return _wof_plain_payoff_kernel(
+                paths.spots,
+                inv_spots_0,
+                self.obs_steps,
+                self.autocall_levels,
+                self.coupon_barriers,
+                self.coupon_pvs,
+                self.payment_dfs,
+                float(self.notional),
+                float(self.autocall_amount),
+                self.grid.maturity_index,
+                self.maturity_df,
+                paths.ki_state,
+                ki_mode,
+                float(payoff.ki_redemption_floor or 0.0),
+                float(payoff.redemption_if_no_ki),
+                *out,
+            )
+        return _autocall_payoff_kernel(
+            paths.spots,
+            inv_spots_0,
+            self.obs_steps,
+            self.autocall_levels,
+            self.coupon_barriers,
+            self.coupon_rates,
+            self.payment_dfs,
+            float(self.notional),
+            float(payoff.redemption_if_autocall),
+            self.worst_of,
+            self.coupon_memory,
+            self.coupon_on_autocall,
+            self.grid.maturity_index,
+            self.maturity_df,
+            paths.ki_state,
+            ki_mode,
+            float(payoff.ki_redemption_floor or 0.0),
+            float(payoff.redemption_if_no_ki),
+            *out,
+        )
+    
+    def _sweep_numpy(
+        self,
+        paths: SimulatedPaths,
+        out: Tuple[np.ndarray, ...]
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Sweep with NumPy masks, one observation at a time.
+        
+        Paths are processed in tiles of SWEEP_BLOCK_SIZE so the per-path
+        state and performance columns stay cache resident across the
+        observation loop. Produces the same outputs as the compiled kernel.
+        """
+        num_paths = paths.spots.shape[0]
+        
+        # Accumulators (reset, as the buffers may be reused)
+        total_pv, coupon_pv, autocall_pv, maturity_pv, coupon_count, autocall_obs, coupon_hit = out
+        for acc in (coupon_pv, maturity_pv, coupon_hit):
+            acc.fill(0)
+        autocall_obs.fill(-1)
+        
+        # Each tile writes into views of the accumulators
+        for b0 in range(0, num_paths, SWEEP_BLOCK_SIZE):
+            b1 = min(b0 + SWEEP_BLOCK_SIZE, num_paths)
+            self._sweep_numpy_block(
+                paths.spots[b0:b1],
+                paths.ki_state[b0:b1],
+                coupon_pv[b0:b1],
+                maturity_pv[b0:b1],
+                autocall_obs[b0:b1],
+                coupon_hit[:, b0:b1],
+            )
+        
+        # Legs with a scalar payload follow from the recorded events in dense
+        # passes rather than scattered updates inside the observation loop
+        autocalled = autocall_obs >= 0
+        np.multiply(self.autocall_amount, self.payment_dfs[autocall_obs], out=autocall_pv)
+        np.putmask(autocall_pv, ~autocalled, 0.0)
+        
+        np.sum(coupon_hit, axis=0, dtype=COUNT_DTYPE, out=coupon_count)
+        if self.coupon_on_autocall:
+            coupon_count += autocalled
+        
+        np.add(coupon_pv, autocall_pv, out=total_pv)
+        total_pv += maturity_pv
+        return total_pv, coupon_pv, autocall_pv, maturity_pv, coupon_count, autocall_obs, coupon_hit
+    
+    def _sweep_numpy_block(
+        self,
+        spots: np.ndarray,
+        ki_state: np.ndarray,
+        coupon_pv: np.ndarray,
+        maturity_pv: np.ndarray,
+        autocall_obs: np.ndarray,
+        coupon_hit: np.ndarray
+    ) -> None:
+        """
+        Sweep one tile of paths through all observations and maturity.
+        
+        Autocall redemptions and coupon counts are derived afterwards from
+        autocall_obs and coupon_hit.
+        
+        Args:
+            spots: Spot paths of the tile [block, num_steps+1, num_assets]
+            ki_state: Knock-in flag per path [block]
+            coupon_pv, maturity_pv, autocall_obs: Per-path outputs for the
+                tile, updated in place [block]
+            coupon_hit: Coupon hit matrix for the tile, updated in place
+                [num_obs, block]
+        """
+        block = spots.shape[0]
+        payoff = self.ts.payoff
+        notional = self.notional
+        
+        # Path state
+        alive = np.ones(block, dtype=bool)  # Still active (not autocalled)
+        alive_count = block
+        if self.coupon_memory:
+            unpaid_coupons = np.zeros(block)  # Accumulated unpaid for memory
+        
+        # Reduce across assets once for every observation step and maturity,
+        # then compare against every barrier in two broadcasts. The matrices
+        # are observation-major, so each row read in the loop is contiguous.
+        used = self.obs_used
+        perf_all = self._compute_performance(spots, self.perf_steps).T  # [len(perf_steps), block]
+        perf_obs = perf_all[:used.size]
+        ac_trig_all = perf_obs >= self.autocall_levels[used][:, None]
+        cp_trig_all = perf_obs >= self.coupon_barriers[used][:, None]
+        
+        for col, obs_idx in enumerate(used.tolist()):
+            df = self.payment_dfs[obs_idx]
+            coupon_rate = self.coupon_rates[obs_idx]
+            coupon_pv_fixed = self.coupon_pvs[obs_idx]  # Without memory
             
-            if np.any(autocall_triggered):
-                # Redemption payment
-                redemption = self.ts.payoff.redemption_if_autocall * self.notional
-                total_pv[autocall_triggered] += redemption * df
-                
+            # === 1. AUTOCALL CHECK ===
+            # Indices of triggered paths: one scan, then small gathers/scatters
+            ac_idx = np.flatnonzero(alive & ac_trig_all[col])
+            if ac_idx.size > 0:
                 # Coupon on autocall (if enabled)
                 if self.coupon_on_autocall:
-                    coupon_rate = self.coupon_rates[obs_idx]
                     if self.coupon_memory:
-                        coupon_amount = (coupon_rate + unpaid_coupons[autocall_triggered]) * self.notional
+                        coupon_pv[ac_idx] += (coupon_rate + unpaid_coupons[ac_idx]) * notional * df
                     else:
-                        coupon_amount = coupon_rate * self.notional
-                    total_pv[autocall_triggered] += coupon_amount * df
-                    coupon_count[autocall_triggered] += 1
+                        coupon_pv[ac_idx] += coupon_pv_fixed
                 
-                # Mark as autocalled
-                autocall_step[autocall_triggered] = grid_step
-                alive[autocall_triggered] = False
+                autocall_obs[ac_idx] = obs_idx
+                alive[ac_idx] = False
+                alive_count -= ac_idx.size
                 
-                autocall_counts[obs_date] = int(np.sum(autocall_triggered))
+                # Every path has autocalled: later observations change nothing
+                if alive_count == 0:
+                    return
             
             # === 2. COUPON CHECK (for paths still alive) ===
-            if np.any(alive):
-                coupon_barrier = self.coupon_barriers[obs_idx]
-                coupon_triggered = alive & (perf >= coupon_barrier)
-                
-                if np.any(coupon_triggered):
-                    coupon_rate = self.coupon_rates[obs_idx]
-                    
-                    if self.coupon_memory:
-                        # Pay current + accumulated unpaid
-                        coupon_amount = (coupon_rate + unpaid_coupons[coupon_triggered]) * self.notional
-                        unpaid_coupons[coupon_triggered] = 0  # Reset
-                    else:
-                        coupon_amount = coupon_rate * self.notional
-                    
-                    total_pv[coupon_triggered] += coupon_amount * df
-                    coupon_count[coupon_triggered] += 1
-                    
-                    coupon_counts[obs_date] = coupon_counts.get(obs_date, 0) + int(np.sum(coupon_triggered))
-                
-                # === 3. MEMORY UPDATE (for paths that didn't get coupon) ===
+            cp_idx = np.flatnonzero(alive & cp_trig_all[col])
+            if cp_idx.size > 0:
                 if self.coupon_memory:
-                    no_coupon = alive & ~coupon_triggered
-                    coupon_rate = self.coupon_rates[obs_idx]
-                    unpaid_coupons[no_coupon] += coupon_rate
-        
-        # === MATURITY ===
-        maturity_step = self.grid.maturity_index
-        if maturity_step >= 0 and np.any(alive):
-            df_maturity = self.discount_factors.get(self.maturity_payment_date, 1.0)
-            
-            # Final performance
-            final_perf = self._compute_performance(paths.spots, maturity_step)
-            
-            # KI state
-            knocked_in = paths.ki_state
-            
-            # Redemption based on KI state
-            for i in range(num_paths):
-                if not alive[i]:
-                    continue
-                
-                if knocked_in[i]:
-                    # KI occurred - redemption depends on performance
-                    if self.ts.payoff.redemption_if_ki == "worst_performance":
-                        redemption = final_perf[i] * self.notional
-                    elif self.ts.payoff.redemption_if_ki == "fixed":
-                        redemption = (self.ts.payoff.ki_redemption_floor or 0.0) * self.notional
-                    else:  # "floored"
-                        floor = self.ts.payoff.ki_redemption_floor or 0.0
-                        redemption = max(final_perf[i], floor) * self.notional
+                    # Pay current + accumulated unpaid
+                    coupon_pv[cp_idx] += (coupon_rate + unpaid_coupons[cp_idx]) * notional * df
                 else:
-                    # No KI - full redemption
-                    redemption = self.ts.payoff.redemption_if_no_ki * self.notional
-                
-                total_pv[i] += redemption * df_maturity
-        
-        # Compute summary statistics
-        pv = float(np.mean(total_pv))
-        pv_std = float(np.std(total_pv) / np.sqrt(num_paths))
-        
-        autocall_prob = float(np.mean(autocall_step >= 0))
-        ki_prob = float(np.mean(paths.ki_state))
-        expected_coupons = float(np.mean(coupon_count))
-        
-        # Expected life (in years)
-        # For autocalled paths, use autocall time; for others, use maturity
-        life_years = np.where(
-            autocall_step >= 0,
-            self.grid.times[autocall_step],
-            self.grid.times[maturity_step] if maturity_step >= 0 else 0
-        )
-        expected_life = float(np.mean(life_years))
+                    coupon_pv[cp_idx] += coupon_pv_fixed
+                coupon_hit[obs_idx, cp_idx] = 1
+            
+            # === 3. MEMORY UPDATE ===
+            # Accrue on every path and reset those paid; unpaid amounts of
+            # autocalled paths are never read again
+            if self.coupon_memory:
+                unpaid_coupons += coupon_rate
+                unpaid_coupons[cp_idx] = 0.0
         
-        return EvaluationResult(
-            pv=pv,
-            pv_std_error=pv_std,
-            autocall_probability=autocall_prob,
-            ki_probability=ki_prob,
-            expected_coupon_count=expected_coupons,
-            expected_life=expected_life,
-            autocall_prob_by_date={
-                d: c / num_paths for d, c in autocall_counts.items()
-            },
-            coupon_prob_by_date={
-                d: c / num_paths for d, c in coupon_counts.items()
-            },
-            num_paths=num_paths,
-            num_steps=self.grid.num_steps,
-        )
+        # === MATURITY ===
+        if self.grid.maturity_index >= 0 and alive_count > 0:
+            alive_idx = np.flatnonzero(alive)
+            final_perf = perf_all[used.size, alive_idx]
+            redemption = maturity_redemption(payoff, final_perf, ki_state[alive_idx])
+            maturity_pv[alive_idx] = redemption * notional * self.maturity_df
@@ -0,0 +1,330 @@
+"""
+Compiled per-path payoff kernel for the event engine.
+
+The autocall/coupon/memory logic is sequential along the observation axis
+but independent across paths, so it is written as a loop over paths with
+an inner loop over observations and JIT-compiled with Numba when available.
+Without Numba, EventEngine falls back to its vectorized NumPy evaluation.
+The most common structure (worst-of, no memory, no coupon on autocall) has
+its own branch-free variant.
+"""
+
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+
+# KI redemption rule codes (Payoff.redemption_if_ki)
+KI_WORST_PERFORMANCE = 0
+KI_FIXED = 1
+KI_FLOORED = 2
+
+KI_REDEMPTION_CODES = {
+    "worst_performance": KI_WORST_PERFORMANCE,
+    "fixed": KI_FIXED,
+    "floored": KI_FLOORED,
+}
+
+
+def _autocall_payoff_kernel(
+    spots: np.ndarray,
+    inv_spots_0: np.ndarray,
+    obs_steps: np.ndarray,
+    autocall_levels: np.ndarray,
+    coupon_barriers: np.ndarray,
+    coupon_rates: np.ndarray,
+    dfs: np.ndarray,
+    notional: float,
+    autocall_redemption: float,
+    worst_of: bool,
+    coupon_memory: bool,
+    coupon_on_autocall: bool,
+    maturity_step: int,
+    df_maturity: float,
+    ki_state: np.ndarray,
+    ki_mode: int,
+    ki_floor: float,
+    redemption_no_ki: float,
+    total_pv: np.ndarray,
+    coupon_pv: np.ndarray,
+    autocall_pv: np.ndarray,
+    maturity_pv: np.ndarray,
+    coupon_count: np.ndarray,
+    autocall_obs: np.ndarray,
+    coupon_hit: np.ndarray,
+) -> Tuple[np.ndarray, ...]:
+    """
+    Evaluate the autocall payoff path by path.
+
+    Args:
+        spots: Spot paths [num_paths, num_steps+1, num_assets]
+        inv_spots_0: Reciprocal initial spots in the path dtype [num_assets]
+        obs_steps: Grid step per observation (-1 if not on the grid) [num_obs]
+        autocall_levels: Autocall barrier per observation [num_obs]
+        coupon_barriers: Coupon barrier per observation [num_obs]
+        coupon_rates: Coupon rate per observation [num_obs]
+        dfs: Discount factor of each observation's payment date [num_obs]
+        notional: Trade notional
+        autocall_redemption: Redemption paid on autocall (fraction of notional)
+        worst_of: Worst-of (True) or best-of (False) performance
+        coupon_memory: Pay accumulated unpaid coupons when the barrier is met
+        coupon_on_autocall: Pay the coupon when autocall triggers
+        maturity_step: Grid step of maturity (-1 if not on the grid)
+        df_maturity: Discount factor of the maturity payment date
+        ki_state: Knock-in flag per path [num_paths]
+        ki_mode: KI redemption rule code (KI_WORST_PERFORMANCE, ...)
+        ki_floor: KI redemption floor / fixed amount (fraction of notional)
+        redemption_no_ki: Maturity redemption if no KI (fraction of notional)
+        total_pv, coupon_pv, autocall_pv, maturity_pv:
+            Output buffers [num_paths] (float64), overwritten
+        coupon_count, autocall_obs: Output buffers [num_paths] (int16),
+            overwritten
+        coupon_hit: Output buffer [num_obs, num_paths] (uint8), overwritten
+
+    Returns:
+        The output buffers: per-path arrays (total_pv, coupon_pv, autocall_pv,
+        maturity_pv, coupon_count, autocall_obs) and the coupon hit matrix
+        [num_obs, num_paths]. autocall_obs is the observation index of the
+        autocall, or -1.
+    """
+    num_paths = spots.shape[0]
+    num_assets = spots.shape[2]
+    num_obs = obs_steps.shape[0]
+
+    for p in prange(num_paths):
+        # Reset this path's outputs (buffers may be reused across calls)
+        total_pv[p] = 0.0
+        coupon_pv[p] = 0.0
+        autocall_pv[p] = 0.0
+        maturity_pv[p] = 0.0
+        coupon_count[p] = 0
+        autocall_obs[p] = -1
+        for k in range(num_obs):
+            coupon_hit[k, p] = 0
+
+        unpaid = 0.0
+        alive = True
+
+        for k in range(num_obs):
+            step = obs_steps[k]
+            if step < 0:
+                continue
+
+            # Worst-of / best-of performance
+            perf = spots[p, step, 0] * inv_spots_0[0]
+            for a in range(1, num_assets):
+                x = spots[p, step, a] * inv_spots_0[a]
+                if worst_of:
+                    if x < perf:
+                        perf = x
+                elif x > perf:
+                    perf = x
+
+            df = dfs[k]
+
+            # === 1. AUTOCALL CHECK ===
+            if perf >= autocall_levels[k]:
+                redemption = autocall_redemption * notional * df
+                total_pv[p] += redemption
+                autocall_pv[p] += redemption
+
+                if coupon_on_autocall:
+                    if coupon_memory:
+                        cpn = (coupon_rates[k] + unpaid) * notional * df
+                    else:
+                        cpn = coupon_rates[k] * notional * df
+                    total_pv[p] += cpn
+                    coupon_pv[p] += cpn
+                    coupon_count[p] += 1
+
+                autocall_obs[p] = k
+                alive = False
+                break
+
+            # === 2. COUPON CHECK ===
+            if perf >= coupon_barriers[k]:
+                if coupon_memory:
+                    cpn = (coupon_rates[k] + unpaid) * notional * df
+                    unpaid = 0.0
+                else:
+                    cpn = coupon_rates[k] * notional * df
+                total_pv[p] += cpn
+                coupon_pv[p] += cpn
+                coupon_count[p] += 1
+                coupon_hit[k, p] = 1
+
+            # === 3. MEMORY UPDATE ===
+            elif coupon_memory:
+                unpaid += coupon_rates[k]
+
+        # === MATURITY ===
+        if alive and maturity_step >= 0:
+            if ki_state[p]:
+                final_perf = spots[p, maturity_step, 0] * inv_spots_0[0]
+                for a in range(1, num_assets):
+                    x = spots[p, maturity_step, a] * inv_spots_0[a]
+                    if worst_of:
+                        if x < final_perf:
+                            final_perf = x
+                    elif x > final_perf:
+                        final_perf = x
+
+                if ki_mode == KI_WORST_PERFORMANCE:
+                    redemption = final_perf * notional
+                elif ki_mode == KI_FIXED:
+                    redemption = ki_floor * notional
+                else:
+                    redemption = max(final_perf, ki_floor) * notional
+            else:
+                redemption = redemption_no_ki * notional
+
+            total_pv[p] += redemption * df_maturity
+            maturity_pv[p] += redemption * df_maturity
+
+    return total_pv, coupon_pv, autocall_pv, maturity_pv, coupon_count, autocall_obs, coupon_hit
+
+
+def _wof_plain_payoff_kernel(
+    spots: np.ndarray,
+    inv_spots_0: np.ndarray,
+    obs_steps: np.ndarray,
+    autocall_levels: np.ndarray,
+    coupon_barriers: np.ndarray,
+    coupon_pvs: np.ndarray,
+    dfs: np.ndarray,
+    notional: float,
+    autocall_amount: float,
+    maturity_step: int,
+    df_maturity: float,
+    ki_state: np.ndarray,
+    ki_mode: int,
+    ki_floor: float,
+    redemption_no_ki: float,
+    total_pv: np.ndarray,
+    coupon_pv: np.ndarray,
+    autocall_pv: np.ndarray,
+    maturity_pv: np.ndarray,
+    coupon_count: np.ndarray,
+    autocall_obs: np.ndarray,
+    coupon_hit: np.ndarray,
+) -> Tuple[np.ndarray, ...]:
+    """
+    _autocall_payoff_kernel specialised to worst-of, no coupon memory and
+    no coupon on autocall, the most common structure.
+
+    Without memory there is no unpaid-coupon state, an autocall pays only
+    the redemption, and the total is assembled once per path. Arguments
+    are those of _autocall_payoff_kernel without the three flags, except:
+
+    Args:
+        coupon_pvs: Discounted coupon amount per observation [num_obs]
+        autocall_amount: Undiscounted autocall redemption amount
+    """
+    num_paths = spots.shape[0]
+    num_assets = spots.shape[2]
+    num_obs = obs_steps.shape[0]
+
+    for p in prange(num_paths):
+        for k in range(num_obs):
+            coupon_hit[k, p] = 0
+
+        coupons = 0.0
+        count = 0
+        called = -1
+
+        for k in range(num_obs):
+            step = obs_steps[k]
+            if step < 0:
+                continue
+
+            perf = spots[p, step, 0] * inv_spots_0[0]
+            for a in range(1, num_assets):
+                x = spots[p, step, a] * inv_spots_0[a]
+                if x < perf:
+                    perf = x
+
+            if perf >= autocall_levels[k]:
+                called = k
+                break
+
+            if perf >= coupon_barriers[k]:
+                coupons += coupon_pvs[k]
+                count += 1
+                coupon_hit[k, p] = 1
+
+        redemption_pv = 0.0
+        maturity = 0.0
+        if called >= 0:
+            redemption_pv = autocall_amount * dfs[called]
+        elif maturity_step >= 0:
+            if ki_state[p]:
+                final_perf = spots[p, maturity_step, 0] * inv_spots_0[0]
+                for a in range(1, num_assets):
+                    x = spots[p, maturity_step, a] * inv_spots_0[a]
+                    if x < final_perf:
+                        final_perf = x
+
+                if ki_mode == KI_WORST_PERFORMANCE:
+                    redemption = final_perf * notional
+                elif ki_mode == KI_FIXED:
+                    redemption = ki_floor * notional
+                else:
+                    redemption = max(final_perf, ki_floor) * notional
+            else:
+                redemption = redemption_no_ki * notional
+            maturity = redemption * df_maturity
+
+        coupon_pv[p] = coupons
+        autocall_pv[p] = redemption_pv
+        maturity_pv[p] = maturity
+        total_pv[p] = coupons + redemption_pv + maturity
+        coupon_count[p] = count
+        autocall_obs[p] = called
+
+    return total_pv, coupon_pv, autocall_pv, maturity_pv, coupon_count, autocall_obs, coupon_hit
+
+
+if HAS_NUMBA:
+    _autocall_payoff_kernel = njit(parallel=True, fastmath=True, cache=True)(
+        _autocall_payoff_kernel
+    )
+    _wof_plain_payoff_kernel = njit(parallel=True, fastmath=True, cache=True)(
+        _wof_plain_payoff_kernel
+    )
+
+
+def warmup(dtype: np.dtype = np.float32) -> None:
+    """
+    Compile (or load from the on-disk cache) the payoff kernels ahead of use.
+
+    Args:
+        dtype: Spot path dtype to specialise for (PathGeneratorConfig.dtype)
+    """
+    if not HAS_NUMBA:
+        return
+
+    # PathGenerator returns a path-major view of its asset-major buffer
+    obs = np.zeros(1)
+    spots = np.ones((2, 2, 2), dtype=dtype).transpose(2, 0, 1)
+    out = np.zeros(2)
+    counts = np.zeros(2, dtype=np.int16)
+    inv_spots_0 = np.ones(2, dtype=dtype)
+    obs_steps = np.ones(1, dtype=np.int64)
+    ki_state = np.zeros(2, dtype=np.bool_)
+    hit = np.zeros((1, 2), dtype=np.uint8)
+    _autocall_payoff_kernel(
+        spots, inv_spots_0, obs_steps, obs, obs, obs, obs, 1.0, 1.0,
+        True, True, True, 1, 1.0, ki_state, KI_WORST_PERFORMANCE, 0.0, 1.0,
+        out, out, out, out, counts, counts, hit,
+    )
+    _wof_plain_payoff_kernel(
+        spots, inv_spots_0, obs_steps, obs, obs, obs, obs, 1.0, 1.0,
+        1, 1.0, ki_state, KI_WORST_PERFORMANCE, 0.0, 1.0,
+        out, out, out, out, counts, counts, hit,
+    )
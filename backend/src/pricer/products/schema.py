@@ -6,10 +6,14 @@ Comprehensive validation for all term sheet fields with explicit types.
 
 from datetime import date
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Optional, Union, Annotated
 from pydantic import BaseModel, Field, field_validator, model_validator
 import json
-from pathlib import Path
+import numpy as np
+
+from pricer.core.day_count import dates_to_ordinals
 
 
 # ============================================================================
@@ -100,6 +104,16 @@ class DividendModel(BaseModel):
             if self.continuous_yield is None:
                 raise ValueError("continuous_yield required for mixed dividend model")
         return self
+    
+    @property
+    def ex_date_ords(self) -> np.ndarray:
+        """Discrete dividend ex-dates as an int64 array of ordinals."""
+        return dates_to_ordinals([d.ex_date for d in self.discrete_dividends or []])
+    
+    @property
+    def amounts(self) -> np.ndarray:
+        """Discrete dividend amounts, parallel to ex_date_ords."""
+        return np.array([d.amount for d in self.discrete_dividends or []], dtype=np.float64)
 
 
 class VolTenor(BaseModel):
@@ -297,6 +311,31 @@ class Schedules(BaseModel):
                 raise ValueError(f"coupon_barriers[{i}] = {level} out of range (0, 2.0]")
         
         return self
+    
+    @property
+    def observation_ords(self) -> np.ndarray:
+        """Observation dates as an int64 array of ordinals."""
+        return dates_to_ordinals(self.observation_dates)
+    
+    @property
+    def payment_ords(self) -> np.ndarray:
+        """Payment dates as an int64 array of ordinals."""
+        return dates_to_ordinals(self.payment_dates)
+    
+    @property
+    def autocall_level_array(self) -> np.ndarray:
+        """Autocall levels as a float64 array."""
+        return np.array(self.autocall_levels, dtype=np.float64)
+    
+    @property
+    def coupon_barrier_array(self) -> np.ndarray:
+        """Coupon barriers as a float64 array."""
+        return np.array(self.coupon_barriers, dtype=np.float64)
+    
+    @property
+    def coupon_rate_array(self) -> np.ndarray:
+        """Coupon rates as a float64 array."""
+        return np.array(self.coupon_rates, dtype=np.float64)
 
 
 class Payoff(BaseModel):
@@ -392,6 +431,11 @@ class TermSheet(BaseModel):
         
         return self
     
+    @property
+    def spot_array(self) -> np.ndarray:
+        """Underlying spots as a float64 array, in underlying order."""
+        return np.array([u.spot for u in self.underlyings], dtype=np.float64)
+    
     class Config:
         """Pydantic configuration."""
         extra = "forbid"
@@ -409,7 +453,8 @@ def load_term_sheet(path: Union[str, Path]) -> TermSheet:
         path: Path to JSON file
         
     Returns:
-        Validated TermSheet object
+        Validated TermSheet object, a private copy of the parsed file
+        (parsing is cached per file path and modification time)
         
     Raises:
         FileNotFoundError: If file doesn't exist
@@ -419,7 +464,20 @@ def load_term_sheet(path: Union[str, Path]) -> TermSheet:
     if not filepath.exists():
         raise FileNotFoundError(f"Term sheet not found: {path}")
     
-    with open(filepath, "r") as f:
+    cached = _load_term_sheet_cached(str(filepath.resolve()), filepath.stat().st_mtime_ns)
+    return cached.model_copy(deep=True)
+
+
+@lru_cache(maxsize=32)
+def _load_term_sheet_cached(resolved_path: str, mtime_ns: int) -> TermSheet:
+    """
+    Parse and validate a term sheet file, memoized on (path, mtime).
+    
+    The cached TermSheet is never handed out: load_term_sheet returns a deep
+    copy, so callers may mutate theirs. Editing the file changes its mtime
+    and invalidates the entry.
+    """
+    with open(resolved_path, "r") as f:
         data = json.load(f)
     
     return TermSheet(**data)
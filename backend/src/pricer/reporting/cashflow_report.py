@@ -13,9 +13,9 @@ import numpy as np
 from pricer.products.schema import TermSheet
 from pricer.pricers.autocall_pricer import PricingConfig, AutocallPricer
 from pricer.pricers.event_engine import EvaluationResult
-from pricer.engines.grid import build_simulation_grid, SimulationGrid
-from pricer.engines.path_generator import PathGenerator, PathGeneratorConfig
-from pricer.pricers.event_engine import EventEngine
+from pricer.engines.grid import SimulationGrid
+from pricer.engines.path_generator import SimulatedPaths
+from pricer.pricers.event_engine import EventEngine, maturity_redemption, performance_matrix
 
 
 @dataclass
@@ -159,15 +159,19 @@ class CashflowReport:
 def generate_cashflow_report(
     term_sheet: TermSheet,
     pricing_config: Optional[PricingConfig] = None,
-    include_path_stats: bool = True
+    include_path_stats: bool = True,
+    paths: Optional[SimulatedPaths] = None,
+    grid: Optional[SimulationGrid] = None
 ) -> CashflowReport:
     """
     Generate a detailed cashflow report for a structured product.
     
     Args:
         term_sheet: Validated term sheet
-        pricing_config: MC configuration (paths, seed)
+        pricing_config: MC configuration (paths, seed), used only when simulating
         include_path_stats: Whether to compute path statistics
+        paths: Paths from AutocallPricer.simulate, to skip re-simulation
+        grid: Grid the paths were simulated on (required with paths)
         
     Returns:
         CashflowReport with cashflow table and summary
@@ -175,41 +179,32 @@ def generate_cashflow_report(
     import time
     start_time = time.perf_counter()
     
-    pricing_config = pricing_config or PricingConfig()
-    
-    # Build simulation components
-    grid = build_simulation_grid(term_sheet)
-    
-    pg_config = PathGeneratorConfig(
-        num_paths=pricing_config.num_paths,
-        seed=pricing_config.seed,
-        antithetic=pricing_config.antithetic,
-        block_size=pricing_config.block_size,
-    )
-    path_gen = PathGenerator(term_sheet, grid, pg_config)
-    paths = path_gen.generate()
+    # Simulate unless the caller already has paths (e.g. shared with the
+    # PV decomposition)
+    if paths is None:
+        grid, paths = AutocallPricer(pricing_config or PricingConfig()).simulate(term_sheet)
+    elif grid is None:
+        raise ValueError("grid is required when paths are given")
     
     # Evaluate with extended tracking
     event_engine = EventEngine(term_sheet, grid)
     eval_result = event_engine.evaluate(paths)
     
-    num_paths = pricing_config.num_paths
+    num_paths = paths.spots.shape[0]
     notional = term_sheet.meta.notional
     
     # Build cashflow entries from schedules
     cashflows: List[CashflowEntry] = []
     
-    # Get discount factors
-    from pricer.core.day_count import DayCountConvention, day_count_fraction
+    # Discount factors: reuse the event engine's arrays (aligned with the
+    # observation axis, built in one vectorized pass)
     valuation = term_sheet.meta.valuation_date
-    r = term_sheet.discount_curve.flat_rate or 0.0
-    day_count = DayCountConvention(term_sheet.discount_curve.day_count.value)
+    payment_dfs = event_engine.payment_dfs.tolist()
     
     # Per-observation cashflows
     for obs_idx, obs_date in enumerate(term_sheet.schedules.observation_dates):
         pmt_date = term_sheet.schedules.payment_dates[obs_idx]
-        yf = day_count_fraction(valuation, pmt_date, day_count)
-        df = np.exp(-r * yf)
+        df = payment_dfs[obs_idx]
         
         coupon_rate = term_sheet.schedules.coupon_rates[obs_idx]
         
@@ -249,8 +244,7 @@ def generate_cashflow_report(
     
     # Maturity redemption
     maturity_pmt_date = term_sheet.meta.maturity_payment_date
-    yf_maturity = day_count_fraction(valuation, maturity_pmt_date, day_count)
-    df_maturity = np.exp(-r * yf_maturity)
+    df_maturity = event_engine.maturity_df
     
     # Probability of reaching maturity = 1 - autocall_prob
     maturity_prob = 1.0 - eval_result.autocall_probability
@@ -258,60 +252,39 @@ def generate_cashflow_report(
     if maturity_prob > 0:
         # Compute actual expected redemption from MC paths
         # We need to get the actual per-path outcomes
-        spots_0 = np.array([u.spot for u in term_sheet.underlyings])
         maturity_step = grid.maturity_index
         
         if maturity_step >= 0:
-            # Rebuild alive state at maturity by retracing autocalls
+            # Rebuild alive state at maturity by retracing autocalls, reading
+            # grid steps and levels from the engine's per-observation arrays
             alive = np.ones(num_paths, dtype=bool)
-            obs_dates = term_sheet.schedules.observation_dates
-            autocall_levels = np.array(term_sheet.schedules.autocall_levels)
-            worst_of = term_sheet.payoff.worst_of
+            obs_used = event_engine.obs_used
             
-            for obs_idx, obs_date in enumerate(obs_dates):
-                if obs_date not in grid.observation_indices:
-                    continue
-                step = grid.observation_indices[obs_date]
-                current_spots = paths.spots[:, step, :]
-                perf = current_spots / spots_0
-                if worst_of:
-                    wof = np.min(perf, axis=1)
-                else:
-                    wof = np.max(perf, axis=1)
-                ac_level = autocall_levels[obs_idx]
-                alive[alive & (wof >= ac_level)] = False
+            # Performance at every used observation step and at maturity in one pass
+            wof = performance_matrix(
+                paths.spots, event_engine.spots_0,
+                np.append(event_engine.obs_steps[obs_used], maturity_step),
+                term_sheet.payoff.worst_of,
+            )
+            
+            for col, ac_level in enumerate(event_engine.autocall_levels[obs_used]):
+                alive &= wof[:, col] < ac_level
+                if np.count_nonzero(alive) == 0:
+                    break
             
             # For paths alive at maturity, compute redemption
             alive_paths = np.where(alive)[0]
             if len(alive_paths) > 0:
-                final_spots = paths.spots[alive_paths, maturity_step, :]
-                final_perf = final_spots / spots_0
-                if worst_of:
-                    wof_final = np.min(final_perf, axis=1)
-                else:
-                    wof_final = np.max(final_perf, axis=1)
+                wof_final = wof[alive_paths, -1]
                 
                 knocked_in_at_maturity = paths.ki_state[alive_paths]
                 
-                # Compute redemption per path at maturity
-                redemption_per_path = np.zeros(len(alive_paths))
-                
-                # No KI paths
+                # Redemption per path at maturity (same KI rule as the engine)
+                redemption_per_path = maturity_redemption(
+                    term_sheet.payoff, wof_final, knocked_in_at_maturity
+                ) * notional
                 no_ki_mask = ~knocked_in_at_maturity
-                if np.any(no_ki_mask):
-                    redemption_per_path[no_ki_mask] = term_sheet.payoff.redemption_if_no_ki * notional
-                
-                # KI paths
                 ki_mask = knocked_in_at_maturity
-                if np.any(ki_mask):
-                    if term_sheet.payoff.redemption_if_ki == "worst_performance":
-                        redemption_per_path[ki_mask] = wof_final[ki_mask] * notional
-                    elif term_sheet.payoff.redemption_if_ki == "fixed":
-                        floor = term_sheet.payoff.ki_redemption_floor or 0.0
-                        redemption_per_path[ki_mask] = floor * notional
-                    else:  # floored
-                        floor = term_sheet.payoff.ki_redemption_floor or 0.0
-                        redemption_per_path[ki_mask] = np.maximum(wof_final[ki_mask], floor) * notional
                 
                 # Probabilities (fraction of total paths)
                 no_ki_count = np.sum(no_ki_mask)
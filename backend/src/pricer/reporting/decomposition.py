@@ -12,9 +12,9 @@ from typing import Dict, Optional
 import numpy as np
 
 from pricer.products.schema import TermSheet
-from pricer.pricers.autocall_pricer import PricingConfig
-from pricer.engines.grid import build_simulation_grid
-from pricer.engines.path_generator import PathGenerator, PathGeneratorConfig
+from pricer.pricers.autocall_pricer import PricingConfig, AutocallPricer
+from pricer.engines.grid import SimulationGrid
+from pricer.engines.path_generator import SimulatedPaths
 from pricer.pricers.event_engine import EventEngine
 
 
@@ -65,165 +65,41 @@ class PVDecomposition:
 
 def compute_pv_decomposition(
     term_sheet: TermSheet,
-    pricing_config: Optional[PricingConfig] = None
+    pricing_config: Optional[PricingConfig] = None,
+    paths: Optional[SimulatedPaths] = None,
+    grid: Optional[SimulationGrid] = None
 ) -> PVDecomposition:
     """
     Compute PV decomposition by tracking cashflow sources.
     
-    This runs a modified evaluation that tracks coupon vs redemption PV separately.
+    Runs the event engine's path sweep, which tracks coupon, autocall and
+    maturity PV per path, and averages each component.
     
     Args:
         term_sheet: Validated term sheet
-        pricing_config: MC configuration
+        pricing_config: MC configuration (used only when simulating)
+        paths: Paths from AutocallPricer.simulate, to skip re-simulation
+        grid: Grid the paths were simulated on (required with paths)
         
     Returns:
         PVDecomposition with breakdown
     """
-    pricing_config = pricing_config or PricingConfig()
-    
-    # Build simulation components
-    grid = build_simulation_grid(term_sheet)
-    
-    pg_config = PathGeneratorConfig(
-        num_paths=pricing_config.num_paths,
-        seed=pricing_config.seed,
-        antithetic=pricing_config.antithetic,
-        block_size=pricing_config.block_size,
-    )
-    path_gen = PathGenerator(term_sheet, grid, pg_config)
-    paths = path_gen.generate()
+    if paths is None:
+        grid, paths = AutocallPricer(pricing_config or PricingConfig()).simulate(term_sheet)
+    elif grid is None:
+        raise ValueError("grid is required when paths are given")
     
     num_paths = paths.spots.shape[0]
     notional = term_sheet.meta.notional
     
-    # Get discount factors
-    from pricer.core.day_count import DayCountConvention, day_count_fraction
-    valuation = term_sheet.meta.valuation_date
-    r = term_sheet.discount_curve.flat_rate or 0.0
-    day_count = DayCountConvention(term_sheet.discount_curve.day_count.value)
-    
-    # Initial spots for performance
-    spots_0 = np.array([u.spot for u in term_sheet.underlyings])
-    
-    # Path state
-    alive = np.ones(num_paths, dtype=bool)
-    unpaid_coupons = np.zeros(num_paths)
-    
-    # Separate accumulators
-    coupon_pv = np.zeros(num_paths)
-    autocall_redemption_pv = np.zeros(num_paths)
-    maturity_redemption_pv = np.zeros(num_paths)
-    
-    obs_dates = term_sheet.schedules.observation_dates
-    payment_dates = term_sheet.schedules.payment_dates
-    autocall_levels = np.array(term_sheet.schedules.autocall_levels)
-    coupon_barriers = np.array(term_sheet.schedules.coupon_barriers)
-    coupon_rates = np.array(term_sheet.schedules.coupon_rates)
-    
-    worst_of = term_sheet.payoff.worst_of
-    coupon_memory = term_sheet.payoff.coupon_memory
-    coupon_on_autocall = term_sheet.payoff.coupon_on_autocall
-    
-    # Process each observation
-    for obs_idx, obs_date in enumerate(obs_dates):
-        if obs_date not in grid.observation_indices:
-            continue
-        
-        grid_step = grid.observation_indices[obs_date]
-        pmt_date = payment_dates[obs_idx]
-        
-        yf = day_count_fraction(valuation, pmt_date, day_count)
-        df = np.exp(-r * yf)
-        
-        # Performance
-        current_spots = paths.spots[:, grid_step, :]
-        perf = current_spots / spots_0
-        if worst_of:
-            wof_perf = np.min(perf, axis=1)
-        else:
-            wof_perf = np.max(perf, axis=1)
-        
-        # Autocall check
-        autocall_level = autocall_levels[obs_idx]
-        autocall_triggered = alive & (wof_perf >= autocall_level)
-        
-        if np.any(autocall_triggered):
-            # Redemption
-            redemption = term_sheet.payoff.redemption_if_autocall * notional
-            autocall_redemption_pv[autocall_triggered] += redemption * df
-            
-            # Coupon on autocall
-            if coupon_on_autocall:
-                coupon_rate = coupon_rates[obs_idx]
-                if coupon_memory:
-                    coupon_amount = (coupon_rate + unpaid_coupons[autocall_triggered]) * notional
-                else:
-                    coupon_amount = coupon_rate * notional
-                coupon_pv[autocall_triggered] += coupon_amount * df
-            
-            alive[autocall_triggered] = False
-        
-        # Coupon check (alive paths)
-        if np.any(alive):
-            coupon_barrier = coupon_barriers[obs_idx]
-            coupon_triggered = alive & (wof_perf >= coupon_barrier)
-            
-            if np.any(coupon_triggered):
-                coupon_rate = coupon_rates[obs_idx]
-                if coupon_memory:
-                    coupon_amount = (coupon_rate + unpaid_coupons[coupon_triggered]) * notional
-                    unpaid_coupons[coupon_triggered] = 0
-                else:
-                    coupon_amount = coupon_rate * notional
-                
-                coupon_pv[coupon_triggered] += coupon_amount * df
-            
-            # Memory update
-            if coupon_memory:
-                no_coupon = alive & ~coupon_triggered
-                coupon_rate = coupon_rates[obs_idx]
-                unpaid_coupons[no_coupon] += coupon_rate
-    
-    # Maturity
-    maturity_step = grid.maturity_index
-    if maturity_step >= 0 and np.any(alive):
-        maturity_pmt_date = term_sheet.meta.maturity_payment_date
-        yf_maturity = day_count_fraction(valuation, maturity_pmt_date, day_count)
-        df_maturity = np.exp(-r * yf_maturity)
-        
-        # Final performance
-        final_spots = paths.spots[:, maturity_step, :]
-        final_perf = final_spots / spots_0
-        if worst_of:
-            wof_final = np.min(final_perf, axis=1)
-        else:
-            wof_final = np.max(final_perf, axis=1)
-        
-        # KI state
-        knocked_in = paths.ki_state
-        
-        # Redemption
-        for i in range(num_paths):
-            if not alive[i]:
-                continue
-            
-            if knocked_in[i]:
-                if term_sheet.payoff.redemption_if_ki == "worst_performance":
-                    redemption = wof_final[i] * notional
-                elif term_sheet.payoff.redemption_if_ki == "fixed":
-                    redemption = (term_sheet.payoff.ki_redemption_floor or 0.0) * notional
-                else:  # floored
-                    floor = term_sheet.payoff.ki_redemption_floor or 0.0
-                    redemption = max(wof_final[i], floor) * notional
-            else:
-                redemption = term_sheet.payoff.redemption_if_no_ki * notional
-            
-            maturity_redemption_pv[i] += redemption * df_maturity
+    # One sweep of the event engine yields each path's coupon, autocall and
+    # maturity PV legs (compiled kernel with Numba, NumPy masks otherwise)
+    engine = EventEngine(term_sheet, grid)
+    _, coupon_pv, autocall_pv, maturity_pv, _, _, _ = engine.sweep(paths)
     
-    # Aggregate
     total_coupon_pv = float(np.mean(coupon_pv))
-    total_autocall_pv = float(np.mean(autocall_redemption_pv))
-    total_maturity_pv = float(np.mean(maturity_redemption_pv))
+    total_autocall_pv = float(np.mean(autocall_pv))
+    total_maturity_pv = float(np.mean(maturity_pv))
     total_redemption_pv = total_autocall_pv + total_maturity_pv
     total_pv = total_coupon_pv + total_redemption_pv
     
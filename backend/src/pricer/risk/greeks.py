@@ -11,12 +11,11 @@ CRN ensures same random paths for base and bumped scenarios.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Any, List
-from copy import deepcopy
+from typing import Callable, Dict, Optional, Any, List, Tuple
 import numpy as np
 import logging
 
-from pricer.products.schema import TermSheet, VolModelType
+from pricer.products.schema import LSVParams, TermSheet, Underlying, VolModelType
 from pricer.pricers.autocall_pricer import AutocallPricer, PricingConfig, PricingResult
 
 
@@ -115,16 +114,30 @@ class GreeksResult:
         print("=" * 60)
 
 
+def _replace_underlying(
+    term_sheet: TermSheet,
+    asset_id: str,
+    update: Callable[[Underlying], Underlying]
+) -> TermSheet:
+    """
+    Create term sheet with one underlying replaced.
+    
+    Only the bumped underlying is copied; every other sub-model is shared
+    with the input (no deepcopy, no re-validation).
+    """
+    underlyings = [
+        update(u) if u.id == asset_id else u
+        for u in term_sheet.underlyings
+    ]
+    return term_sheet.model_copy(update={"underlyings": underlyings})
+
+
 def _bump_spot(term_sheet: TermSheet, asset_id: str, bump_pct: float) -> TermSheet:
     """Create term sheet with bumped spot for one underlying."""
-    ts = deepcopy(term_sheet)
-    
-    for underlying in ts.underlyings:
-        if underlying.id == asset_id:
-            underlying.spot = underlying.spot * (1.0 + bump_pct)
-            break
-    
-    return ts
+    return _replace_underlying(
+        term_sheet, asset_id,
+        lambda u: u.model_copy(update={"spot": u.spot * (1.0 + bump_pct)}),
+    )
 
 
 def _bump_vol(
@@ -134,39 +147,60 @@ def _bump_vol(
     relative: bool = False
 ) -> TermSheet:
     """Create term sheet with bumped vol for one underlying."""
-    ts = deepcopy(term_sheet)
-    
-    for underlying in ts.underlyings:
-        if underlying.id == asset_id:
-            vol_model = underlying.vol_model
-            
-            if vol_model.type == VolModelType.FLAT:
-                if vol_model.flat_vol is not None:
-                    if relative:
-                        vol_model.flat_vol = vol_model.flat_vol * (1.0 + bump)
-                    else:
-                        vol_model.flat_vol = vol_model.flat_vol + bump
-            
-            elif vol_model.type == VolModelType.PIECEWISE_CONSTANT:
-                if vol_model.term_structure:
-                    for tenor in vol_model.term_structure:
-                        if relative:
-                            tenor.vol = tenor.vol * (1.0 + bump)
-                        else:
-                            tenor.vol = tenor.vol + bump
-            break
-    
-    return ts
+    def bump_one(vol: float) -> float:
+        return vol * (1.0 + bump) if relative else vol + bump
+    
+    def bump_vol_model(u: Underlying) -> Underlying:
+        vol_model = u.vol_model
+        update: Dict[str, Any] = {}
+        
+        if vol_model.type == VolModelType.FLAT:
+            if vol_model.flat_vol is not None:
+                update["flat_vol"] = bump_one(vol_model.flat_vol)
+        
+        elif vol_model.type == VolModelType.PIECEWISE_CONSTANT:
+            if vol_model.term_structure:
+                update["term_structure"] = [
+                    tenor.model_copy(update={"vol": bump_one(tenor.vol)})
+                    for tenor in vol_model.term_structure
+                ]
+        
+        elif vol_model.type == VolModelType.LOCAL_STOCHASTIC:
+            # Bump v0 and theta as vol levels: V -> bump(sqrt(V))^2
+            params = vol_model.lsv_params
+            if params is not None:
+                levels = {
+                    name: bump_one(float(np.sqrt(getattr(params, name))))
+                    for name in ("v0", "theta")
+                }
+                for name, level in levels.items():
+                    if level <= 0.0:
+                        raise ValueError(
+                            f"Vol bump {bump} leaves a non-positive {name} vol level "
+                            f"({level:.4f}) for {u.id}"
+                        )
+                # Re-validate so the field bounds and Feller check apply to the bump
+                update["lsv_params"] = LSVParams.model_validate({
+                    **params.model_dump(),
+                    **{name: level ** 2 for name, level in levels.items()},
+                })
+        
+        if not update:
+            return u
+        return u.model_copy(update={"vol_model": vol_model.model_copy(update=update)})
+    
+    return _replace_underlying(term_sheet, asset_id, bump_vol_model)
 
 
 def _bump_rate(term_sheet: TermSheet, bump: float) -> TermSheet:
     """Create term sheet with bumped discount rate."""
-    ts = deepcopy(term_sheet)
+    curve = term_sheet.discount_curve
+    if curve.flat_rate is None:
+        return term_sheet.model_copy()
     
-    if ts.discount_curve.flat_rate is not None:
-        ts.discount_curve.flat_rate = ts.discount_curve.flat_rate + bump
-    
-    return ts
+    return term_sheet.model_copy(update={
+        "discount_curve": curve.model_copy(update={"flat_rate": curve.flat_rate + bump})
+    })
 
 
 def compute_greeks(
@@ -201,124 +235,85 @@ def compute_greeks(
     asset_ids = [u.id for u in term_sheet.underlyings]
     notional = term_sheet.meta.notional
     
-    # Create pricer
+    # Create pricer; schedules, grid and payment times are shared by all bumps
     pricer = AutocallPricer(pricing_config)
+    plan = pricer.build_plan(term_sheet)
+    
+    # === SCENARIOS: (greek, asset, direction) -> bumped term sheet ===
+    central = bump_config.use_central_diff
+    directions = (1, -1) if central else (1,)
+    scenarios: List[Tuple[Tuple[str, Optional[str], int], TermSheet]] = [
+        (("base", None, 0), term_sheet)
+    ]
+    
+    for asset_id in asset_ids:
+        for sign in directions:
+            scenarios.append((
+                ("delta", asset_id, sign),
+                _bump_spot(term_sheet, asset_id, sign * bump_config.delta_bump),
+            ))
+    
+    for asset_id in asset_ids:
+        for sign in directions:
+            scenarios.append((
+                ("vega", asset_id, sign),
+                _bump_vol(
+                    term_sheet, asset_id,
+                    sign * bump_config.vega_bump,
+                    relative=bump_config.vega_bump_relative
+                ),
+            ))
+    
+    if bump_config.compute_rho:
+        for sign in directions:
+            scenarios.append((
+                ("rho", None, sign),
+                _bump_rate(term_sheet, sign * bump_config.rho_bump),
+            ))
     
-    # === BASE CASE ===
+    # One MC pass: every scenario reuses the same random draws (CRN)
     pricer.set_seed(base_seed)
-    base_result = pricer.price(term_sheet)
+    results = pricer.price_scenarios([ts for _, ts in scenarios], plan)
+    pvs = {key: result.pv for (key, _), result in zip(scenarios, results)}
+    
+    base_result = results[0]
     base_pv = base_result.pv
     
     diagnostics: Dict[str, Any] = {
         "base_seed": base_seed,
         "num_paths": pricing_config.num_paths,
-        "num_bump_scenarios": 0,
+        "num_bump_scenarios": len(scenarios) - 1,
     }
     
+    def finite_difference(greek: str, asset_id: Optional[str], bump: float) -> float:
+        """Central (PV_up - PV_down) / (2 * bump), or forward (PV_up - PV_base) / bump."""
+        pv_up = pvs[(greek, asset_id, 1)]
+        if central:
+            return (pv_up - pvs[(greek, asset_id, -1)]) / (2.0 * bump)
+        return (pv_up - base_pv) / bump
+    
     # === DELTA: per-underlying spot bump ===
+    # Delta = dPV / d(Spot/Spot0): the dollar delta for a 1% spot move
     delta: Dict[str, float] = {}
     delta_pct: Dict[str, float] = {}
     
     for asset_id in asset_ids:
-        if bump_config.use_central_diff:
-            # Central difference: (PV_up - PV_down) / (2 * bump)
-            ts_up = _bump_spot(term_sheet, asset_id, bump_config.delta_bump)
-            ts_down = _bump_spot(term_sheet, asset_id, -bump_config.delta_bump)
-            
-            pricer.set_seed(base_seed)
-            pv_up = pricer.price(ts_up).pv
-            
-            pricer.set_seed(base_seed)
-            pv_down = pricer.price(ts_down).pv
-            
-            # Delta = dPV / d(Spot/Spot0) = dPV / (2 * bump)
-            # This is the dollar delta for a 1% spot move
-            raw_delta = (pv_up - pv_down) / (2.0 * bump_config.delta_bump)
-            
-            diagnostics["num_bump_scenarios"] += 2
-        else:
-            # Forward difference: (PV_up - PV_base) / bump
-            ts_up = _bump_spot(term_sheet, asset_id, bump_config.delta_bump)
-            
-            pricer.set_seed(base_seed)
-            pv_up = pricer.price(ts_up).pv
-            
-            raw_delta = (pv_up - base_pv) / bump_config.delta_bump
-            
-            diagnostics["num_bump_scenarios"] += 1
-        
+        raw_delta = finite_difference("delta", asset_id, bump_config.delta_bump)
         delta[asset_id] = raw_delta
         delta_pct[asset_id] = raw_delta / notional * 100.0
     
     # === VEGA: per-underlying vol bump ===
-    vega: Dict[str, float] = {}
-    
-    for asset_id in asset_ids:
-        if bump_config.use_central_diff:
-            ts_up = _bump_vol(
-                term_sheet, asset_id, 
-                bump_config.vega_bump, 
-                relative=bump_config.vega_bump_relative
-            )
-            ts_down = _bump_vol(
-                term_sheet, asset_id, 
-                -bump_config.vega_bump,
-                relative=bump_config.vega_bump_relative
-            )
-            
-            pricer.set_seed(base_seed)
-            pv_up = pricer.price(ts_up).pv
-            
-            pricer.set_seed(base_seed)
-            pv_down = pricer.price(ts_down).pv
-            
-            # Vega = dPV / dVol (for 1 vol point = 0.01 bump)
-            raw_vega = (pv_up - pv_down) / (2.0 * bump_config.vega_bump)
-            
-            diagnostics["num_bump_scenarios"] += 2
-        else:
-            ts_up = _bump_vol(
-                term_sheet, asset_id,
-                bump_config.vega_bump,
-                relative=bump_config.vega_bump_relative
-            )
-            
-            pricer.set_seed(base_seed)
-            pv_up = pricer.price(ts_up).pv
-            
-            raw_vega = (pv_up - base_pv) / bump_config.vega_bump
-            
-            diagnostics["num_bump_scenarios"] += 1
-        
-        vega[asset_id] = raw_vega
+    # Vega = dPV / dVol (for 1 vol point = 0.01 bump)
+    vega: Dict[str, float] = {
+        asset_id: finite_difference("vega", asset_id, bump_config.vega_bump)
+        for asset_id in asset_ids
+    }
     
     # === RHO: rate bump (optional) ===
+    # Rho = dPV / dRate (for 1bp = 0.0001 bump)
     rho: Optional[float] = None
-    
     if bump_config.compute_rho:
-        if bump_config.use_central_diff:
-            ts_up = _bump_rate(term_sheet, bump_config.rho_bump)
-            ts_down = _bump_rate(term_sheet, -bump_config.rho_bump)
-            
-            pricer.set_seed(base_seed)
-            pv_up = pricer.price(ts_up).pv
-            
-            pricer.set_seed(base_seed)
-            pv_down = pricer.price(ts_down).pv
-            
-            # Rho = dPV / dRate (for 1bp = 0.0001 bump)
-            rho = (pv_up - pv_down) / (2.0 * bump_config.rho_bump)
-            
-            diagnostics["num_bump_scenarios"] += 2
-        else:
-            ts_up = _bump_rate(term_sheet, bump_config.rho_bump)
-            
-            pricer.set_seed(base_seed)
-            pv_up = pricer.price(ts_up).pv
-            
-            rho = (pv_up - base_pv) / bump_config.rho_bump
-            
-            diagnostics["num_bump_scenarios"] += 1
+        rho = finite_difference("rho", None, bump_config.rho_bump)
     
     return GreeksResult(
         base_pv=base_pv,
@@ -6,19 +6,33 @@ Generates formatted reports with PV, Greeks, and cashflow tables.
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, List, Optional, Any
+from functools import cached_property
+from typing import Dict, List, Optional, Any, Tuple
 import json
+import math
+import sys
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from pricer.products.base import Product
 from pricer.engines.base import PricingResult, CashFlow
 
 
-@dataclass
+_BANNER = "=" * 60
+_GREEK_FMT = "{:15s} {:,.4f}".format
+
+
+@dataclass(frozen=True)
 class RiskReport:
     """
     Risk report for a structured product.
     
-    Consolidates pricing result, Greeks, and cashflow analysis.
+    Consolidates pricing result, Greeks, and cashflow analysis. Reports are
+    immutable, so the serialized payload is built once and reused.
     """
     
     product_id: str
@@ -26,8 +40,9 @@ class RiskReport:
     result: PricingResult
     greeks: Dict[str, float]
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize report to dictionary."""
+    @cached_property
+    def _payload(self) -> Dict[str, Any]:
+        """Serialized fields, built on first use."""
         return {
             "product_id": self.product_id,
             "valuation_date": self.valuation_date.isoformat(),
@@ -37,41 +52,73 @@ class RiskReport:
             "ki_probability": self.result.ki_probability,
             "expected_coupon_count": self.result.expected_coupon_count,
             "expected_life": self.result.expected_life,
-            "greeks": self.greeks,
+            "greeks": dict(self.greeks),
             "num_paths": self.result.num_paths,
             "computation_time_ms": self.result.computation_time_ms,
         }
     
+    @cached_property
+    def _json_payload(self) -> Dict[str, Any]:
+        """Payload with NaN/inf written as null, so both encoders agree."""
+        def finite(value: Any) -> Any:
+            if isinstance(value, float) and not math.isfinite(value):
+                return None
+            return value
+        
+        payload = {key: finite(value) for key, value in self._payload.items()}
+        payload["greeks"] = {name: finite(value) for name, value in self._payload["greeks"].items()}
+        return payload
+    
+    @cached_property
+    def _summary_greeks(self) -> List[Tuple[str, float]]:
+        """Greeks shown in the summary (all but "pv"), sorted by name."""
+        return sorted((name, value) for name, value in self.greeks.items() if name != "pv")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize report to dictionary."""
+        return dict(self._payload)
+    
     def to_json(self, indent: int = 2) -> str:
-        """Serialize report to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        """
+        Serialize report to JSON string.
+        
+        Non-finite values (e.g. a NaN std error or Greek) are written as
+        null. The default indent of 2 is encoded with orjson when it is
+        installed; the output parses to the same values as json's, but
+        floats may be spelled differently (1e-5 rather than 1e-05) and
+        non-ASCII characters are not escaped.
+        """
+        if HAS_ORJSON and indent == 2:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+            return orjson.dumps(self._json_payload, option=option).decode()
+        return json.dumps(self._json_payload, indent=indent)
     
     def print_summary(self) -> None:
-        """Print formatted summary to console."""
-        print(f"\n{'='*60}")
-        print(f"Risk Report: {self.product_id}")
-        print(f"Valuation Date: {self.valuation_date}")
-        print(f"{'='*60}")
-        
-        print(f"\n--- Pricing ---")
-        print(f"PV:              {self.result.pv:,.2f}")
-        print(f"Std Error:       {self.result.pv_std_error:,.4f}")
-        print(f"Paths:           {self.result.num_paths:,}")
-        print(f"Time:            {self.result.computation_time_ms:.1f} ms")
-        
-        print(f"\n--- Probabilities ---")
-        print(f"Autocall Prob:   {self.result.autocall_probability:.2%}")
-        print(f"KI Prob:         {self.result.ki_probability:.2%}")
-        print(f"Exp. Coupons:    {self.result.expected_coupon_count:.2f}")
-        print(f"Exp. Life:       {self.result.expected_life:.2f} years")
+        """Print formatted summary to console (one buffered write)."""
+        result = self.result
+        lines = [
+            f"\n{_BANNER}",
+            f"Risk Report: {self.product_id}",
+            f"Valuation Date: {self.valuation_date}",
+            _BANNER,
+            f"\n--- Pricing ---",
+            f"PV:              {result.pv:,.2f}",
+            f"Std Error:       {result.pv_std_error:,.4f}",
+            f"Paths:           {result.num_paths:,}",
+            f"Time:            {result.computation_time_ms:.1f} ms",
+            f"\n--- Probabilities ---",
+            f"Autocall Prob:   {result.autocall_probability:.2%}",
+            f"KI Prob:         {result.ki_probability:.2%}",
+            f"Exp. Coupons:    {result.expected_coupon_count:.2f}",
+            f"Exp. Life:       {result.expected_life:.2f} years",
+        ]
         
         if self.greeks:
-            print(f"\n--- Greeks ---")
-            for name, value in sorted(self.greeks.items()):
-                if name != "pv":
-                    print(f"{name:15s} {value:,.4f}")
+            lines.append(f"\n--- Greeks ---")
+            lines.extend(_GREEK_FMT(name, value) for name, value in self._summary_greeks)
         
-        print(f"\n{'='*60}\n")
+        lines.append(f"\n{_BANNER}\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def generate_report(
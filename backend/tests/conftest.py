@@ -2,11 +2,17 @@
 Shared pytest fixtures for pricer tests.
 
 Provides reusable test data and configurations for unit and integration tests.
+The data fixtures are session-scoped and shared between tests: copy a model
+(model_copy(deep=True)) before mutating it.
 """
 
+import json
+import numpy as np
 import pytest
 from datetime import date, timedelta
-from typing import Dict, Any
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Any, List
 
 from pricer.products.schema import (
     TermSheet,
@@ -24,33 +30,102 @@ from pricer.products.schema import (
     BarrierMonitoringType,
     SettlementType,
     DayCountConvention,
+    load_term_sheet,
 )
-from pricer.pricers.autocall_pricer import PricingConfig
+from pricer.pricers.autocall_pricer import AutocallPricer, PricingConfig
 
 
-@pytest.fixture
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+EXAMPLE_WORSTOF_PATH = (EXAMPLES_DIR / "autocall_worstof_continuous_ki.json").resolve()
+
+# Path count the "heavy" tests' tolerances were set for
+FULL_NUM_PATHS = 10_000
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--num-paths",
+        type=int,
+        default=FULL_NUM_PATHS,
+        help="Monte Carlo paths of the qualitative pricing tests (e.g. 2000 for a quick run)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    """
+    Skip tests marked heavy when run with fewer than FULL_NUM_PATHS paths,
+    and tests using example_worstof_ts when the example file is missing.
+    
+    The file is checked once per session instead of once per test.
+    """
+    skip_heavy = None
+    if config.getoption("--num-paths") < FULL_NUM_PATHS:
+        skip_heavy = pytest.mark.skip(reason=f"needs --num-paths >= {FULL_NUM_PATHS}")
+    skip_example = None
+    if not EXAMPLE_WORSTOF_PATH.exists():
+        skip_example = pytest.mark.skip(reason="Example term sheet not found")
+    
+    for item in items:
+        if skip_heavy is not None and "heavy" in item.keywords:
+            item.add_marker(skip_heavy)
+        if skip_example is not None and "example_worstof_ts" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip_example)
+
+
+@pytest.fixture(scope="session")
+def num_paths(request: pytest.FixtureRequest) -> int:
+    """Path count for tests asserting inequalities rather than values."""
+    return request.config.getoption("--num-paths")
+
+
+@pytest.fixture(scope="session")
+def example_worstof_ts() -> TermSheet:
+    """
+    Worst-of continuous-KI example term sheet, parsed once per session.
+    
+    The instance is shared between tests, so tests must not mutate it.
+    """
+    return load_term_sheet(EXAMPLE_WORSTOF_PATH)
+
+
+@pytest.fixture(scope="session")
 def valuation_date() -> date:
     """Standard valuation date for tests."""
     return date(2024, 1, 15)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def maturity_date(valuation_date: date) -> date:
     """Standard maturity date (3 years from valuation)."""
     return valuation_date + timedelta(days=3 * 365)
 
 
-@pytest.fixture
-def pricing_config() -> PricingConfig:
+@pytest.fixture(scope="session")
+def pricing_config(num_paths: int) -> PricingConfig:
     """Standard pricing configuration for tests."""
     return PricingConfig(
-        num_paths=10_000,  # Smaller for faster tests
+        num_paths=num_paths,  # Smaller for faster tests
         seed=42,
         block_size=5_000,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def pricer_factory() -> Callable[[int, int], AutocallPricer]:
+    """
+    Shared AutocallPricer per (num_paths, seed), built on first request.
+    
+    The pricers are shared between tests, so tests must not call set_seed
+    or otherwise mutate their config; build a private pricer for that.
+    """
+    @lru_cache(maxsize=None)
+    def factory(num_paths: int, seed: int) -> AutocallPricer:
+        return AutocallPricer(PricingConfig(num_paths=num_paths, seed=seed))
+    
+    return factory
+
+
+@pytest.fixture(scope="session")
 def single_asset_underlying() -> Underlying:
     """Single underlying asset for testing."""
     return Underlying(
@@ -68,7 +143,7 @@ def single_asset_underlying() -> Underlying:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multi_asset_underlyings() -> list[Underlying]:
     """Multiple underlying assets for worst-of testing."""
     return [
@@ -114,7 +189,7 @@ def multi_asset_underlyings() -> list[Underlying]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def discount_curve() -> DiscountCurve:
     """Standard discount curve for testing."""
     return DiscountCurve(
@@ -124,7 +199,7 @@ def discount_curve() -> DiscountCurve:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def correlation_matrix() -> Correlation:
     """Correlation matrix for multi-asset products."""
     return Correlation(
@@ -136,15 +211,12 @@ def correlation_matrix() -> Correlation:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def autocall_schedules(valuation_date: date, maturity_date: date) -> Schedules:
     """Standard quarterly autocall observation schedule."""
-    obs_dates = []
-    current = valuation_date + timedelta(days=90)  # First obs in 3 months
-
-    while current <= maturity_date:
-        obs_dates.append(current)
-        current += timedelta(days=90)  # Quarterly
+    # Quarterly observations, the first in 3 months
+    offsets = np.arange(90, (maturity_date - valuation_date).days + 1, 90)
+    obs_dates = [valuation_date + timedelta(days=int(o)) for o in offsets]
 
     # Payment dates 2 business days after observation
     pay_dates = [d + timedelta(days=2) for d in obs_dates]
@@ -159,7 +231,7 @@ def autocall_schedules(valuation_date: date, maturity_date: date) -> Schedules:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_autocall_term_sheet(
     valuation_date: date,
     maturity_date: date,
@@ -198,7 +270,7 @@ def simple_autocall_term_sheet(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def worst_of_autocall_term_sheet(
     valuation_date: date,
     maturity_date: date,
@@ -238,10 +310,16 @@ def worst_of_autocall_term_sheet(
     )
 
 
+@pytest.fixture(scope="session")
+def term_sheet_json(simple_autocall_term_sheet: TermSheet) -> str:
+    """Term sheet serialized to JSON once per session."""
+    return simple_autocall_term_sheet.model_dump_json()
+
+
 @pytest.fixture
-def term_sheet_dict(simple_autocall_term_sheet: TermSheet) -> Dict[str, Any]:
-    """Term sheet as dictionary for JSON serialization testing."""
-    return simple_autocall_term_sheet.model_dump(mode="json")
+def term_sheet_dict(term_sheet_json: str) -> Dict[str, Any]:
+    """Term sheet as dictionary for JSON serialization testing (a fresh copy per test)."""
+    return json.loads(term_sheet_json)
 
 
 # Parametrized fixtures for testing different scenarios
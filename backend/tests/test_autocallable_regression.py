@@ -2,48 +2,32 @@
 
 import pytest
 import numpy as np
-from pathlib import Path
 
-from pricer.products.schema import load_term_sheet
+from pricer.products.schema import TermSheet
 from pricer.pricers.autocall_pricer import AutocallPricer, PricingConfig
+from pricer.reporting import compute_pv_decomposition, generate_cashflow_report
 
 
+@pytest.mark.slow
 class TestAutocallableRegression:
     """Regression tests with fixed seed to verify pricing stability."""
     
-    @pytest.fixture
-    def term_sheet_path(self) -> Path:
-        """Get path to example term sheet."""
-        return Path(__file__).parent.parent / "examples" / "autocall_worstof_continuous_ki.json"
+    def test_fixed_seed_gives_stable_pv(self, example_worstof_ts: TermSheet) -> None:
+        """The same seed and inputs must reproduce the result exactly."""
+        ts = example_worstof_ts
+        
+        result1 = AutocallPricer(PricingConfig(num_paths=10_000, seed=12345)).price(ts)
+        result2 = AutocallPricer(PricingConfig(num_paths=10_000, seed=12345)).price(ts)
+        
+        # The RNG is deterministic, so the results are bitwise equal
+        assert result1.pv == result2.pv
+        assert result1.pv_std_error == result2.pv_std_error
+        assert result1.ki_probability == result2.ki_probability
+        assert result1.autocall_probability == result2.autocall_probability
     
-    def test_fixed_seed_gives_stable_pv(self, term_sheet_path: Path) -> None:
-        """PV should be stable within tolerance for fixed seed."""
-        if not term_sheet_path.exists():
-            pytest.skip("Example term sheet not found")
-        
-        ts = load_term_sheet(term_sheet_path)
-        
-        # Run twice with same seed
-        config = PricingConfig(num_paths=10_000, seed=12345)
-        pricer = AutocallPricer(config)
-        
-        result1 = pricer.price(ts)
-        
-        # Reset seed and run again
-        pricer.set_seed(12345)
-        result2 = pricer.price(ts)
-        
-        # PV should be identical for same seed
-        assert result1.pv == pytest.approx(result2.pv, rel=1e-10)
-        assert result1.ki_probability == pytest.approx(result2.ki_probability, rel=1e-10)
-        assert result1.autocall_probability == pytest.approx(result2.autocall_probability, rel=1e-10)
-    
-    def test_different_seeds_give_different_pv(self, term_sheet_path: Path) -> None:
+    def test_different_seeds_give_different_pv(self, example_worstof_ts: TermSheet) -> None:
         """Different seeds should give slightly different PV."""
-        if not term_sheet_path.exists():
-            pytest.skip("Example term sheet not found")
-        
-        ts = load_term_sheet(term_sheet_path)
+        ts = example_worstof_ts
         
         config1 = PricingConfig(num_paths=10_000, seed=111)
         pricer1 = AutocallPricer(config1)
@@ -56,12 +40,9 @@ class TestAutocallableRegression:
         # Should be different (but within MC error)
         assert result1.pv != result2.pv  # Unlikely to be exactly equal
     
-    def test_more_paths_reduces_std_error(self, term_sheet_path: Path) -> None:
+    def test_more_paths_reduces_std_error(self, example_worstof_ts: TermSheet) -> None:
         """More paths should reduce standard error."""
-        if not term_sheet_path.exists():
-            pytest.skip("Example term sheet not found")
-        
-        ts = load_term_sheet(term_sheet_path)
+        ts = example_worstof_ts
         
         config_low = PricingConfig(num_paths=5_000, seed=42)
         result_low = AutocallPricer(config_low).price(ts)
@@ -72,12 +53,9 @@ class TestAutocallableRegression:
         # Std error should decrease with more paths (roughly sqrt(n) relationship)
         assert result_high.pv_std_error < result_low.pv_std_error
     
-    def test_pv_is_reasonable(self, term_sheet_path: Path) -> None:
+    def test_pv_is_reasonable(self, example_worstof_ts: TermSheet) -> None:
         """PV should be in a reasonable range."""
-        if not term_sheet_path.exists():
-            pytest.skip("Example term sheet not found")
-        
-        ts = load_term_sheet(term_sheet_path)
+        ts = example_worstof_ts
         
         config = PricingConfig(num_paths=20_000, seed=42)
         result = AutocallPricer(config).price(ts)
@@ -95,7 +73,7 @@ class TestAutocallableRegression:
         assert result.expected_life > 0
         assert result.expected_life <= 4.0  # ~3 years + some buffer
     
-    def test_golden_pv_regression(self, term_sheet_path: Path) -> None:
+    def test_golden_pv_regression(self, example_worstof_ts: TermSheet) -> None:
         """
         PV should match a known golden value within tolerance.
         
@@ -106,10 +84,7 @@ class TestAutocallableRegression:
         
         If this test fails after intentional logic changes, update the golden value.
         """
-        if not term_sheet_path.exists():
-            pytest.skip("Example term sheet not found")
-        
-        ts = load_term_sheet(term_sheet_path)
+        ts = example_worstof_ts
         
         # Use specific config for reproducibility
         config = PricingConfig(num_paths=50_000, seed=12345)
@@ -140,22 +115,34 @@ class TestAutocallableRegression:
         print(f"  KI Prob: {result.ki_probability:.4f}")
         print(f"  Autocall Prob: {result.autocall_probability:.4f}")
         print(f"  Expected Life: {result.expected_life:.4f}")
+    
+    def test_reports_reuse_simulated_paths(self, example_worstof_ts: TermSheet) -> None:
+        """Reports on shared paths should match reports that simulate their own."""
+        ts = example_worstof_ts
+        config = PricingConfig(num_paths=5_000, seed=7)
+        grid, paths = AutocallPricer(config).simulate(ts)
+        
+        shared = compute_pv_decomposition(ts, config, paths=paths, grid=grid)
+        fresh = compute_pv_decomposition(ts, config)
+        assert shared.total_pv == fresh.total_pv
+        assert shared.coupon_pv == fresh.coupon_pv
+        
+        shared_report = generate_cashflow_report(ts, config, paths=paths, grid=grid)
+        fresh_report = generate_cashflow_report(ts, config)
+        assert [c.expected_amount for c in shared_report.cashflows] == [
+            c.expected_amount for c in fresh_report.cashflows
+        ]
+        
+        with pytest.raises(ValueError):
+            compute_pv_decomposition(ts, config, paths=paths)
 
 
 class TestPricingEdgeCases:
     """Edge case tests for pricing."""
     
-    @pytest.fixture
-    def term_sheet_path(self) -> Path:
-        """Get path to example term sheet."""
-        return Path(__file__).parent.parent / "examples" / "autocall_worstof_continuous_ki.json"
-    
-    def test_zero_paths_raises(self, term_sheet_path: Path) -> None:
+    def test_zero_paths_raises(self, example_worstof_ts: TermSheet) -> None:
         """Zero paths should raise or return NaN."""
-        if not term_sheet_path.exists():
-            pytest.skip("Example term sheet not found")
-        
-        ts = load_term_sheet(term_sheet_path)
+        ts = example_worstof_ts
         
         # This should either raise or handle gracefully
         config = PricingConfig(num_paths=0, seed=42)
@@ -2,8 +2,36 @@
 
 import pytest
 import numpy as np
+from typing import Tuple
 
-from pricer.engines.path_generator import brownian_bridge_hit_probability
+from pricer.engines.path_generator import (
+    brownian_bridge_hit_probability,
+    brownian_bridge_normals,
+    brownian_bridge_order,
+)
+
+
+# (S_start, S_end, barrier, vol, dt) of the vectorized tests
+BBInputs = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, float]
+
+# Parameter sweeps of the monotonicity tests
+MONOTONIC_BARRIERS = [90.0, 85.0, 80.0, 75.0, 70.0, 65.0]
+MONOTONIC_VOLS = [0.10, 0.15, 0.20, 0.25, 0.30, 0.40]
+MONOTONIC_DTS = [0.1, 0.25, 0.5, 1.0, 2.0]
+
+
+@pytest.fixture(scope="session")
+def bb_large_inputs() -> BBInputs:
+    """1000 random (S_start, S_end) pairs with a flat barrier, vol and dt."""
+    rng = np.random.default_rng(42)
+    n = 1000
+    return (
+        rng.uniform(90, 110, n),
+        rng.uniform(85, 115, n),
+        np.full(n, 70.0),
+        np.full(n, 0.25),
+        0.5,
+    )
 
 
 class TestBrownianBridgeHitProbability:
@@ -95,16 +123,10 @@ class TestBrownianBridgeHitProbability:
         prob = brownian_bridge_hit_probability(S_start, S_end, barrier, vol, 0.0)
         assert prob[0] == 0.0
     
-    def test_vectorized_computation(self) -> None:
+    def test_vectorized_computation(self, bb_large_inputs: BBInputs) -> None:
         """Test vectorized computation with multiple paths."""
-        rng = np.random.default_rng(42)
-        n_paths = 1000
-        
-        S_start = rng.uniform(90, 110, n_paths)
-        S_end = rng.uniform(85, 115, n_paths)
-        barrier = np.full(n_paths, 70.0)
-        vol = np.full(n_paths, 0.25)
-        dt = 0.5
+        S_start, S_end, barrier, vol, dt = bb_large_inputs
+        n_paths = S_start.size
         
         prob = brownian_bridge_hit_probability(S_start, S_end, barrier, vol, dt)
         
@@ -115,30 +137,37 @@ class TestBrownianBridgeHitProbability:
         assert np.all(prob >= 0)
         assert np.all(prob <= 1)
     
+    @pytest.mark.parametrize("down", [True, False])
+    def test_jit_matches_numpy(self, down: bool) -> None:
+        """The compiled kernel must agree with the NumPy evaluation, with broadcasting."""
+        rng = np.random.default_rng(7)
+        S_start = rng.uniform(60, 140, (3, 500))
+        S_end = rng.uniform(60, 140, (3, 500))
+        barrier = np.array([[70.0], [80.0], [130.0]])  # [num_assets, 1]
+        vol = np.full((3, 1), 0.25)
+        
+        ref = brownian_bridge_hit_probability(S_start, S_end, barrier, vol, 0.5, down, use_jit=False)
+        jit = brownian_bridge_hit_probability(S_start, S_end, barrier, vol, 0.5, down, use_jit=True)
+        
+        assert jit.shape == ref.shape
+        np.testing.assert_allclose(jit, ref, rtol=1e-10, atol=1e-14)
+    
     def test_monotonicity_closer_barrier_higher_prob(self) -> None:
         """
         Closer barrier should ALWAYS result in higher hitting probability.
         
         This is a critical monotonicity property for the Brownian bridge formula.
         """
-        S_start = np.array([100.0])
-        S_end = np.array([95.0])
-        vol = np.array([0.25])
-        dt = 0.5
+        barriers = np.array(MONOTONIC_BARRIERS)
+        n = barriers.size
         
-        # Test a range of barrier distances
-        barriers = [90.0, 85.0, 80.0, 75.0, 70.0, 65.0]
-        probs = []
-        
-        for barrier_level in barriers:
-            barrier = np.array([barrier_level])
-            prob = brownian_bridge_hit_probability(S_start, S_end, barrier, vol, dt)
-            probs.append(prob[0])
+        # One call over the whole sweep of barrier distances
+        probs = brownian_bridge_hit_probability(
+            np.full(n, 100.0), np.full(n, 95.0), barriers, np.full(n, 0.25), 0.5
+        )
         
         # Closer barrier (higher value) should give higher probability
-        for i in range(len(probs) - 1):
-            assert probs[i] >= probs[i + 1], \
-                f"Barrier {barriers[i]} prob {probs[i]} should be >= barrier {barriers[i+1]} prob {probs[i+1]}"
+        assert np.all(np.diff(probs) <= 0), f"Probabilities {probs} not decreasing"
     
     def test_monotonicity_lower_vol_lower_prob(self) -> None:
         """
@@ -146,24 +175,15 @@ class TestBrownianBridgeHitProbability:
         
         Less vol = more predictable paths = less likely to deviate to barrier.
         """
-        S_start = np.array([100.0])
-        S_end = np.array([95.0])
-        barrier = np.array([70.0])
-        dt = 0.5
-        
-        # Test a range of volatilities
-        vols = [0.10, 0.15, 0.20, 0.25, 0.30, 0.40]
-        probs = []
+        vols = np.array(MONOTONIC_VOLS)
+        n = vols.size
         
-        for vol_level in vols:
-            vol = np.array([vol_level])
-            prob = brownian_bridge_hit_probability(S_start, S_end, barrier, vol, dt)
-            probs.append(prob[0])
+        probs = brownian_bridge_hit_probability(
+            np.full(n, 100.0), np.full(n, 95.0), np.full(n, 70.0), vols, 0.5
+        )
         
         # Higher vol should give higher probability
-        for i in range(len(probs) - 1):
-            assert probs[i] <= probs[i + 1], \
-                f"Vol {vols[i]} prob {probs[i]} should be <= vol {vols[i+1]} prob {probs[i+1]}"
+        assert np.all(np.diff(probs) >= 0), f"Probabilities {probs} not increasing"
     
     def test_monotonicity_longer_time_higher_prob(self) -> None:
         """
@@ -176,15 +196,41 @@ class TestBrownianBridgeHitProbability:
         barrier = np.array([70.0])
         vol = np.array([0.25])
         
-        # Test a range of time intervals
-        dts = [0.1, 0.25, 0.5, 1.0, 2.0]
-        probs = []
-        
-        for dt in dts:
-            prob = brownian_bridge_hit_probability(S_start, S_end, barrier, vol, dt)
-            probs.append(prob[0])
+        # dt is a scalar of the formula, so this sweep calls once per interval
+        probs = np.concatenate([
+            brownian_bridge_hit_probability(S_start, S_end, barrier, vol, dt)
+            for dt in MONOTONIC_DTS
+        ])
         
         # Longer time should give higher probability
-        for i in range(len(probs) - 1):
-            assert probs[i] <= probs[i + 1], \
-                f"dt {dts[i]} prob {probs[i]} should be <= dt {dts[i+1]} prob {probs[i+1]}"
+        assert np.all(np.diff(probs) >= 0), f"Probabilities {probs} not increasing"
+
+
+class TestBrownianBridgeConstruction:
+    """Tests for Brownian bridge path construction (QMC)."""
+    
+    def test_order_visits_each_point_once(self) -> None:
+        """Terminal point first, then every point exactly once."""
+        for n in range(1, 20):
+            order = brownian_bridge_order(n)
+            assert order[0] == n - 1
+            assert sorted(order.tolist()) == list(range(n))
+    
+    def test_increments_are_independent_standard_normals(self) -> None:
+        """Constructed step normals must have identity covariance on an uneven grid."""
+        times = np.array([0.1, 0.3, 0.35, 1.0, 1.2])
+        z = np.random.default_rng(0).standard_normal((200_000, 5, 1))
+        
+        out = brownian_bridge_normals(z, times)[:, :, 0]
+        
+        np.testing.assert_allclose(np.cov(out.T), np.eye(5), atol=0.02)
+    
+    def test_terminal_value_uses_first_normal(self) -> None:
+        """The sum of increments must equal sqrt(T) times the first normal."""
+        times = np.array([0.25, 0.5, 0.75, 1.0, 2.0])
+        z = np.random.default_rng(1).standard_normal((10, 5, 2))
+        
+        out = brownian_bridge_normals(z, times)
+        W_T = np.sum(out * np.sqrt(np.diff(np.concatenate([[0.0], times])))[None, :, None], axis=1)
+        
+        np.testing.assert_allclose(W_T, np.sqrt(2.0) * z[:, 0, :], rtol=1e-12, atol=1e-12)
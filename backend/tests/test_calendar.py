@@ -0,0 +1,86 @@
+"""Tests for business day calendars."""
+
+from datetime import date, timedelta
+
+import numpy as np
+
+from pricer.core.calendar import (
+    BusinessDayConvention,
+    Calendar,
+    adjust_date,
+    adjust_dates,
+    business_days_between,
+)
+
+
+HOLIDAYS = {date(2024, 1, 1), date(2024, 7, 4), date(2024, 12, 25), date(2025, 1, 1)}
+
+
+class TestPrecomputedCalendar:
+    """Precomputed mask queries must match the day-by-day implementation."""
+
+    def setup_method(self) -> None:
+        self.loop_cal = Calendar("TEST", holidays=set(HOLIDAYS))
+        self.mask_cal = Calendar(
+            "TEST",
+            holidays=set(HOLIDAYS),
+            start=date(2023, 12, 1),
+            end=date(2025, 2, 1),
+        )
+        self.days = [date(2023, 12, 1) + timedelta(days=i) for i in range(428)]
+
+    def test_is_business_day(self) -> None:
+        """Test business day flags agree over the full range."""
+        for d in self.days:
+            assert self.mask_cal.is_business_day(d) == self.loop_cal.is_business_day(d)
+
+    def test_next_and_prev_business_day(self) -> None:
+        """Test rolling forwards and backwards, including past the range edges."""
+        for d in self.days + [date(2025, 2, 1), date(2023, 12, 2)]:
+            assert self.mask_cal.next_business_day(d) == self.loop_cal.next_business_day(d)
+            assert self.mask_cal.prev_business_day(d) == self.loop_cal.prev_business_day(d)
+
+    def test_add_business_days(self) -> None:
+        """Test adding positive and negative business day offsets."""
+        for d in self.days[::7]:
+            for n in (-30, -5, -1, 0, 1, 5, 30):
+                assert self.mask_cal.add_business_days(d, n) == self.loop_cal.add_business_days(d, n)
+
+    def test_business_days_between(self) -> None:
+        """Test counting business days in (start, end]."""
+        start = date(2024, 1, 1)
+        for end in self.days[::11]:
+            assert business_days_between(start, end, self.mask_cal) == business_days_between(
+                start, end, self.loop_cal
+            )
+
+    def test_business_days_between_outside_range(self) -> None:
+        """Test counting falls back correctly beyond the precomputed range."""
+        start = date(2023, 6, 1)
+        end = date(2026, 3, 1)
+        expected = sum(
+            self.loop_cal.is_business_day(start + timedelta(days=i))
+            for i in range(1, (end - start).days + 1)
+        )
+        assert business_days_between(start, end, self.mask_cal) == expected
+        assert business_days_between(start, end, self.loop_cal) == expected
+
+    def test_add_holidays_rebuilds_mask(self) -> None:
+        """Test that adding holidays updates the precomputed mask."""
+        d = date(2024, 11, 28)
+        assert self.mask_cal.is_business_day(d)
+        self.mask_cal.add_holidays({d})
+        assert not self.mask_cal.is_business_day(d)
+
+    def test_is_business_day_vec(self) -> None:
+        """Test vectorized classification matches the scalar check."""
+        ords = np.array([d.toordinal() for d in self.days], dtype=np.int64)
+        expected = [self.loop_cal.is_business_day(d) for d in self.days]
+        assert self.loop_cal.is_business_day_vec(ords).tolist() == expected
+        assert Calendar("WE").is_business_day_vec(ords[:7]).sum() == 5
+
+    def test_adjust_dates_matches_adjust_date(self) -> None:
+        """Test batched adjustment agrees with the scalar rule for every convention."""
+        for convention in BusinessDayConvention:
+            expected = [adjust_date(d, convention, self.loop_cal) for d in self.days]
+            assert adjust_dates(self.days, convention, self.loop_cal).tolist() == expected
@@ -0,0 +1,53 @@
+"""Tests for the column-wise cash flow table."""
+
+import pytest
+from datetime import date
+
+from pricer.engines.base import CashFlow, CashFlowTable, PricingResult
+
+
+CASHFLOWS = [
+    CashFlow(date=date(2024, 4, 15), amount=25_000.0, type="coupon"),
+    CashFlow(date=date(2024, 7, 15), amount=25_000.0, type="coupon"),
+    CashFlow(date=date(2024, 7, 15), amount=1_000_000.0, type="autocall"),
+    CashFlow(date=date(2025, 1, 15), amount=640_000.0, type="redemption", underlying="MSFT"),
+    CashFlow(date=date(2025, 1, 15), amount=12_500.0, type="maturity", underlying="AAPL"),
+]
+
+
+class TestCashFlowTable:
+    """Conversion to and from CashFlow objects, and aggregation."""
+    
+    def test_round_trip(self) -> None:
+        """Test a table converts back to the cash flows it was built from."""
+        table = CashFlowTable.from_cashflows(CASHFLOWS)
+        assert len(table) == len(CASHFLOWS)
+        assert table.underlyings == ["MSFT", "AAPL"]
+        assert table.to_cashflows() == CASHFLOWS
+    
+    def test_empty_round_trip(self) -> None:
+        """Test an empty list gives an empty table."""
+        table = CashFlowTable.from_cashflows([])
+        assert len(table) == 0
+        assert table.to_cashflows() == []
+        assert table.total_by_type() == {
+            "coupon": 0.0, "redemption": 0.0, "autocall": 0.0, "maturity": 0.0
+        }
+    
+    def test_total_by_type(self) -> None:
+        """Test per-type sums, including types without flows."""
+        totals = CashFlowTable.from_cashflows(CASHFLOWS[:3]).total_by_type()
+        assert totals == {
+            "coupon": 50_000.0, "redemption": 0.0, "autocall": 1_000_000.0, "maturity": 0.0
+        }
+    
+    def test_unknown_type_is_rejected(self) -> None:
+        """Test a type outside CASHFLOW_TYPE_CODES raises a ValueError naming it."""
+        flows = CASHFLOWS + [CashFlow(date=date(2025, 1, 15), amount=1.0, type="fee")]
+        with pytest.raises(ValueError, match="'fee'"):
+            CashFlowTable.from_cashflows(flows)
+    
+    def test_pricing_result_table(self) -> None:
+        """Test PricingResult exposes its expected cash flows as a table."""
+        result = PricingResult(pv=1.0, expected_cashflows=CASHFLOWS)
+        assert result.cashflow_table.to_cashflows() == CASHFLOWS
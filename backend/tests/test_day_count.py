@@ -5,8 +5,10 @@ from datetime import date
 
 from pricer.core.day_count import (
     DayCountConvention,
+    dates_to_ordinals,
     day_count_fraction,
     year_fraction_to_days,
+    year_fractions,
 )
 
 
@@ -60,6 +62,28 @@ class TestDayCountFraction:
             day_count_fraction(start, end, DayCountConvention.ACT_360)
 
 
+class TestYearFractions:
+    """Tests for the vectorized year_fractions function."""
+    
+    @pytest.mark.parametrize("convention", list(DayCountConvention))
+    def test_matches_scalar(self, convention: DayCountConvention) -> None:
+        """Test vectorized fractions match day_count_fraction per date."""
+        start = date(2024, 1, 31)
+        ends = [date(2024, 1, 31), date(2024, 3, 31), date(2024, 8, 30), date(2026, 12, 31)]
+        
+        result = year_fractions(start, dates_to_ordinals(ends), convention)
+        
+        expected = [day_count_fraction(start, e, convention) for e in ends]
+        assert result.tolist() == pytest.approx(expected, rel=1e-12)
+    
+    def test_end_before_start_raises(self) -> None:
+        """Test that any end < start raises error."""
+        ends = dates_to_ordinals([date(2024, 1, 1), date(2023, 1, 1)])
+        
+        with pytest.raises(ValueError):
+            year_fractions(date(2023, 6, 1), ends, DayCountConvention.ACT_365F)
+
+
 class TestYearFractionToDays:
     """Tests for year_fraction_to_days function."""
     
@@ -4,10 +4,11 @@ Extended tests for EventEngine covering autocall stops, coupon memory, and edge
 These tests use small path counts (10k) for fast execution.
 """
 
+import operator
 import pytest
 import numpy as np
 from datetime import date
-from copy import deepcopy
+from typing import Any, Callable, NamedTuple
 
 from pricer.products.schema import (
     TermSheet, Meta, Underlying, DividendModel, VolModel,
@@ -15,7 +16,17 @@ from pricer.products.schema import (
     DividendModelType, VolModelType, BarrierMonitoringType, DayCountConvention,
     DiscreteDividend,
 )
-from pricer.pricers.autocall_pricer import AutocallPricer, PricingConfig
+from pricer.pricers.autocall_pricer import AutocallPricer, PricingConfig, PricingResult
+from pricer.pricers import event_engine as event_engine_module
+from pricer.pricers.event_engine import EventEngine, combine_evaluations
+from pricer.pricers.event_kernel import (
+    HAS_NUMBA,
+    _autocall_payoff_kernel,
+    _wof_plain_payoff_kernel,
+    warmup,
+)
+from pricer.engines.grid import EventType, build_simulation_grid
+from pricer.engines.path_generator import PathGenerator, PathGeneratorConfig, SimulatedPaths
 
 
 def create_simple_term_sheet(
@@ -105,83 +116,175 @@ def create_simple_term_sheet(
     )
 
 
+class ResultPair(NamedTuple):
+    """Pricing results of a base scenario and its variant on the same seed."""
+    
+    base: PricingResult
+    variant: PricingResult
+
+
+def price_pair(pricer: AutocallPricer, base: TermSheet, variant: TermSheet) -> ResultPair:
+    """Price two scenarios of the same dates in one pass over shared draws."""
+    return ResultPair(*pricer.price_batch([base, variant]))
+
+
+@pytest.fixture(scope="module")
+def seeded_pricer(
+    pricer_factory: Callable[[int, int], AutocallPricer], num_paths: int
+) -> AutocallPricer:
+    """The module's standard seed-42 pricer, shared by the scenario fixtures."""
+    return pricer_factory(num_paths, 42)
+
+
+# Each scenario is priced once per module and shared by the tests reading it
+
+@pytest.fixture(scope="module")
+def autocall_low_barrier_result(seeded_pricer: AutocallPricer) -> PricingResult:
+    """Autocall level 0.5: triggers at the first observation."""
+    return seeded_pricer.price(create_simple_term_sheet(
+        spots=[100.0, 100.0],
+        autocall_levels=[0.5, 0.5, 0.5, 0.5],  # Will always trigger
+        coupon_barriers=[0.7, 0.7, 0.7, 0.7],
+        ki_level=0.3,  # Very low to avoid KI
+    ))
+
+
+@pytest.fixture(scope="module")
+def autocall_high_barrier_result(seeded_pricer: AutocallPricer) -> PricingResult:
+    """Autocall level 1.5: the product usually reaches maturity."""
+    return seeded_pricer.price(create_simple_term_sheet(
+        spots=[100.0, 100.0],
+        autocall_levels=[1.5, 1.5, 1.5, 1.5],  # Very high, unlikely to trigger
+        coupon_barriers=[0.7, 0.7, 0.7, 0.7],
+        ki_level=0.6,
+    ))
+
+
+@pytest.fixture(scope="module")
+def coupon_memory_pair_result(seeded_pricer: AutocallPricer) -> ResultPair:
+    """Coupon memory on (base) and off (variant), no autocall."""
+    # Low coupon barrier so some paths get coupons
+    ts_memory = create_simple_term_sheet(
+        spots=[100.0, 100.0],
+        autocall_levels=[1.5, 1.5, 1.5, 1.5],  # No autocall
+        coupon_barriers=[0.85, 0.85, 0.85, 0.85],
+        ki_level=0.5,
+        coupon_memory=True,
+    )
+    
+    # Shallow copies: only the changed branch of the tree is rebuilt
+    ts_no_memory = ts_memory.model_copy(update={
+        "payoff": ts_memory.payoff.model_copy(update={"coupon_memory": False}),
+    })
+    
+    return price_pair(seeded_pricer, ts_memory, ts_no_memory)
+
+
+@pytest.fixture(scope="module")
+def dividend_pair_result(seeded_pricer: AutocallPricer) -> ResultPair:
+    """Continuous dividends only (base) and large discrete dividends (variant)."""
+    ts_no_discrete = create_simple_term_sheet(
+        spots=[100.0, 100.0],
+        autocall_levels=[1.0, 1.0, 1.0, 1.0],
+        coupon_barriers=[0.7, 0.7, 0.7, 0.7],
+        ki_level=0.7,  # 70% barrier, more likely to hit
+    )
+    
+    # Add significant discrete dividend to first underlying
+    discrete = DividendModel(
+        type=DividendModelType.DISCRETE,
+        discrete_dividends=[
+            DiscreteDividend(ex_date=date(2024, 3, 1), amount=5.0),
+            DiscreteDividend(ex_date=date(2024, 6, 1), amount=5.0),
+            DiscreteDividend(ex_date=date(2024, 9, 1), amount=5.0),
+        ],
+    )
+    first, *rest = ts_no_discrete.underlyings
+    ts_with_discrete = ts_no_discrete.model_copy(update={
+        "underlyings": [first.model_copy(update={"dividend_model": discrete}), *rest],
+    })
+    
+    # Ex-dividend dates add grid steps, so the two runs draw separately
+    return ResultPair(
+        seeded_pricer.price(ts_no_discrete), seeded_pricer.price(ts_with_discrete)
+    )
+
+
+# (base autocall level, base KI level, variant autocall level, variant KI level,
+#  result field, expected relation of variant to base)
+BARRIER_SCENARIOS = [
+    pytest.param((1.0, 0.7, 1.0, 0.5, "ki_probability", operator.lt), id="lower_ki_barrier"),
+    pytest.param((1.0, 0.6, 0.9, 0.6, "autocall_probability", operator.gt), id="lower_autocall_barrier"),
+]
+
+
+class BarrierPairResult(NamedTuple):
+    """A barrier scenario pair with the field it moves and the expected relation."""
+    
+    field: str
+    relation: Callable[[float, float], bool]
+    results: ResultPair
+
+
+@pytest.fixture(scope="module", params=BARRIER_SCENARIOS)
+def barrier_pair_result(
+    request: pytest.FixtureRequest, seeded_pricer: AutocallPricer
+) -> BarrierPairResult:
+    """One barrier level lowered from the base term sheet, priced over shared draws."""
+    base_autocall, base_ki, variant_autocall, variant_ki, field, relation = request.param
+    base = create_simple_term_sheet(
+        spots=[100.0, 100.0],
+        autocall_levels=[base_autocall] * 4,
+        coupon_barriers=[0.7, 0.7, 0.7, 0.7],
+        ki_level=base_ki,
+    )
+    
+    variant = base.model_copy(update={
+        "schedules": base.schedules.model_copy(
+            update={"autocall_levels": [variant_autocall] * 4}
+        ),
+        "ki_barrier": base.ki_barrier.model_copy(update={"level": variant_ki}),
+    })
+    
+    return BarrierPairResult(field, relation, price_pair(seeded_pricer, base, variant))
+
+
 class TestAutocallStops:
     """Test that autocall correctly stops the product."""
     
-    def test_autocall_at_first_observation(self) -> None:
-        """
-        When autocall triggers at first observation:
-        - No later coupons should be paid
-        - Total PV = redemption + coupon (one period)
-        """
-        # Very low autocall level (0.5) to guarantee trigger with normal spots
-        ts = create_simple_term_sheet(
-            spots=[100.0, 100.0],
-            autocall_levels=[0.5, 0.5, 0.5, 0.5],  # Will always trigger
-            coupon_barriers=[0.7, 0.7, 0.7, 0.7],
-            ki_level=0.3,  # Very low to avoid KI
-        )
-        
-        config = PricingConfig(num_paths=10_000, seed=42)
-        result = AutocallPricer(config).price(ts)
-        
-        # Should autocall at first observation with very high probability
-        assert result.autocall_probability > 0.95
-        
-        # Expected coupons should be ~1 (only first observation coupon)
-        assert result.expected_coupon_count < 1.5
-        
-        # Expected life should be short (around 0.25 years for Q1 autocall)
-        assert result.expected_life < 0.5
+    def test_autocall_at_first_observation(self, autocall_low_barrier_result: PricingResult) -> None:
+        """With a 0.5 autocall level nearly every path calls at the first observation."""
+        assert autocall_low_barrier_result.autocall_probability > 0.95
     
-    def test_no_autocall_with_high_barrier(self) -> None:
-        """
-        With very high autocall barrier, product should reach maturity.
-        """
-        ts = create_simple_term_sheet(
-            spots=[100.0, 100.0],
-            autocall_levels=[1.5, 1.5, 1.5, 1.5],  # Very high, unlikely to trigger
-            coupon_barriers=[0.7, 0.7, 0.7, 0.7],
-            ki_level=0.6,
-        )
-        
-        config = PricingConfig(num_paths=10_000, seed=42)
-        result = AutocallPricer(config).price(ts)
-        
-        # Should rarely autocall
-        assert result.autocall_probability < 0.3
-        
-        # Expected life should be close to maturity (1 year)
-        assert result.expected_life > 0.7
+    def test_no_later_coupons_after_first_autocall(
+        self, autocall_low_barrier_result: PricingResult
+    ) -> None:
+        """Expected coupons should be ~1 (only the first observation's coupon)."""
+        assert autocall_low_barrier_result.expected_coupon_count < 1.5
+    
+    def test_first_autocall_gives_short_life(self, autocall_low_barrier_result: PricingResult) -> None:
+        """Expected life should be short (around 0.25 years for a Q1 autocall)."""
+        assert autocall_low_barrier_result.expected_life < 0.5
+    
+    def test_no_autocall_with_high_barrier(self, autocall_high_barrier_result: PricingResult) -> None:
+        """With very high autocall barrier, product should rarely autocall."""
+        assert autocall_high_barrier_result.autocall_probability < 0.3
+    
+    def test_high_barrier_reaches_maturity(self, autocall_high_barrier_result: PricingResult) -> None:
+        """Expected life should be close to maturity (1 year)."""
+        assert autocall_high_barrier_result.expected_life > 0.7
 
 
 class TestCouponMemory:
     """Test coupon memory feature correctly accumulates unpaid coupons."""
     
-    def test_memory_accumulates_coupons(self) -> None:
+    def test_memory_accumulates_coupons(self, coupon_memory_pair_result: ResultPair) -> None:
         """
         With memory ON and coupon barrier missed then hit:
         - Path should pay accumulated coupons
         - Total coupons > paths without memory
         """
-        # Low coupon barrier so some paths get coupons
-        ts_memory = create_simple_term_sheet(
-            spots=[100.0, 100.0],
-            autocall_levels=[1.5, 1.5, 1.5, 1.5],  # No autocall
-            coupon_barriers=[0.85, 0.85, 0.85, 0.85],
-            ki_level=0.5,
-            coupon_memory=True,
-        )
-        
-        ts_no_memory = deepcopy(ts_memory)
-        ts_no_memory.payoff.coupon_memory = False
-        
-        config = PricingConfig(num_paths=10_000, seed=42)
-        
-        result_memory = AutocallPricer(config).price(ts_memory)
-        
-        config.seed = 42  # Reset seed for same paths
-        result_no_memory = AutocallPricer(config).price(ts_no_memory)
+        result_memory, result_no_memory = coupon_memory_pair_result
         
         # Memory version should have higher or equal PV 
         # (accumulated coupons when barrier crossed after miss)
@@ -193,92 +296,458 @@ class TestCouponMemory:
 class TestDividendEffect:
     """Test that discrete dividends increase KI probability for down barriers."""
     
-    def test_dividend_increases_ki_probability(self) -> None:
+    @pytest.mark.heavy
+    def test_dividend_increases_ki_probability(self, dividend_pair_result: ResultPair) -> None:
         """
         Adding discrete dividend should:
         - Lower expected spot path
         - Increase probability of hitting down KI barrier
         """
-        # Base case: continuous dividend only
-        ts_no_discrete = create_simple_term_sheet(
+        result_no_div, result_with_div = dividend_pair_result
+        
+        # Discrete dividends should increase KI probability
+        # (spot jumps down on ex-dates, closer to barrier)
+        assert result_with_div.ki_probability >= result_no_div.ki_probability * 0.9
+        
+        # With high dividends and same seed, KI prob should be noticeably higher
+        # Allow some tolerance for MC noise
+        print(f"KI prob without div: {result_no_div.ki_probability:.4f}")
+        print(f"KI prob with div: {result_with_div.ki_probability:.4f}")
+
+
+class TestSimulationGrid:
+    """Test event views on the simulation grid."""
+    
+    def test_iter_events_of_type_matches_events(self) -> None:
+        """Per-type iteration yields the same rows as filtering grid.events."""
+        ts = create_simple_term_sheet(
             spots=[100.0, 100.0],
             autocall_levels=[1.0, 1.0, 1.0, 1.0],
             coupon_barriers=[0.7, 0.7, 0.7, 0.7],
-            ki_level=0.7,  # 70% barrier, more likely to hit
         )
-        
-        # Case with discrete dividends
-        ts_with_discrete = deepcopy(ts_no_discrete)
-        # Add significant discrete dividend to first underlying
-        ts_with_discrete.underlyings[0].dividend_model = DividendModel(
+        ts.underlyings[1].dividend_model = DividendModel(
             type=DividendModelType.DISCRETE,
             discrete_dividends=[
-                DiscreteDividend(ex_date=date(2024, 3, 1), amount=5.0),
-                DiscreteDividend(ex_date=date(2024, 6, 1), amount=5.0),
-                DiscreteDividend(ex_date=date(2024, 9, 1), amount=5.0),
+                DiscreteDividend(ex_date=date(2024, 4, 15), amount=1.0),
+                DiscreteDividend(ex_date=date(2024, 8, 1), amount=2.0),
             ],
         )
+        grid = build_simulation_grid(ts)
         
-        config = PricingConfig(num_paths=10_000, seed=42)
+        for event_type in EventType:
+            expected = [e for e in grid.events if e.event_type == event_type]
+            assert list(grid.iter_events_of_type(event_type)) == expected
         
-        result_no_div = AutocallPricer(config).price(ts_no_discrete)
+        exdivs = list(grid.iter_events_of_type(EventType.EX_DIVIDEND))
+        assert [(e.underlying_id, e.dividend_amount) for e in exdivs] == [("B", 1.0), ("B", 2.0)]
+
+
+class TestPathGenerator:
+    """Test path generator setup reuse."""
+    
+    def test_rebuild_spots_matches_new_generator(self) -> None:
+        """A spot-rebuilt generator must simulate like a freshly built one."""
+        base = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.0, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+            ki_level=0.7,
+        )
+        first, *rest = base.underlyings
+        bumped = base.model_copy(update={
+            "underlyings": [first.model_copy(update={"spot": 101.0}), *rest],
+        })
+        grid = build_simulation_grid(base)
+        config = PathGeneratorConfig(num_paths=2_000, seed=4)
         
-        config.seed = 42  # Same seed
-        result_with_div = AutocallPricer(config).price(ts_with_discrete)
+        fresh = PathGenerator(bumped, grid, config)
+        rebuilt = PathGenerator(base, grid, config)
+        rebuilt.rebuild_spots(np.array([101.0, 100.0]))
+        randoms = fresh.draw_randoms()
         
-        # Discrete dividends should increase KI probability
-        # (spot jumps down on ex-dates, closer to barrier)
-        assert result_with_div.ki_probability >= result_no_div.ki_probability * 0.9
+        expected = fresh.generate(randoms)
+        result = rebuilt.generate(randoms)
         
-        # With high dividends and same seed, KI prob should be noticeably higher
-        # Allow some tolerance for MC noise
-        print(f"KI prob without div: {result_no_div.ki_probability:.4f}")
-        print(f"KI prob with div: {result_with_div.ki_probability:.4f}")
+        np.testing.assert_array_equal(result.spots, expected.spots)
+        np.testing.assert_array_equal(result.ki_step, expected.ki_step)
+    
+    @pytest.mark.parametrize("use_jit", [
+        pytest.param(True, marks=pytest.mark.skipif(not HAS_NUMBA, reason="numba not installed")),
+        False,
+    ])
+    def test_no_ki_barrier_skips_uniforms(self, use_jit: bool) -> None:
+        """Without a KI barrier no KI uniforms are drawn and no path knocks in."""
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.0, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+        )
+        ts.ki_barrier = None
+        grid = build_simulation_grid(ts)
+        
+        gen = PathGenerator(ts, grid, PathGeneratorConfig(num_paths=1_000, seed=2, use_jit=use_jit))
+        randoms = gen.draw_randoms()
+        paths = gen.generate(randoms)
+        
+        assert randoms.U_ki is None
+        assert not paths.ki_state.any()
+        assert (paths.ki_step == -1).all()
+    
+    def test_generate_rejects_randoms_without_ki_uniforms(self) -> None:
+        """Draws made without a KI barrier cannot drive a KI generator."""
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.0, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+        )
+        no_ki = ts.model_copy(update={"ki_barrier": None})
+        grid = build_simulation_grid(ts)
+        config = PathGeneratorConfig(num_paths=500, seed=2)
+        randoms = PathGenerator(no_ki, grid, config).draw_randoms()
+        
+        with pytest.raises(ValueError, match="no KI uniforms"):
+            PathGenerator(ts, grid, config).generate(randoms)
+
+
+class TestBlockEvaluation:
+    """Test evaluating paths block by block."""
+    
+    def test_combined_blocks_match_single_evaluation(self) -> None:
+        """Combining per-block results must equal evaluating all paths at once."""
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.05, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+            ki_level=0.7,
+        )
+        grid = build_simulation_grid(ts)
+        config = PathGeneratorConfig(num_paths=5_000, block_size=1_500, seed=11)
+        blocks = list(PathGenerator(ts, grid, config).generate_blocks())
+        assert [b.spots.shape[0] for b in blocks] == [1_500, 1_500, 1_500, 500]
+        
+        engine = EventEngine(ts, grid)
+        combined = combine_evaluations([engine.evaluate(b) for b in blocks])
+        full = engine.evaluate(SimulatedPaths(
+            spots=np.concatenate([b.spots for b in blocks]),
+            ki_state=np.concatenate([b.ki_state for b in blocks]),
+            ki_step=np.concatenate([b.ki_step for b in blocks]),
+        ))
+        
+        assert combined.num_paths == full.num_paths
+        assert combined.pv == pytest.approx(full.pv, rel=1e-12)
+        assert combined.pv_std_error == pytest.approx(full.pv_std_error, rel=1e-9)
+        assert combined.ki_probability == pytest.approx(full.ki_probability, rel=1e-12)
+        assert combined.expected_life == pytest.approx(full.expected_life, rel=1e-12)
+        for d, p in full.autocall_prob_by_date.items():
+            assert combined.autocall_prob_by_date[d] == pytest.approx(p, rel=1e-12)
+    
+    def test_price_scenarios_matches_price_across_blocks(self) -> None:
+        """Shared block draws must reproduce a seeded multi-block price()."""
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.0, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+        )
+        pricer = AutocallPricer(PricingConfig(num_paths=3_000, block_size=1_000, seed=5))
+        plan = pricer.build_plan(ts)
+        
+        scenario = pricer.price_scenarios([ts], plan)[0]
+        assert scenario.num_paths == 3_000
+        assert scenario.pv == pytest.approx(pricer.price(ts).pv, rel=1e-12)
+    
+    def test_price_batch_matches_seeded_price(self) -> None:
+        """Each batched term sheet equals its own seeded price()."""
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.0, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+        )
+        variant = ts.model_copy(update={
+            "ki_barrier": ts.ki_barrier.model_copy(update={"level": 0.5}),
+        })
+        pricer = AutocallPricer(PricingConfig(num_paths=2_000, block_size=1_000))
+        
+        batched = pricer.price_batch([ts, variant], seed=8)
+        
+        assert pricer.config.seed is None
+        seeded = AutocallPricer(PricingConfig(num_paths=2_000, block_size=1_000, seed=8))
+        for result, term_sheet in zip(batched, (ts, variant)):
+            expected = seeded.price(term_sheet)
+            assert result.pv == pytest.approx(expected.pv, rel=1e-12)
+            assert result.ki_probability == expected.ki_probability
+    
+    def test_price_batch_rejects_different_dates(self) -> None:
+        """Term sheets on different grids cannot share draws."""
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.0, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+        )
+        first, *rest = ts.underlyings
+        discrete = DividendModel(
+            type=DividendModelType.DISCRETE,
+            discrete_dividends=[DiscreteDividend(ex_date=date(2024, 3, 1), amount=1.0)],
+        )
+        variant = ts.model_copy(update={
+            "underlyings": [first.model_copy(update={"dividend_model": discrete}), *rest],
+        })
+        
+        with pytest.raises(ValueError, match="share simulation and payment dates"):
+            AutocallPricer(PricingConfig(num_paths=1_000, seed=1)).price_batch([ts, variant])
+    
+    @pytest.mark.parametrize("ki_first", [True, False])
+    def test_price_batch_rejects_mixed_ki_presence(self, ki_first: bool) -> None:
+        """A KI and a no-KI term sheet draw differently, in either order."""
+        ki_ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.0, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+        )
+        no_ki_ts = ki_ts.model_copy(update={"ki_barrier": None})
+        batch = [ki_ts, no_ki_ts] if ki_first else [no_ki_ts, ki_ts]
+        
+        with pytest.raises(ValueError, match="draw layout"):
+            AutocallPricer(PricingConfig(num_paths=1_000, seed=1)).price_batch(batch)
+    
+    def test_qmc_price_agrees_with_monte_carlo(self) -> None:
+        """Sobol pricing must agree with a large pseudo-random run."""
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.0, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+            ki_level=0.7,
+        )
+        mc = AutocallPricer(PricingConfig(num_paths=100_000, seed=3)).price(ts)
+        qmc = AutocallPricer(PricingConfig(num_paths=8_192, seed=3, use_qmc=True)).price(ts)
+        
+        assert qmc.num_paths == 8_192
+        assert qmc.pv == pytest.approx(mc.pv, abs=4 * mc.pv_std_error * np.sqrt(100_000 / 8_192))
+    
+    def test_worker_processes_match_serial(self) -> None:
+        """Blocks priced in worker processes must reproduce the serial price."""
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.0, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+            ki_level=0.7,
+        )
+        serial = AutocallPricer(PricingConfig(num_paths=3_000, block_size=1_000, seed=9))
+        parallel = AutocallPricer(
+            PricingConfig(num_paths=3_000, block_size=1_000, seed=9, num_workers=2)
+        )
+        
+        expected = serial.price(ts)
+        result = parallel.price(ts)
+        
+        assert result.num_paths == expected.num_paths
+        assert result.pv == pytest.approx(expected.pv, rel=1e-12)
+        assert result.ki_probability == expected.ki_probability
+    
+    def test_evaluate_batch_matches_evaluate(self) -> None:
+        """Threaded batch evaluation must match evaluating each path set alone."""
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.05, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+            ki_level=0.7,
+        )
+        grid = build_simulation_grid(ts)
+        gen = PathGenerator(ts, grid, PathGeneratorConfig(num_paths=1_000, seed=9))
+        path_sets = [gen.generate(gen.draw_randoms()) for _ in range(4)]
+        engine = EventEngine(ts, grid)
+        
+        batched = engine.evaluate_batch(path_sets, max_workers=4)
+        single = [EventEngine(ts, grid).evaluate(paths) for paths in path_sets]
+        
+        assert [r.pv for r in batched] == [r.pv for r in single]
+        assert [r.autocall_prob_by_date for r in batched] == [r.autocall_prob_by_date for r in single]
+    
+    def test_tiled_sweep_matches_single_tile(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Tiling the NumPy sweep over paths must not change any output."""
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.05, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+            ki_level=0.7,
+        )
+        grid = build_simulation_grid(ts)
+        paths = PathGenerator(ts, grid, PathGeneratorConfig(num_paths=2_000, seed=5)).generate()
+        engine = EventEngine(ts, grid, use_jit=False)
+        
+        whole = engine.sweep(paths)
+        monkeypatch.setattr(event_engine_module, "SWEEP_BLOCK_SIZE", 300)
+        tiled = engine.sweep(paths)
+        
+        for a, b in zip(whole, tiled):
+            np.testing.assert_array_equal(a, b)
 
 
 class TestBarrierLevels:
     """Test barrier level effects on pricing."""
     
-    def test_lower_ki_barrier_reduces_ki_prob(self) -> None:
-        """Lower KI barrier should mean lower KI probability."""
-        ts_high = create_simple_term_sheet(
+    def test_monotone_barrier(self, barrier_pair_result: BarrierPairResult) -> None:
+        """Lowering a barrier moves its probability the expected way."""
+        field, relation, (base, variant) = barrier_pair_result
+        assert relation(getattr(variant, field), getattr(base, field))
+
+
+@pytest.mark.skipif(not HAS_NUMBA, reason="numba not installed")
+class TestJitKernel:
+    """Test the compiled payoff kernel against the NumPy evaluation."""
+    
+    @pytest.mark.parametrize("coupon_memory", [True, False])
+    @pytest.mark.parametrize("coupon_on_autocall", [True, False])
+    @pytest.mark.parametrize("redemption_if_ki", ["worst_performance", "fixed", "floored"])
+    def test_kernel_matches_numpy(
+        self, coupon_memory: bool, coupon_on_autocall: bool, redemption_if_ki: str
+    ) -> None:
+        """Same paths must give the same statistics with and without the kernel."""
+        ts = create_simple_term_sheet(
             spots=[100.0, 100.0],
-            autocall_levels=[1.0, 1.0, 1.0, 1.0],
-            coupon_barriers=[0.7, 0.7, 0.7, 0.7],
-            ki_level=0.7,  # Higher barrier, easier to hit
+            autocall_levels=[1.05, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+            ki_level=0.7,
+            coupon_memory=coupon_memory,
+        )
+        ts.payoff.coupon_on_autocall = coupon_on_autocall
+        ts.payoff.redemption_if_ki = redemption_if_ki
+        ts.payoff.ki_redemption_floor = 0.4
+        
+        grid = build_simulation_grid(ts)
+        paths = PathGenerator(ts, grid, PathGeneratorConfig(num_paths=5_000, seed=7)).generate()
+        
+        ref = EventEngine(ts, grid, use_jit=False).evaluate(paths)
+        jit = EventEngine(ts, grid, use_jit=True).evaluate(paths)
+        
+        assert jit.pv == pytest.approx(ref.pv, rel=1e-10)
+        assert jit.pv_std_error == pytest.approx(ref.pv_std_error, rel=1e-8)
+        assert jit.autocall_probability == ref.autocall_probability
+        assert jit.expected_coupon_count == ref.expected_coupon_count
+        assert jit.expected_life == pytest.approx(ref.expected_life, rel=1e-12)
+        assert jit.autocall_prob_by_date == ref.autocall_prob_by_date
+        assert jit.coupon_prob_by_date == ref.coupon_prob_by_date
+    
+    def test_sweep_components_match_numpy(self) -> None:
+        """Per-path PV legs must agree between sweeps and add up to the total."""
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.05, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+            ki_level=0.7,
         )
+        grid = build_simulation_grid(ts)
+        paths = PathGenerator(ts, grid, PathGeneratorConfig(num_paths=2_000, seed=5)).generate()
         
-        ts_low = deepcopy(ts_high)
-        ts_low.ki_barrier.level = 0.5  # Lower barrier, harder to hit
+        ref = EventEngine(ts, grid, use_jit=False).sweep(paths)
+        jit = EventEngine(ts, grid, use_jit=True).sweep(paths)
         
-        config = PricingConfig(num_paths=10_000, seed=42)
+        for a, b in zip(ref, jit):
+            np.testing.assert_allclose(a, b, rtol=1e-12)
+        np.testing.assert_allclose(ref[0], ref[1] + ref[2] + ref[3], rtol=1e-12)
+    
+    def test_plain_worst_of_kernel_matches_generic(self) -> None:
+        """The specialised kernel must reproduce the generic kernel exactly."""
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.05, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+            ki_level=0.7,
+            coupon_memory=False,
+        )
+        ts.payoff.coupon_on_autocall = False
+        grid = build_simulation_grid(ts)
+        paths = PathGenerator(ts, grid, PathGeneratorConfig(num_paths=2_000, seed=5)).generate()
         
-        result_high = AutocallPricer(config).price(ts_high)
+        engine = EventEngine(ts, grid, use_jit=True)
+        assert engine.plain_worst_of
+        fast = engine.sweep(paths)
+        engine.plain_worst_of = False
+        generic = engine.sweep(paths)
         
-        config.seed = 42
-        result_low = AutocallPricer(config).price(ts_low)
+        for a, b in zip(fast, generic):
+            np.testing.assert_array_equal(a, b)
+    
+    @pytest.mark.parametrize("use_jit", [True, False])
+    def test_pooled_buffers_are_reset(self, use_jit: bool) -> None:
+        """Evaluating with reused output buffers must not carry state over."""
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.05, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+            ki_level=0.7,
+        )
+        grid = build_simulation_grid(ts)
+        gen = PathGenerator(ts, grid, PathGeneratorConfig(num_paths=1_000, seed=5))
+        paths_a = gen.generate(gen.draw_randoms())
+        paths_b = gen.generate(gen.draw_randoms())
+        engine = EventEngine(ts, grid, use_jit=use_jit)
         
-        # Lower barrier = lower KI probability
-        assert result_low.ki_probability < result_high.ki_probability
+        first = engine.evaluate(paths_a)
+        engine.evaluate(paths_b)
+        again = engine.evaluate(paths_a)
+        
+        assert len(engine._buffer_pool()) == 1
+        assert again.pv == first.pv
+        assert again.expected_coupon_count == first.expected_coupon_count
+        assert again.autocall_prob_by_date == first.autocall_prob_by_date
+        assert again.coupon_prob_by_date == first.coupon_prob_by_date
     
-    def test_lower_autocall_barrier_increases_autocall_prob(self) -> None:
-        """Lower autocall barrier should increase autocall probability."""
-        ts_high = create_simple_term_sheet(
+    def test_sweep_stops_once_all_paths_autocall(self) -> None:
+        """Early exit after a full autocall must not change any output."""
+        ts = create_simple_term_sheet(
             spots=[100.0, 100.0],
-            autocall_levels=[1.0, 1.0, 1.0, 1.0],  # At-the-money
-            coupon_barriers=[0.7, 0.7, 0.7, 0.7],
-            ki_level=0.6,
+            autocall_levels=[0.05, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+            ki_level=0.7,
         )
+        grid = build_simulation_grid(ts)
+        paths = PathGenerator(ts, grid, PathGeneratorConfig(num_paths=1_000, seed=5)).generate()
         
-        ts_low = deepcopy(ts_high)
-        ts_low.schedules.autocall_levels = [0.9, 0.9, 0.9, 0.9]  # Easier to trigger
+        ref = EventEngine(ts, grid, use_jit=False).sweep(paths)
+        jit = EventEngine(ts, grid, use_jit=True).sweep(paths)
         
-        config = PricingConfig(num_paths=10_000, seed=42)
+        for a, b in zip(ref, jit):
+            np.testing.assert_allclose(a, b, rtol=1e-12)
+        assert np.all(ref[5] == 0)
+        assert not ref[3].any()
+    
+    def test_path_step_kernel_matches_numpy(self) -> None:
+        """Fused path step must reproduce the NumPy spots, dividends and KI states."""
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.05, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+            ki_level=0.8,
+        )
+        ts.underlyings[0].dividend_model = DividendModel(
+            type=DividendModelType.DISCRETE,
+            discrete_dividends=[DiscreteDividend(ex_date=date(2024, 3, 1), amount=5.0)],
+        )
+        grid = build_simulation_grid(ts)
         
-        result_high = AutocallPricer(config).price(ts_high)
+        ref = PathGenerator(ts, grid, PathGeneratorConfig(num_paths=5_000, seed=3, use_jit=False))
+        jit = PathGenerator(ts, grid, PathGeneratorConfig(num_paths=5_000, seed=3, use_jit=True))
+        ref_paths = ref.generate()
+        jit_paths = jit.generate()
         
-        config.seed = 42
-        result_low = AutocallPricer(config).price(ts_low)
+        np.testing.assert_allclose(jit_paths.spots, ref_paths.spots, rtol=1e-5)
+        assert np.array_equal(jit_paths.ki_state, ref_paths.ki_state)
+        assert np.array_equal(jit_paths.ki_step, ref_paths.ki_step)
+    
+    @pytest.mark.parametrize("kernel", [_autocall_payoff_kernel, _wof_plain_payoff_kernel])
+    def test_warmup_compiles_pricing_signature(self, kernel: Any) -> None:
+        """Warm-up must compile the same specialisation pricing dispatches to."""
+        warmup()
+        compiled = len(kernel.signatures)
+        
+        ts = create_simple_term_sheet(
+            spots=[100.0, 100.0],
+            autocall_levels=[1.0, 1.0, 1.0, 1.0],
+            coupon_barriers=[0.8, 0.8, 0.8, 0.8],
+            coupon_memory=kernel is _autocall_payoff_kernel,
+        )
+        ts.payoff.coupon_on_autocall = kernel is _autocall_payoff_kernel
+        AutocallPricer(PricingConfig(num_paths=1_000, seed=1)).price(ts)
         
-        # Lower barrier = higher autocall probability
-        assert result_low.autocall_probability > result_high.autocall_probability
+        assert compiled >= 1
+        assert len(kernel.signatures) == compiled
@@ -9,54 +9,47 @@ Validates:
 
 import pytest
 import numpy as np
-from pathlib import Path
+from typing import Callable
 
-from pricer.products.schema import load_term_sheet
-from pricer.pricers.autocall_pricer import PricingConfig
+from pricer.products.schema import TermSheet
+from pricer.pricers.autocall_pricer import AutocallPricer, PricingConfig
 from pricer.risk.greeks import (
     compute_greeks, 
     GreeksCalculator, 
     BumpingConfig,
     GreeksResult,
+    _bump_rate,
+    _bump_spot,
+    _bump_vol,
 )
 
 
+@pytest.fixture(scope="module")
+def reference_greeks(example_worstof_ts: TermSheet, num_paths: int) -> GreeksResult:
+    """Default Greeks (central differences, no rho), seed 42."""
+    return compute_greeks(example_worstof_ts, PricingConfig(num_paths=num_paths, seed=42))
+
+
+@pytest.mark.xdist_group("greeks")
 class TestGreeksBasic:
     """Basic Greeks calculation tests."""
     
-    @pytest.fixture
-    def term_sheet_path(self) -> Path:
-        """Get path to example term sheet."""
-        return Path(__file__).parent.parent / "examples" / "autocall_worstof_continuous_ki.json"
-    
-    def test_greeks_returns_result(self, term_sheet_path: Path) -> None:
+    def test_greeks_returns_result(self, reference_greeks: GreeksResult) -> None:
         """Greeks calculation should return a valid result."""
-        if not term_sheet_path.exists():
-            pytest.skip("Example term sheet not found")
-        
-        ts = load_term_sheet(term_sheet_path)
-        config = PricingConfig(num_paths=10_000, seed=42)
-        
-        result = compute_greeks(ts, config)
+        result = reference_greeks
         
         assert isinstance(result, GreeksResult)
         assert result.base_pv > 0
         assert len(result.delta) == 3  # 3 underlyings
         assert len(result.vega) == 3
     
-    def test_delta_is_negative_for_autocallable(self, term_sheet_path: Path) -> None:
+    def test_delta_is_negative_for_autocallable(self, reference_greeks: GreeksResult) -> None:
         """
         For a worst-of autocallable with downside risk:
         - Delta should generally be negative (long position loses on down move)
         - This is because lower spot increases KI probability
         """
-        if not term_sheet_path.exists():
-            pytest.skip("Example term sheet not found")
-        
-        ts = load_term_sheet(term_sheet_path)
-        config = PricingConfig(num_paths=10_000, seed=42)
-        
-        result = compute_greeks(ts, config)
+        result = reference_greeks
         
         # At least some deltas should be negative
         # (depends on market conditions and structure)
@@ -65,15 +58,9 @@ class TestGreeksBasic:
         
         print(f"Deltas: {result.delta}")
     
-    def test_vega_is_nonzero(self, term_sheet_path: Path) -> None:
+    def test_vega_is_nonzero(self, reference_greeks: GreeksResult) -> None:
         """Vega should be non-zero (vol affects option value)."""
-        if not term_sheet_path.exists():
-            pytest.skip("Example term sheet not found")
-        
-        ts = load_term_sheet(term_sheet_path)
-        config = PricingConfig(num_paths=10_000, seed=42)
-        
-        result = compute_greeks(ts, config)
+        result = reference_greeks
         
         # At least some vegas should be non-zero
         vegas = list(result.vega.values())
@@ -82,25 +69,18 @@ class TestGreeksBasic:
         print(f"Vegas: {result.vega}")
 
 
+@pytest.mark.xdist_group("greeks")
 class TestCRNStability:
     """Test that CRN provides stable Greek estimates."""
     
-    @pytest.fixture
-    def term_sheet_path(self) -> Path:
-        """Get path to example term sheet."""
-        return Path(__file__).parent.parent / "examples" / "autocall_worstof_continuous_ki.json"
-    
-    def test_same_seed_gives_same_greeks(self, term_sheet_path: Path) -> None:
+    def test_same_seed_gives_same_greeks(self, example_worstof_ts: TermSheet, num_paths: int) -> None:
         """Running twice with same seed should give identical Greeks."""
-        if not term_sheet_path.exists():
-            pytest.skip("Example term sheet not found")
+        ts = example_worstof_ts
         
-        ts = load_term_sheet(term_sheet_path)
-        
-        config1 = PricingConfig(num_paths=10_000, seed=42)
+        config1 = PricingConfig(num_paths=num_paths, seed=42)
         result1 = compute_greeks(ts, config1)
         
-        config2 = PricingConfig(num_paths=10_000, seed=42)
+        config2 = PricingConfig(num_paths=num_paths, seed=42)
         result2 = compute_greeks(ts, config2)
         
         # Should be exactly equal
@@ -112,17 +92,17 @@ class TestCRNStability:
         for asset in result1.vega:
             assert result1.vega[asset] == pytest.approx(result2.vega[asset], rel=1e-10)
     
-    def test_different_seeds_give_different_greeks(self, term_sheet_path: Path) -> None:
+    @pytest.mark.heavy
+    def test_different_seeds_give_different_greeks(
+        self, example_worstof_ts: TermSheet, num_paths: int
+    ) -> None:
         """Different seeds should give (slightly) different Greeks."""
-        if not term_sheet_path.exists():
-            pytest.skip("Example term sheet not found")
-        
-        ts = load_term_sheet(term_sheet_path)
+        ts = example_worstof_ts
         
-        config1 = PricingConfig(num_paths=10_000, seed=111)
+        config1 = PricingConfig(num_paths=num_paths, seed=111)
         result1 = compute_greeks(ts, config1)
         
-        config2 = PricingConfig(num_paths=10_000, seed=222)
+        config2 = PricingConfig(num_paths=num_paths, seed=222)
         result2 = compute_greeks(ts, config2)
         
         # Should be different (MC sampling variance)
@@ -135,26 +115,17 @@ class TestCRNStability:
 class TestBumpingConfig:
     """Test different bumping configurations."""
     
-    @pytest.fixture
-    def term_sheet_path(self) -> Path:
-        """Get path to example term sheet."""
-        return Path(__file__).parent.parent / "examples" / "autocall_worstof_continuous_ki.json"
-    
-    def test_central_diff_vs_forward_diff(self, term_sheet_path: Path) -> None:
+    def test_central_diff_vs_forward_diff(
+        self, example_worstof_ts: TermSheet, reference_greeks: GreeksResult
+    ) -> None:
         """Central difference should be more accurate than forward difference."""
-        if not term_sheet_path.exists():
-            pytest.skip("Example term sheet not found")
+        result_central = reference_greeks  # Central differences by default
         
-        ts = load_term_sheet(term_sheet_path)
-        config = PricingConfig(num_paths=10_000, seed=42)
-        
-        bump_central = BumpingConfig(use_central_diff=True)
+        # The scenario count does not depend on the path count
         bump_forward = BumpingConfig(use_central_diff=False)
-        
-        result_central = compute_greeks(ts, config, bump_central)
-        
-        config.seed = 42  # Reset
-        result_forward = compute_greeks(ts, config, bump_forward)
+        result_forward = compute_greeks(
+            example_worstof_ts, PricingConfig(num_paths=500, seed=42), bump_forward
+        )
         
         # Both should produce valid results
         assert len(result_central.delta) > 0
@@ -163,21 +134,17 @@ class TestBumpingConfig:
         # Central uses 2x bump scenarios per Greek
         assert result_central.diagnostics["num_bump_scenarios"] > result_forward.diagnostics["num_bump_scenarios"]
     
-    def test_rho_when_requested(self, term_sheet_path: Path) -> None:
+    def test_rho_when_requested(
+        self, example_worstof_ts: TermSheet, reference_greeks: GreeksResult
+    ) -> None:
         """Rho should be computed when requested."""
-        if not term_sheet_path.exists():
-            pytest.skip("Example term sheet not found")
+        result_no_rho = reference_greeks  # No rho by default
         
-        ts = load_term_sheet(term_sheet_path)
-        config = PricingConfig(num_paths=10_000, seed=42)
-        
-        bump_no_rho = BumpingConfig(compute_rho=False)
+        # Only the presence of rho is asserted, so a small run suffices
         bump_with_rho = BumpingConfig(compute_rho=True)
-        
-        result_no_rho = compute_greeks(ts, config, bump_no_rho)
-        
-        config.seed = 42
-        result_with_rho = compute_greeks(ts, config, bump_with_rho)
+        result_with_rho = compute_greeks(
+            example_worstof_ts, PricingConfig(num_paths=500, seed=42), bump_with_rho
+        )
         
         assert result_no_rho.rho is None
         assert result_with_rho.rho is not None
@@ -186,23 +153,43 @@ class TestBumpingConfig:
         print(f"Rho: {result_with_rho.rho}")
 
 
+class TestVolBump:
+    """Vol bumps of local-stochastic underlyings."""
+    
+    def test_lsv_bump_shifts_vol_levels(self, example_worstof_ts: TermSheet) -> None:
+        """v0 and theta move as vol levels; the input sheet is unchanged."""
+        ts = example_worstof_ts
+        base = ts.underlyings[0].vol_model.lsv_params
+        
+        bumped = _bump_vol(ts, ts.underlyings[0].id, 0.01).underlyings[0].vol_model.lsv_params
+        
+        assert np.sqrt(bumped.v0) == pytest.approx(np.sqrt(base.v0) + 0.01)
+        assert np.sqrt(bumped.theta) == pytest.approx(np.sqrt(base.theta) + 0.01)
+        assert (bumped.kappa, bumped.xi, bumped.rho) == (base.kappa, base.xi, base.rho)
+        assert ts.underlyings[0].vol_model.lsv_params is base
+    
+    def test_lsv_bump_through_zero_raises(self, example_worstof_ts: TermSheet) -> None:
+        """A down bump larger than the vol level must fail instead of flipping sign."""
+        ts = example_worstof_ts
+        with pytest.raises(ValueError, match="non-positive v0"):
+            _bump_vol(ts, ts.underlyings[0].id, -1.0)
+    
+    def test_lsv_bump_is_validated(self, example_worstof_ts: TermSheet) -> None:
+        """Bumped params must still satisfy the LSVParams field bounds."""
+        ts = example_worstof_ts
+        with pytest.raises(ValueError, match="less than or equal to 4"):
+            _bump_vol(ts, ts.underlyings[0].id, 2.0)
+
+
 class TestGreeksCalculator:
     """Test the GreeksCalculator wrapper class."""
     
-    @pytest.fixture
-    def term_sheet_path(self) -> Path:
-        """Get path to example term sheet."""
-        return Path(__file__).parent.parent / "examples" / "autocall_worstof_continuous_ki.json"
-    
-    def test_calculator_interface(self, term_sheet_path: Path) -> None:
+    def test_calculator_interface(self, example_worstof_ts: TermSheet, num_paths: int) -> None:
         """GreeksCalculator should provide convenient interface."""
-        if not term_sheet_path.exists():
-            pytest.skip("Example term sheet not found")
-        
-        ts = load_term_sheet(term_sheet_path)
+        ts = example_worstof_ts
         
         calculator = GreeksCalculator(
-            pricing_config=PricingConfig(num_paths=10_000, seed=42),
+            pricing_config=PricingConfig(num_paths=num_paths, seed=42),
             bump_config=BumpingConfig(compute_rho=True),
         )
         
@@ -211,3 +198,50 @@ class TestGreeksCalculator:
         assert isinstance(result, GreeksResult)
         assert result.base_pv > 0
         assert result.rho is not None
+
+
+class TestPricedProductPlan:
+    """Repricing with a shared plan must match a full reprice."""
+    
+    def test_plan_reuse_matches_price(
+        self, example_worstof_ts: TermSheet, pricer_factory: Callable[[int, int], AutocallPricer]
+    ) -> None:
+        """Spot and rate bumps priced with the base plan give identical PVs."""
+        ts = example_worstof_ts
+        pricer = pricer_factory(5_000, 7)
+        plan = pricer.build_plan(ts)
+        
+        for bumped in (ts, _bump_spot(ts, ts.underlyings[0].id, 0.01), _bump_rate(ts, 0.0001)):
+            pv_full = pricer.price(bumped).pv
+            pv_plan = pricer.price_with_plan(bumped, plan).pv
+            assert pv_plan == pytest.approx(pv_full, rel=1e-12)
+    
+    def test_price_scenarios_matches_seeded_reprice(self, example_worstof_ts: TermSheet) -> None:
+        """One shared-draws pass reproduces seeded per-scenario pricing."""
+        ts = example_worstof_ts
+        pricer = AutocallPricer(PricingConfig(num_paths=5_000, seed=11))
+        scenarios = [ts, _bump_spot(ts, ts.underlyings[1].id, -0.01), _bump_rate(ts, 0.0001)]
+        
+        sequential = []
+        for bumped in scenarios:
+            pricer.set_seed(11)
+            sequential.append(pricer.price(bumped).pv)
+        
+        pricer.set_seed(11)
+        batched = [r.pv for r in pricer.price_scenarios(scenarios, pricer.build_plan(ts))]
+        
+        assert batched == pytest.approx(sequential, rel=1e-12)
+    
+    def test_threaded_scenarios_match_serial(self, example_worstof_ts: TermSheet) -> None:
+        """Evaluating scenarios on a thread pool must not change any PV."""
+        ts = example_worstof_ts
+        scenarios = [ts, _bump_spot(ts, ts.underlyings[0].id, 0.01), _bump_rate(ts, 0.0001)]
+        
+        pvs = []
+        for num_workers in (1, 3):
+            pricer = AutocallPricer(
+                PricingConfig(num_paths=4_000, seed=5, block_size=2_000, num_workers=num_workers)
+            )
+            pvs.append([r.pv for r in pricer.price_scenarios(scenarios, pricer.build_plan(ts))])
+        
+        assert pvs[1] == pvs[0]
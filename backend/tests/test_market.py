@@ -0,0 +1,465 @@
+"""Tests for market curves and dividend models."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from pricer.core.day_count import DayCountConvention
+from pricer.market.dividends import (
+    ContinuousDividend,
+    DiscreteDividend,
+    DividendModel,
+    MixedDividend,
+)
+from pricer.market import market_data
+from pricer.market._cache import ClosePriceCache
+from pricer.market.market_data import (
+    MarketDataSnapshot,
+    UnderlyingMarketData,
+    _correlation_matrix_from_returns,
+    _correlations_from_returns,
+    _dividend_yield,
+    _log_returns,
+    _vols_from_returns,
+)
+from pricer.market.rates import FlatRateCurve, PiecewiseConstantRateCurve, RateCurve
+from pricer.market.volatility import PiecewiseConstantVol
+
+
+REF = date(2024, 1, 15)
+DATES = [REF + timedelta(days=d) for d in (0, 30, 91, 182, 365, 400, 730)]
+ORDS = np.array([d.toordinal() for d in DATES], dtype=np.int64)
+
+
+class TestGridQueries:
+    """Whole-grid queries must match the per-date methods."""
+    
+    @pytest.mark.parametrize("curve", [
+        FlatRateCurve(rate=0.04),
+        PiecewiseConstantRateCurve(
+            reference_date=REF,
+            tenors=[(date(2024, 6, 1), 0.03), (date(2025, 1, 1), 0.035), (date(2026, 1, 1), 0.04)],
+        ),
+    ])
+    def test_zero_rate_grid(self, curve: RateCurve) -> None:
+        """Test zero rates to every grid date."""
+        expected = [curve.zero_rate(REF, d) for d in DATES]
+        np.testing.assert_allclose(curve.zero_rate_grid(REF, ORDS), expected, rtol=1e-15)
+    
+    def test_scalar_lookups_match_batch(self) -> None:
+        """Test bisect rate/vol lookups against the array lookups, at and between tenors."""
+        tenors = [date(2024, 6, 1), date(2025, 1, 1), date(2026, 1, 1)]
+        curve = PiecewiseConstantRateCurve(reference_date=REF, tenors=list(zip(tenors, [0.03, 0.035, 0.04])))
+        vol = PiecewiseConstantVol(tenors=list(zip(tenors, [0.2, 0.25, 0.3])))
+        days = DATES + tenors + [t - timedelta(days=1) for t in tenors]
+        ords = np.array([d.toordinal() for d in days], dtype=np.int64)
+        assert [curve._get_rate_at(d) for d in days] == curve._rates_at(ords).tolist()
+        assert [vol._get_vol_at(REF, d) for d in days] == vol.get_vols_batch(ords).tolist()
+    
+    @pytest.mark.parametrize("model", [
+        ContinuousDividend(yield_rate=0.02),
+        ContinuousDividend(yield_rate=0.02, day_count=DayCountConvention.THIRTY_360),
+        DiscreteDividend(dividends=[(date(2024, 3, 1), 1.5), (date(2025, 3, 1), 2.0)]),
+    ])
+    def test_adjustment_grid(self, model: DividendModel) -> None:
+        """Test dividend adjustments over consecutive periods."""
+        expected = [
+            model.get_dividend_adjustment(s, e, 100.0) for s, e in zip(DATES[:-1], DATES[1:])
+        ]
+        np.testing.assert_allclose(
+            model.adjustment_grid(ORDS[:-1], ORDS[1:], 100.0), expected, rtol=1e-15
+        )
+
+
+class TestDiscreteSchedule:
+    """Ex-date range lookups on the cached schedule arrays."""
+    
+    def test_ex_date_window_is_half_open(self) -> None:
+        """Test dividends count for reference < ex_date <= target."""
+        model = DiscreteDividend(dividends=[(date(2024, 6, 1), 2.0), (date(2024, 3, 1), 1.0)])
+        assert model.get_dividend_adjustment(date(2024, 3, 1), date(2024, 6, 1), 100.0) == pytest.approx(0.98)
+        assert model.get_dividend_adjustment(date(2024, 2, 29), date(2024, 6, 1), 100.0) == pytest.approx(
+            0.99 * 97.0 / 99.0
+        )
+    
+    def test_per_path_adjustments_match_scalar(self) -> None:
+        """Test the per-path kernel against the scalar adjustment."""
+        model = DiscreteDividend(dividends=[(date(2024, 3, 1), 1.0), (date(2024, 9, 1), 2.0)])
+        spots = np.array([100.0, 50.0, 2.5, -1.0])
+        expected = [model.get_dividend_adjustment(REF, date(2025, 1, 1), s) for s in spots]
+        np.testing.assert_allclose(
+            model.get_dividend_adjustments(REF, date(2025, 1, 1), spots), expected, rtol=1e-12
+        )
+    
+    def test_mixed_vec_matches_scalar(self) -> None:
+        """Test adjustments to many target dates against per-date calls."""
+        model = MixedDividend(
+            continuous_yield=0.02,
+            discrete_dividends=[(date(2024, 3, 1), 1.0), (date(2024, 9, 1), 1.5), (date(2025, 3, 1), 2.0)],
+            discrete_horizon=date(2024, 12, 31),
+        )
+        expected = [model.get_dividend_adjustment(DATES[1], d, 100.0) for d in DATES]
+        np.testing.assert_allclose(
+            model.get_dividend_adjustment_vec(DATES[1], ORDS, 100.0), expected, rtol=1e-12
+        )
+    
+    def test_mixed_discrete_stops_at_horizon(self) -> None:
+        """Test discrete dividends after the horizon are ignored."""
+        model = MixedDividend(
+            discrete_dividends=[(date(2024, 3, 1), 1.0), (date(2024, 9, 1), 1.0)],
+            discrete_horizon=date(2024, 6, 1),
+        )
+        assert model.get_dividend_adjustment(REF, date(2025, 1, 1), 100.0) == pytest.approx(0.99)
+
+
+class TestHistoryStatistics:
+    """Vol and correlation from a bulk close-price matrix."""
+    
+    def setup_method(self) -> None:
+        rng = np.random.default_rng(7)
+        self.tickers = ["AAA", "BBB", "CCC"]
+        self.closes = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, (80, 3)), axis=0))
+    
+    def test_vols_match_per_column_std(self) -> None:
+        """Test vectorized vols against each column's sample std."""
+        returns = _log_returns(self.closes)
+        vols = _vols_from_returns(returns, 30)
+        for k in range(3):
+            expected = np.std(np.diff(np.log(self.closes[-31:, k])), ddof=1) * np.sqrt(252.0)
+            assert vols[k] == pytest.approx(expected)
+    
+    def test_correlations_skip_missing_ticker(self) -> None:
+        """Test pairwise keys and that a ticker without history is dropped."""
+        self.closes[:, 2] = np.nan
+        returns = _log_returns(self.closes)
+        corr = _correlations_from_returns(returns, self.tickers, 60)
+        expected = np.corrcoef(returns[-60:, 0], returns[-60:, 1])[0, 1]
+        assert list(corr) == ["AAA_BBB"]
+        assert corr["AAA_BBB"] == pytest.approx(expected)
+        assert np.isnan(_vols_from_returns(returns, 30)[2])
+    
+    def test_index_ordinals_use_local_dates(self) -> None:
+        """Test vectorized index ordinals keep each timestamp's local calendar date."""
+        pd = pytest.importorskip("pandas")
+        index = pd.to_datetime(["2023-02-10 00:00", "2023-05-12 23:30"]).tz_localize("America/New_York")
+        assert market_data._index_ordinals(index).tolist() == [d.toordinal() for d in index]
+        assert market_data._index_ordinals([REF]).tolist() == [REF.toordinal()]
+    
+    def test_snapshot_correlation_submatrix(self) -> None:
+        """Test dense lookups reorder tickers and zero missing pairs."""
+        self.closes[:, 2] = np.nan
+        matrix = _correlation_matrix_from_returns(_log_returns(self.closes), 60)
+        snapshot = MarketDataSnapshot(
+            as_of_date=REF,
+            correlation_matrix=matrix,
+            ticker_index={t: i for i, t in enumerate(self.tickers)},
+        )
+        sub = snapshot.correlation_submatrix(["CCC", "BBB", "AAA"])
+        assert sub[1, 2] == sub[2, 1] == matrix[0, 1]
+        assert sub[0, 1] == sub[0, 2] == 0.0
+        np.testing.assert_array_equal(np.diag(sub), 1.0)
+
+
+class TestDividendYield:
+    """Dividend yield estimate from Ticker.info."""
+    
+    def test_yield_strategies(self) -> None:
+        """Test rate/spot first, then trailing, then normalized raw yield, capped."""
+        assert _dividend_yield({"dividendRate": 2.0, "dividendYield": 5.0}, 100.0) == pytest.approx(0.02)
+        assert _dividend_yield({"trailingAnnualDividendYield": 0.015}, 100.0) == 0.015
+        assert _dividend_yield({"dividendYield": 3.0}, 100.0) == pytest.approx(0.03)
+        assert _dividend_yield({"dividendRate": 50.0}, 100.0) == 0.10
+        assert _dividend_yield({}, 100.0) == 0.0
+
+
+class TestVolTermStructure:
+    """Array-backed vol term structure on UnderlyingMarketData."""
+    
+    def test_entries_and_interpolation(self) -> None:
+        """Test VolInfo view and linear interpolation between knots."""
+        data = UnderlyingMarketData(
+            ticker="AAA",
+            spot=100.0,
+            vol_dates_ord=np.array([DATES[1].toordinal(), DATES[3].toordinal()]),
+            vol_values=np.array([0.2, 0.3]),
+        )
+        assert [(v.date, v.vol) for v in data.vol_term_structure] == [(DATES[1], 0.2), (DATES[3], 0.3)]
+        mid = DATES[1] + (DATES[3] - DATES[1]) / 2
+        assert data.vol_at(mid) == pytest.approx(0.25, abs=2e-3)
+        assert data.vol_at(REF) == 0.2
+        assert UnderlyingMarketData(ticker="BBB", spot=1.0).vol_at(REF) == 0.25
+    
+    def test_fields_are_coerced(self) -> None:
+        """Test NumPy scalars and lists become floats and typed contiguous arrays."""
+        data = UnderlyingMarketData(
+            ticker="AAA",
+            spot=np.float32(100.0),
+            historical_vol=np.float64(0.2),
+            vol_dates_ord=[DATES[1].toordinal()],
+            vol_values=[0.2],
+        )
+        assert type(data.spot) is float and type(data.historical_vol) is float
+        assert data.vol_dates_ord.dtype == np.int64 and data.vol_values.dtype == np.float64
+        assert data.vol_values.flags.c_contiguous
+    
+    def test_dividend_schedule_arrays(self) -> None:
+        """Test DividendInfo view and the half-open ex-date window."""
+        data = UnderlyingMarketData(
+            ticker="AAA",
+            spot=100.0,
+            dividend_ords=np.array([DATES[1].toordinal(), DATES[2].toordinal()]),
+            dividend_amounts=np.array([1.0, 1.5]),
+        )
+        assert [(d.ex_date, d.amount) for d in data.dividends] == [(DATES[1], 1.0), (DATES[2], 1.5)]
+        ords, amounts = data.dividends_between(DATES[1], DATES[3])
+        assert ords.tolist() == [DATES[2].toordinal()]
+        assert amounts.tolist() == [1.5]
+    
+    def test_schedule_known_and_projected(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test in-range ex-dates are used as-is, else projected quarterly from history."""
+        pd = pytest.importorskip("pandas")
+        history = pd.Series(
+            [0.5, 0.5, 0.6, 0.6],
+            index=pd.to_datetime(["2023-02-10", "2023-05-12", "2023-08-11", "2023-11-10"]),
+        )
+        monkeypatch.setattr(market_data, "_dividend_history", lambda ticker: history)
+        
+        ords, amounts = market_data._fetch_dividend_schedule("AAA", date(2023, 5, 1), date(2023, 9, 1))
+        assert ords.tolist() == [date(2023, 5, 12).toordinal(), date(2023, 8, 11).toordinal()]
+        assert amounts.tolist() == [0.5, 0.6]
+        
+        ords, amounts = market_data._fetch_dividend_schedule("AAA", REF, date(2024, 9, 1))
+        last = date(2023, 11, 10).toordinal()
+        assert ords.tolist() == [last + 91, last + 182, last + 273]
+        assert amounts.tolist() == [0.6] * 3
+
+
+class TestSnapshotCache:
+    """On-disk cache for fetch_market_data_snapshot."""
+    
+    def test_cached_snapshot_is_returned(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a stored snapshot is served without fetching, and expires."""
+        monkeypatch.setattr(market_data, "_SNAPSHOT_CACHE_DIR", tmp_path)
+        args = (["AAA", "BBB"], REF, DATES[-1], 90, 60)
+        path = market_data._snapshot_cache_path(*args)
+        snapshot = MarketDataSnapshot(
+            as_of_date=REF,
+            underlyings={"AAA": UnderlyingMarketData(ticker="AAA", spot=101.0)},
+            risk_free_rate=0.031,
+        )
+        market_data._store_snapshot(path, snapshot)
+        
+        cached = market_data.fetch_market_data_snapshot(["AAA", "BBB"], REF, DATES[-1])
+        assert cached.risk_free_rate == 0.031
+        assert cached.underlyings["AAA"].spot == 101.0
+        assert market_data._snapshot_cache_path(["BBB", "AAA"], REF, DATES[-1], 90, 60) != path
+        
+        monkeypatch.setattr(market_data, "_SNAPSHOT_TTL_SECONDS", -1)
+        assert market_data._load_cached_snapshot(path) is None
+
+    @pytest.mark.parametrize("failure", ["rate", "history", "spot"])
+    def test_degraded_snapshot_is_not_cached(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, failure: str
+    ) -> None:
+        """Test a snapshot patched with fallbacks is returned but not stored."""
+        monkeypatch.setattr(market_data, "_SNAPSHOT_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(market_data, "_check_yfinance", lambda: None)
+        tickers = ["AAA", "BBB"]
+        rng = np.random.default_rng(3)
+        closes = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, (120, 2)), axis=0))
+        
+        def prices_frame(*args: object) -> Tuple[np.ndarray, List[str]]:
+            if failure == "history":
+                raise ConnectionError("reset")
+            return closes, tickers
+        
+        spots = {"AAA": 100.0} if failure == "spot" else {"AAA": 100.0, "BBB": 50.0}
+        monkeypatch.setattr(market_data, "_fetch_treasury_rate", lambda: None if failure == "rate" else 0.04)
+        monkeypatch.setattr(market_data, "_fetch_prices_frame", prices_frame)
+        monkeypatch.setattr(market_data, "fetch_spot_prices", lambda t: spots)
+        monkeypatch.setattr(
+            market_data, "_fetch_dividend_schedule",
+            lambda *args: (np.empty(0, dtype=np.int64), np.empty(0)),
+        )
+        monkeypatch.setattr(market_data, "_fetch_info", lambda ticker: {})
+        
+        snapshot = market_data.fetch_market_data_snapshot(tickers, REF, DATES[-1])
+        
+        assert snapshot.underlyings["AAA"].spot == 100.0
+        assert not list(tmp_path.iterdir())
+
+
+class TestClosePriceCache:
+    """Incremental SQLite cache of daily closes."""
+    
+    def setup_method(self) -> None:
+        self.calls: List[Tuple[Tuple[str, ...], int, int]] = []
+    
+    def fetch(
+        self, tickers: List[str], first_day: int, last_day: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Fake downloader: close = day ordinal + ticker number, weekdays only."""
+        self.calls.append((tuple(tickers), first_day, last_day))
+        days = np.array(
+            [d for d in range(first_day, last_day + 1) if date.fromordinal(d).weekday() < 5],
+            dtype=np.int64,
+        )
+        values = np.array([[d + int(t[-1]) for t in tickers] for d in days], dtype=np.float64)
+        return days, values.reshape(len(days), len(tickers))
+    
+    def test_only_missing_days_are_fetched(self, tmp_path: Path) -> None:
+        """Test a longer window downloads just the extension, and reads merge."""
+        today = REF.toordinal() + 100
+        cache = ClosePriceCache(tmp_path / "closes.sqlite")
+        start = REF.toordinal()
+        
+        days, values = cache.closes(["T1", "T2"], start, start + 20, self.fetch, today)
+        assert self.calls == [(("T1", "T2"), start, start + 20)]
+        np.testing.assert_array_equal(values[:, 1], days + 2)
+        
+        days, values = cache.closes(["T2", "T3"], start, start + 30, self.fetch, today)
+        assert self.calls[1:] == [(("T2",), start + 21, start + 30), (("T3",), start, start + 30)]
+        np.testing.assert_array_equal(values, np.stack([days + 2, days + 3], axis=1))
+        
+        # Served from disk by a fresh instance, and then from memory
+        reopened = ClosePriceCache(tmp_path / "closes.sqlite")
+        for _ in range(2):
+            again, _ = reopened.closes(["T1"], start + 5, start + 15, self.fetch, today)
+        assert len(self.calls) == 3
+        assert again.min() >= start + 5 and again.max() <= start + 15
+    
+    def test_today_is_always_refetched(self, tmp_path: Path) -> None:
+        """Test days from today onwards are not marked as cached."""
+        today = REF.toordinal() + 3  # a Thursday
+        cache = ClosePriceCache(tmp_path / "closes.sqlite")
+        cache.closes(["T1"], REF.toordinal(), today, self.fetch, today)
+        cache.closes(["T1"], REF.toordinal(), today, self.fetch, today)
+        assert self.calls[-1] == (("T1",), today, today)
+    
+    def test_unusable_cache_dir_downloads_directly(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a cache that cannot be opened falls back to one direct download."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setattr(market_data, "_PRICE_CACHE", ClosePriceCache(blocker / "closes.sqlite"))
+        monkeypatch.setattr(market_data, "_download_closes", self.fetch)
+        
+        closes, tickers = market_data._fetch_prices_frame(
+            ["T1"], datetime(2024, 1, 15), datetime(2024, 1, 19)
+        )
+        
+        assert tickers == ["T1"]
+        assert len(self.calls) == 1
+        assert closes.shape == (5, 1)
+    
+    def test_failed_download_is_not_repeated(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a download error inside the cache propagates without a second download."""
+        def broken(
+            tickers: List[str], first_day: int, last_day: int
+        ) -> Tuple[np.ndarray, np.ndarray]:
+            self.calls.append((tuple(tickers), first_day, last_day))
+            raise ConnectionError("reset")
+        
+        cache = ClosePriceCache(tmp_path / "closes.sqlite")
+        monkeypatch.setattr(market_data, "_PRICE_CACHE", cache)
+        monkeypatch.setattr(market_data, "_download_closes", broken)
+        
+        with pytest.raises(ConnectionError):
+            market_data._fetch_prices_frame(
+                ["T1"], datetime(2024, 1, 15), datetime(2024, 1, 19)
+            )
+        assert len(self.calls) == 1
+
+
+class TestRequestCoalescing:
+    """Concurrent identical fetches share one call."""
+    
+    def test_concurrent_calls_share_result(self) -> None:
+        """Test only one of several overlapping identical calls runs."""
+        calls: List[List[str]] = []
+        release = threading.Event()
+        
+        @market_data._coalesce
+        def slow_fetch(tickers: List[str]) -> int:
+            calls.append(tickers)
+            release.wait(5)
+            return len(calls)
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(slow_fetch, ["AAA", "BBB"]) for _ in range(4)]
+            time.sleep(0.2)
+            release.set()
+            results = [f.result() for f in futures]
+        
+        assert results == [1, 1, 1, 1]
+        assert len(calls) == 1
+        assert slow_fetch(["AAA", "BBB"]) == 2
+        assert not market_data._IN_FLIGHT
+
+    def test_waiting_callers_get_private_copies(self) -> None:
+        """Test callers sharing a call do not share the mutable result."""
+        release = threading.Event()
+        
+        @market_data._coalesce
+        def slow_info(ticker: str) -> Dict[str, Any]:
+            release.wait(5)
+            return {"ticker": ticker, "tags": []}
+        
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(slow_info, "AAA") for _ in range(3)]
+            time.sleep(0.2)
+            release.set()
+            results = [f.result() for f in futures]
+        
+        results[0]["tags"].append("edited")
+        assert all(r == {"ticker": "AAA", "tags": []} for r in results[1:])
+        assert len({id(r) for r in results}) == 3
+    
+    def test_list_keyword_arguments_are_keyed(self) -> None:
+        """Test a list passed by keyword is hashed like a positional one."""
+        @market_data._coalesce
+        def fetch(tickers: List[str]) -> int:
+            return len(tickers)
+        
+        assert fetch(tickers=["AAA", "BBB"]) == 2
+        assert not market_data._IN_FLIGHT
+
+
+class TestRetry:
+    """Backoff on transient Yahoo failures."""
+    
+    def test_retry_backs_off_on_transient_errors(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test transient errors are retried with growing delays and others are not."""
+        delays: List[float] = []
+        monkeypatch.setattr(market_data.time, "sleep", delays.append)
+        attempts: List[int] = []
+        
+        @market_data._with_retry
+        def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ConnectionError("reset")
+            return "ok"
+        
+        assert flaky() == "ok"
+        assert len(attempts) == 3
+        assert len(delays) == 2 and delays[1] > delays[0] > 0
+        
+        @market_data._with_retry
+        def broken() -> str:
+            attempts.append(1)
+            raise ValueError("bad ticker")
+        
+        attempts.clear()
+        with pytest.raises(ValueError):
+            broken()
+        assert len(attempts) == 1
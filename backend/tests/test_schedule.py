@@ -0,0 +1,86 @@
+"""Tests for schedule generation."""
+
+from datetime import date, timedelta
+
+from pricer.core.calendar import BusinessDayConvention
+from pricer.core.schedule import Frequency, generate_schedule
+
+
+class TestMonthlySchedule:
+    """Month-based schedule rolls."""
+
+    def test_end_of_month_clamping(self) -> None:
+        """Test that rolling from the 31st clamps to each month's last day."""
+        schedule = generate_schedule(
+            date(2024, 1, 31),
+            date(2024, 6, 30),
+            Frequency.MONTHLY,
+            convention=BusinessDayConvention.UNADJUSTED,
+        )
+        assert schedule.unadjusted_dates == [
+            date(2024, 2, 29),
+            date(2024, 3, 31),
+            date(2024, 4, 30),
+            date(2024, 5, 31),
+            date(2024, 6, 30),
+        ]
+
+    def test_stub_at_start_rolls_back_from_end(self) -> None:
+        """Test that a short first period appears when rolling backwards."""
+        schedule = generate_schedule(
+            date(2024, 2, 10),
+            date(2025, 1, 15),
+            Frequency.QUARTERLY,
+            convention=BusinessDayConvention.UNADJUSTED,
+            stub_at_end=False,
+        )
+        assert schedule.unadjusted_dates == [
+            date(2024, 4, 15),
+            date(2024, 7, 15),
+            date(2024, 10, 15),
+            date(2025, 1, 15),
+        ]
+
+    def test_adjusted_dates_roll_to_business_days(self) -> None:
+        """Test modified following keeps month-end dates in their month."""
+        schedule = generate_schedule(
+            date(2024, 2, 29),
+            date(2024, 8, 31),
+            Frequency.QUARTERLY,
+        )
+        # 2024-08-31 is a Saturday: following would roll into September
+        assert schedule.adjusted_dates == [date(2024, 5, 29), date(2024, 8, 29), date(2024, 8, 30)]
+
+    def test_to_arrays(self) -> None:
+        """Test the ordinal array view matches the ScheduleDate rows."""
+        schedule = generate_schedule(date(2024, 1, 15), date(2025, 1, 15), Frequency.QUARTERLY)
+        unadj, adj, start, end = schedule.to_arrays()
+        assert unadj.tolist() == [d.toordinal() for d in schedule.unadjusted_dates]
+        assert adj.tolist() == [d.toordinal() for d in schedule.adjusted_dates]
+        assert start.tolist() == [d.period_start.toordinal() for d in schedule]
+        assert end.tolist() == adj.tolist()
+
+    def test_long_backward_roll(self) -> None:
+        """Test a 30-year backward monthly roll from a month end stays on month ends."""
+        schedule = generate_schedule(
+            date(1995, 3, 10),
+            date(2025, 3, 31),
+            Frequency.MONTHLY,
+            convention=BusinessDayConvention.UNADJUSTED,
+            stub_at_end=False,
+        )
+        dates = schedule.unadjusted_dates
+        assert len(dates) == 361
+        assert dates[0] == date(1995, 3, 31)
+        assert all((d + timedelta(days=1)).day == 1 for d in dates)
+
+    def test_february_clamping_across_century_leap_rules(self) -> None:
+        """Test Feb month ends for ordinary, divisible-by-100 and by-400 years."""
+        for year, feb_end in ((2023, 28), (2024, 29), (2100, 28), (2000, 29)):
+            schedule = generate_schedule(
+                date(year - 1, 8, 31),
+                date(year, 3, 1),
+                Frequency.SEMI_ANNUAL,
+                convention=BusinessDayConvention.UNADJUSTED,
+            )
+            assert schedule.unadjusted_dates[0] == date(year, 2, feb_end)
@@ -4,6 +4,7 @@ import pytest
 from datetime import date
 import json
 from pathlib import Path
+from typing import List, Optional
 
 from pricer.products.schema import (
     TermSheet,
@@ -41,6 +42,23 @@ class TestDividendModel:
         """Discrete model requires discrete_dividends."""
         with pytest.raises(ValueError, match="discrete_dividends required"):
             DividendModel(type=DividendModelType.DISCRETE)
+    
+    def test_discrete_arrays(self) -> None:
+        """Ex-date ordinals and amounts are parallel arrays."""
+        model = DividendModel(
+            type=DividendModelType.DISCRETE,
+            discrete_dividends=[
+                {"ex_date": "2024-03-15", "amount": 1.5},
+                {"ex_date": "2024-09-15", "amount": 2.0},
+            ],
+        )
+        assert model.ex_date_ords.tolist() == [
+            date(2024, 3, 15).toordinal(), date(2024, 9, 15).toordinal()
+        ]
+        assert model.amounts.tolist() == [1.5, 2.0]
+        
+        continuous = DividendModel(type=DividendModelType.CONTINUOUS, continuous_yield=0.02)
+        assert continuous.ex_date_ords.size == 0
 
 
 class TestVolModel:
@@ -57,41 +75,37 @@ class TestVolModel:
         assert model.flat_vol == 0.25
 
 
+# Observation and payment dates of the schedule validation cases
+OBS_1, OBS_2 = date(2024, 7, 15), date(2025, 1, 15)
+PAY_1, PAY_2 = date(2024, 7, 17), date(2025, 1, 17)
+
+
 class TestSchedules:
     """Tests for schedule alignment validation."""
     
-    def test_aligned_schedules(self) -> None:
-        """Valid aligned schedules."""
-        schedules = Schedules(
-            observation_dates=[date(2024, 7, 15), date(2025, 1, 15)],
-            payment_dates=[date(2024, 7, 17), date(2025, 1, 17)],
-            autocall_levels=[1.0, 1.0],
-            coupon_barriers=[0.7, 0.7],
-            coupon_rates=[0.02, 0.02]
-        )
-        assert len(schedules.observation_dates) == 2
-    
-    def test_misaligned_payment_dates(self) -> None:
-        """Misaligned payment_dates raises error."""
-        with pytest.raises(ValueError, match="payment_dates length"):
-            Schedules(
-                observation_dates=[date(2024, 7, 15), date(2025, 1, 15)],
-                payment_dates=[date(2024, 7, 17)],  # Only 1
-                autocall_levels=[1.0, 1.0],
-                coupon_barriers=[0.7, 0.7],
-                coupon_rates=[0.02, 0.02]
-            )
-    
-    def test_observation_dates_must_increase(self) -> None:
-        """Observation dates must be strictly increasing."""
-        with pytest.raises(ValueError, match="strictly increasing"):
-            Schedules(
-                observation_dates=[date(2025, 1, 15), date(2024, 7, 15)],  # Reversed
-                payment_dates=[date(2025, 1, 17), date(2024, 7, 17)],
+    @pytest.mark.parametrize("observation_dates, payment_dates, error", [
+        ([OBS_1, OBS_2], [PAY_1, PAY_2], None),                      # Aligned
+        ([OBS_1, OBS_2], [PAY_1], "payment_dates length"),           # Only 1 payment
+        ([OBS_2, OBS_1], [PAY_2, PAY_1], "strictly increasing"),     # Reversed
+    ], ids=["aligned", "misaligned_payment_dates", "observation_dates_decrease"])
+    def test_schedule_validation(
+        self, observation_dates: List[date], payment_dates: List[date], error: Optional[str]
+    ) -> None:
+        """Aligned, increasing schedules validate; anything else raises."""
+        def build() -> Schedules:
+            return Schedules(
+                observation_dates=observation_dates,
+                payment_dates=payment_dates,
                 autocall_levels=[1.0, 1.0],
                 coupon_barriers=[0.7, 0.7],
                 coupon_rates=[0.02, 0.02]
             )
+        
+        if error is None:
+            assert len(build().observation_dates) == 2
+        else:
+            with pytest.raises(ValueError, match=error):
+                build()
 
 
 class TestKnockInBarrier:
@@ -103,12 +117,11 @@ class TestKnockInBarrier:
         assert barrier.level == 0.6
         assert barrier.monitoring == BarrierMonitoringType.CONTINUOUS
     
-    def test_barrier_out_of_range(self) -> None:
+    @pytest.mark.parametrize("level", [2.0, 0])
+    def test_barrier_out_of_range(self, level: float) -> None:
         """Barrier level out of range."""
         with pytest.raises(ValueError):
-            KnockInBarrier(level=2.0)
-        with pytest.raises(ValueError):
-            KnockInBarrier(level=0)
+            KnockInBarrier(level=level)
 
 
 class TestTermSheetLoad:
@@ -132,3 +145,17 @@ class TestTermSheetLoad:
         """Missing file raises error."""
         with pytest.raises(FileNotFoundError):
             load_term_sheet("nonexistent.json")
+    
+    def test_loaded_term_sheets_are_independent(self, tmp_path: Path, term_sheet_json: str) -> None:
+        """Mutating one loaded term sheet must not leak into later loads."""
+        path = tmp_path / "term_sheet.json"
+        path.write_text(term_sheet_json)
+        
+        first = load_term_sheet(path)
+        first.payoff.coupon_memory = not first.payoff.coupon_memory
+        first.underlyings[0].spot = 1.0
+        second = load_term_sheet(path)
+        
+        assert second is not first
+        assert second.payoff.coupon_memory != first.payoff.coupon_memory
+        assert second.underlyings[0].spot != 1.0